@@ -15,6 +15,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 from datetime import timedelta
 
+from django.core.exceptions import ImproperlyConfigured
+
 load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -60,6 +62,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     # 'django.middleware.csrf.CsrfViewMiddleware',  # CSRF 미들웨어 비활성화
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.db_router.ReplicaPinningMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -96,9 +99,91 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),
         'HOST': os.getenv('POSTGRES_HOST', 'db'),
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        # 연결 재사용 시간 (초). ASGI(uvicorn)에서는 sync_to_async 스레드마다
+        # 연결이 따로 생기고 정리되지 않으므로 기본값 0 (재사용은 DB_POOL 사용)
+        # WSGI로 실행할 때는 DB_CONN_MAX_AGE=60 등으로 지속 연결 사용 가능
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 0)),
+        # 재사용 전에 연결이 살아 있는지 확인 (DB 재시작 후 첫 요청 오류 방지)
+        'CONN_HEALTH_CHECKS': bool(int(os.getenv('DB_CONN_HEALTH_CHECKS', 1))),
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', 5)),
+        },
     }
 }
 
+# 읽기 전용 replica (예: POSTGRES_REPLICA_HOSTS=replica1:5432,replica2)
+# 서비스의 읽기 queryset만 replica로 보내고, 쓰기한 클라이언트는
+# REPLICA_PIN_SECONDS(복제 지연 허용 시간) 동안 primary에서 읽음
+DATABASE_REPLICAS = []
+for index, address in enumerate(
+    filter(None, os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',')), start=1
+):
+    host, _, port = address.strip().partition(':')
+    alias = f'replica{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', 5))
+
+# 연결 풀 (psycopg 3 + psycopg_pool 필요: poetry install -E pool)
+# Docker 이미지(uvicorn)는 DB_POOL=1로 실행
+# 풀을 사용하면 Django의 지속 연결(CONN_MAX_AGE)은 사용할 수 없으므로 0으로 설정
+if bool(int(os.getenv('DB_POOL', 0))):
+    for database in DATABASES.values():
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),  # 연결 대기 시간 (초)
+        }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# locmem은 프로세스마다 따로 동작하므로 여러 워커를 띄울 때는 redis/file 사용
+
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+
+if CACHE_BACKEND == 'redis':
+    # Redis 프로토콜을 지원하는 서버면 어떤 것이든 사용 가능 (redis 패키지 필요)
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+        }
+    }
+elif CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# 응답 캐시 무효화(세대 번호)는 캐시를 통해 다른 워커에 전달되므로,
+# 워커를 여러 개 띄우면(WEB_CONCURRENCY > 1) 공유 캐시가 필요함
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+if CACHE_BACKEND == 'locmem' and WEB_CONCURRENCY > 1:
+    raise ImproperlyConfigured(
+        'WEB_CONCURRENCY가 1보다 크면 공유 캐시(CACHE_BACKEND=redis 또는 file)가 필요합니다.'
+    )
+
+# 읽기 API 응답 캐시 유지 시간 (초, 무효화는 쓰기 시점에 즉시 처리)
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', 300))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -145,11 +230,17 @@ AUTH_USER_MODEL = 'users.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # 토큰의 사용자를 메모리 캐시에서 찾는 JWTAuthentication
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ),
+    # orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 인코딩
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 # JWT 설정
@@ -160,8 +251,26 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # 회전한 refresh token은 users.token_blacklist.RevocationStore에 폐기
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.RevocableTokenRefreshSerializer',
 }
 
+# refresh token 폐기 저장소 (만료 구간별 Bloom filter)
+TOKEN_BLACKLIST_PARTITION_SECONDS = int(
+    os.getenv('TOKEN_BLACKLIST_PARTITION_SECONDS', 86400)
+)
+TOKEN_BLACKLIST_BLOOM_CAPACITY = int(
+    os.getenv('TOKEN_BLACKLIST_BLOOM_CAPACITY', 100000)
+)
+# 다른 프로세스의 폐기분을 반영하는 주기 (초)
+TOKEN_BLACKLIST_SYNC_INTERVAL = float(
+    os.getenv('TOKEN_BLACKLIST_SYNC_INTERVAL', 2)
+)
+
+# JWT 인증 시 사용자 레코드를 프로세스 메모리에 보관하는 시간 (초, 0이면 매번 조회)
+# 프로필/비밀번호 변경 시 해당 프로세스의 캐시는 즉시 무효화됩니다.
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', 30))
+
 # 미디어 파일 설정
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -181,3 +290,26 @@ CORS_ALLOWED_ORIGINS = [
 # 이미지 업로드 설정
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/gif']
+# 이미지 처리 방식: local(프로세스 풀) | queue(process_images 워커) | sync
+IMAGE_PROCESSING_BACKEND = os.getenv('IMAGE_PROCESSING_BACKEND', 'local')
+IMAGE_PROCESSING_WORKERS = int(os.getenv('IMAGE_PROCESSING_WORKERS', 2))
+# 이 시간(초)이 지나도 processing인 이미지는 워커가 중단된 것으로 보고 다시 처리
+IMAGE_PROCESSING_TIMEOUT = int(os.getenv('IMAGE_PROCESSING_TIMEOUT', 600))
+# queue는 별도 process_images 워커가 응답 캐시를 무효화하므로 공유 캐시가 필요함
+if CACHE_BACKEND == 'locmem' and IMAGE_PROCESSING_BACKEND == 'queue':
+    raise ImproperlyConfigured(
+        'IMAGE_PROCESSING_BACKEND=queue에는 공유 캐시(CACHE_BACKEND=redis 또는 file)가 필요합니다.'
+    )
+
+# 관리자 일괄 삭제: 대상이 이 수를 넘으면 백그라운드 작업으로 실행
+MODERATION_SYNC_LIMIT = int(os.getenv('MODERATION_SYNC_LIMIT', 1000))
+# 백그라운드 작업 실행 방식: local(스레드) | sync
+MODERATION_BACKEND = os.getenv('MODERATION_BACKEND', 'local')
+# 실행 중인 작업이 이 시간(초) 동안 진행이 없으면 중단된 것으로 보고 failed 처리
+MODERATION_JOB_TIMEOUT = int(os.getenv('MODERATION_JOB_TIMEOUT', 300))
+
+# 조회수 집계 설정 (메모리에 모았다가 일괄 반영)
+# 주기 반영은 웹 서버 프로세스의 백그라운드 스레드가, 임계값 도달 시 반영은 그 조회 요청이 처리
+VIEW_COUNT_FLUSH_INTERVAL = int(os.getenv('VIEW_COUNT_FLUSH_INTERVAL', 10))  # 초
+VIEW_COUNT_FLUSH_THRESHOLD = int(os.getenv('VIEW_COUNT_FLUSH_THRESHOLD', 100))
+VIEW_COUNT_DEDUP_WINDOW = int(os.getenv('VIEW_COUNT_DEDUP_WINDOW', 0))  # 초, 0이면 비활성화
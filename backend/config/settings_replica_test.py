@@ -0,0 +1,26 @@
+"""replica 라우팅 테스트용 설정
+
+primary(default)와 replica1을 서로 다른 실제 데이터베이스로 둡니다.
+TEST MIRROR 없이 테스트 DB를 따로 만들어, 어느 DB에서 읽었는지를
+각 DB에 넣은 데이터로 확인합니다. (ReplicaDatabaseTests)
+
+DATABASE_REPLICAS는 비워 두어 테스트 DB를 만들 때 replica에도
+마이그레이션을 적용하고, 테스트 클래스에서 override_settings로 켭니다.
+
+Usage:
+    python -m pytest --ds=config.settings_replica_test posts/tests.py
+"""
+import os
+
+from config.settings import *  # noqa: F401,F403
+from config.settings import DATABASES
+
+
+DATABASES['replica1'] = {
+    **DATABASES['default'],
+    'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+    'NAME': os.getenv(
+        'POSTGRES_REPLICA_DB', f"{DATABASES['default']['NAME']}_replica"
+    ),
+}
+DATABASE_REPLICAS = []
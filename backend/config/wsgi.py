@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# 조회수는 요청이 없어도 VIEW_COUNT_FLUSH_INTERVAL마다 반영 (앱 로딩 이후 import)
+from posts.view_counter import view_counter  # noqa: E402
+
+view_counter.start()
@@ -0,0 +1,46 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """async 핸들러를 지원하는 APIView
+
+    DRF APIView는 동기 dispatch만 지원하므로, ASGI 서버에서 `async def get`
+    같은 핸들러를 이벤트 루프에서 실행할 수 있도록 dispatch를 async로 바꿉니다.
+    - 인증/권한/스로틀(initial)은 DB를 조회할 수 있으므로 스레드에서 실행
+    - async 핸들러는 await, 동기 핸들러(post/put 등)는 sync_to_async로 실행
+      하므로 한 View에 둘을 섞어 쓸 수 있습니다.
+    WSGI(runserver, 테스트 클라이언트)에서는 Django가 async_to_sync로 감싸 실행합니다.
+    """
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(
+                    request, *args, **kwargs
+                )
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(
+            request, response, *args, **kwargs
+        )
+        return self.response
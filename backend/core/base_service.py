@@ -1,6 +1,12 @@
-from typing import TypeVar, Generic
+from functools import lru_cache
+from typing import TypeVar, Generic, Optional, Sequence
 
-from django.db.models import Model, QuerySet
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework import serializers
+
+from core.db_router import REPLICA_HINT
+from core.pagination import CursorPage, decode_cursor, encode_cursor
 
 
 T = TypeVar('T', bound=Model)
@@ -8,10 +14,29 @@ T = TypeVar('T', bound=Model)
 
 class BaseService(Generic[T]):
     model: T
+    # 키셋 페이지네이션 정렬 키 (모두 내림차순, 마지막 필드는 유일해야 함)
+    cursor_fields = ('created_at', 'id')
+    page_size = 10
+    max_page_size = 100
 
     def get_queryset(self) -> QuerySet[T]:
-        return self.model.objects.all()
+        """서비스의 기본 queryset
+
+        읽기는 replica로 보낼 수 있도록 힌트를 붙입니다. (core.db_router 참고)
+        같은 queryset으로 update/delete 하더라도 쓰기는 항상 primary로 갑니다.
+        """
+        return self.model.objects.db_manager(
+            hints={REPLICA_HINT: True}
+        ).all()
     
+    def get_primary_queryset(self) -> QuerySet[T]:
+        """primary에서 읽는 queryset
+
+        쓰기 직전의 존재/권한 확인처럼 복제 지연을 허용할 수 없는 읽기에 사용합니다.
+        (방금 만든 게시글이 replica에 아직 없어 404가 나는 일을 막음)
+        """
+        return self.model.objects.all()
+
     def get(self, **kwargs) -> T | None:
         return self.get_queryset().filter(**kwargs).first()
     
@@ -28,4 +53,183 @@ class BaseService(Generic[T]):
         return instance
     
     def delete(self, instance: T) -> None:
-        instance.delete() 
\ No newline at end of file
+        instance.delete()
+
+    def shape_queryset(
+        self,
+        queryset: QuerySet[T],
+        serializer_class: type[serializers.ModelSerializer],
+        fields: Optional[tuple] = None
+    ) -> QuerySet[T]:
+        """serializer가 선언한 관계와 컬럼에 맞게 queryset을 조정합니다.
+
+        serializer의 Meta에 선언된 select_related / prefetch_related를 적용하고,
+        모든 필드가 실제 컬럼에 대응하면 only()로 필요한 컬럼만 조회합니다.
+        덕분에 목록 직렬화 시 행마다 관계 객체를 따로 조회(N+1)하지 않습니다.
+
+        Args:
+            fields: 일부 필드만 직렬화하는 경우 그 필드 이름
+                (serializer가 fields 인자를 지원해야 함)
+        """
+        meta = serializer_class.Meta
+        select_related = getattr(meta, 'select_related', ())
+        prefetch_related = getattr(meta, 'prefetch_related', ())
+        if fields is not None:
+            select_related = [
+                name for name in select_related
+                if name.split('__')[0] in fields
+            ]
+            prefetch_related = [
+                name for name in prefetch_related
+                if name.split('__')[0] in fields
+            ]
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        columns = serializer_columns(
+            serializer_class, tuple(select_related), fields=fields
+        )
+        if columns:
+            queryset = queryset.only(*columns)
+        return queryset
+
+    def paginate(
+        self,
+        queryset: QuerySet[T],
+        cursor: Optional[str] = None,
+        size: Optional[int] = None,
+        cursor_fields: Optional[Sequence[str]] = None,
+        descending: bool = True
+    ) -> CursorPage[T]:
+        """키셋(커서) 방식으로 queryset의 한 페이지를 조회합니다.
+
+        OFFSET 대신 마지막으로 본 행의 정렬 키 이후만 조회하므로
+        몇 번째 페이지든 인덱스 범위 탐색 한 번으로 끝납니다.
+
+        Args:
+            queryset: 페이지를 나눌 queryset
+            cursor: 이전 페이지 응답의 next_cursor (첫 페이지면 None)
+            size: 페이지 크기 (1 ~ max_page_size)
+            cursor_fields: 정렬 키 (기본값: cursor_fields, 마지막 필드는 유일해야 함)
+            descending: 내림차순 여부 (False면 오름차순)
+
+        Raises:
+            ValidationError: 커서 형식이 올바르지 않은 경우
+        """
+        queryset, size, cursor_fields = self._page_query(
+            queryset, cursor, size, cursor_fields, descending
+        )
+        return self._make_page(list(queryset), size, cursor_fields)
+
+    async def apaginate(
+        self,
+        queryset: QuerySet[T],
+        cursor: Optional[str] = None,
+        size: Optional[int] = None,
+        cursor_fields: Optional[Sequence[str]] = None,
+        descending: bool = True
+    ) -> CursorPage[T]:
+        """paginate의 async 버전 (async ORM으로 조회)"""
+        queryset, size, cursor_fields = self._page_query(
+            queryset, cursor, size, cursor_fields, descending
+        )
+        items = [item async for item in queryset]
+        return self._make_page(items, size, cursor_fields)
+
+    def _page_query(self, queryset, cursor, size, cursor_fields, descending):
+        """한 페이지(+1행)를 조회할 queryset과 정리된 size, cursor_fields"""
+        size = min(max(size or self.page_size, 1), self.max_page_size)
+        cursor_fields = tuple(cursor_fields or self.cursor_fields)
+        direction = '-' if descending else ''
+        queryset = queryset.order_by(
+            *[f'{direction}{name}' for name in cursor_fields]
+        )
+
+        if cursor:
+            values = decode_cursor(cursor, len(cursor_fields))
+            try:
+                queryset = queryset.filter(
+                    self._cursor_filter(cursor_fields, values, descending)
+                )
+            except (ValidationError, ValueError, TypeError):
+                raise ValidationError({"cursor": "유효하지 않은 커서입니다."})
+        return queryset[:size + 1], size, cursor_fields
+
+    def _make_page(self, items, size, cursor_fields) -> CursorPage[T]:
+        next_cursor = None
+        if len(items) > size:
+            items = items[:size]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, name) for name in cursor_fields]
+            )
+        return CursorPage(items=items, next_cursor=next_cursor)
+
+    def _cursor_filter(self, cursor_fields, values, descending=True) -> Q:
+        """(a, b, ...) < (va, vb, ...) 형태의 키셋 조건을 만듭니다.
+
+        오름차순이면 > 조건을 사용합니다.
+        """
+        lookup = 'lt' if descending else 'gt'
+        condition = Q()
+        for index, name in enumerate(cursor_fields):
+            equals = {
+                prev: values[i]
+                for i, prev in enumerate(cursor_fields[:index])
+            }
+            condition |= Q(**equals, **{f'{name}__{lookup}': values[index]})
+        return condition
+
+
+@lru_cache(maxsize=None)
+def serializer_columns(
+    serializer_class: type[serializers.ModelSerializer],
+    select_related: tuple = (),
+    prefix: str = '',
+    fields: Optional[tuple] = None
+) -> tuple | None:
+    """serializer가 읽는 컬럼 목록을 only()에 넘길 형태로 계산합니다.
+
+    select_related로 함께 조회되는 중첩 serializer는 '<관계>__<컬럼>' 형태로
+    포함합니다. 실제 컬럼에 대응하지 않는 필드(property, SerializerMethodField 등)가
+    있으면 필요한 컬럼을 알 수 없으므로 None을 반환합니다.
+    source 외에 다른 컬럼도 읽는 필드는 extra_sources에 그 컬럼을 선언합니다.
+    """
+    model = serializer_class.Meta.model
+    columns = [f'{prefix}{model._meta.pk.name}']
+    serializer = (
+        serializer_class() if fields is None
+        else serializer_class(fields=fields)
+    )
+
+    for field in serializer.fields.values():
+        if getattr(field, 'write_only', False):
+            continue
+        if field.source == '*':
+            return None
+
+        source = field.source.split('.')[0]
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+
+        if isinstance(field, serializers.ModelSerializer):
+            if source not in select_related:
+                return None
+            nested = serializer_columns(type(field), prefix=f'{prefix}{source}__')
+            if nested is None:
+                return None
+            columns += nested
+        elif model_field.concrete and not model_field.many_to_many:
+            columns.append(f'{prefix}{model_field.name}')
+        else:
+            return None
+        columns += [
+            f'{prefix}{name}' for name in getattr(field, 'extra_sources', ())
+        ]
+
+    return tuple(dict.fromkeys(columns))
@@ -0,0 +1,44 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """고정 크기 비트 배열로 집합 포함 여부를 판단하는 Bloom filter
+
+    False면 확실히 없는 값이고, True면 있을 수 있는 값입니다.
+    (오탐률은 capacity개를 넣었을 때 error_rate)
+    값을 지울 수 없으므로 만료가 필요하면 필터 단위로 교체합니다.
+
+    Usage:
+        bloom = BloomFilter(capacity=100_000)
+        bloom.add('jti')
+        'jti' in bloom  # True
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(
+            int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str):
+        """이중 해싱으로 hash_count개의 비트 위치를 만듭니다."""
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
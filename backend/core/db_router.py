@@ -0,0 +1,138 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+# BaseService.get_queryset이 읽기 queryset에 붙이는 힌트
+REPLICA_HINT = 'replica'
+
+
+@dataclass
+class ReplicaState:
+    """요청 하나의 라우팅 상태
+
+    pinned: True면 이 요청의 읽기는 모두 primary로 보냄
+        (요청 중에 쓰기를 했거나, 최근 쓰기로 pin 쿠키가 있는 경우)
+    wrote: 이 요청에서 쓰기를 했는지 (응답에 pin 쿠키를 설정)
+    """
+    pinned: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[Optional[ReplicaState]] = ContextVar(
+    'replica_state', default=None
+)
+
+
+@contextmanager
+def background_writes():
+    """요청이 대신 실행하는 백그라운드 쓰기 구간
+
+    조회수 일괄 반영, 그에 따른 랭킹 갱신처럼 요청 내용과 무관한 쓰기는
+    primary로 보내되, 요청한 클라이언트를 primary에 고정(pin 쿠키)하지 않습니다.
+    """
+    token = _state.set(None)
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+def replica_aliases() -> list:
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+class PrimaryReplicaRouter:
+    """읽기 전용 서비스 queryset은 replica로, 그 외는 primary로 보내는 DB 라우터
+
+    - BaseService.get_queryset에서 시작한 queryset(replica 힌트)의 읽기만
+      DATABASE_REPLICAS 중 하나로 보냅니다. 모델 직접 조회, 인증 등은 primary.
+    - 쓰기(save, update, delete, get_or_create 등)는 항상 primary로 보내며,
+      같은 요청의 이후 읽기도 primary로 고정합니다. (read-your-writes)
+    - primary에서 트랜잭션 중이면 읽기도 primary에서 실행합니다.
+    - 쓰기를 한 클라이언트는 ReplicaPinningMiddleware가 설정한 쿠키로
+      REPLICA_PIN_SECONDS 동안 다음 요청도 primary에서 읽습니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if not replicas or not hints.get(REPLICA_HINT):
+            return DEFAULT_DB_ALIAS
+        state = _state.get()
+        if state is not None and state.pinned:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.pinned = state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica는 primary의 복제본이므로 어느 DB에서 읽은 객체든 관계를 허용
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_aliases():
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """요청별 라우팅 상태를 관리하고 쓰기 후 primary 고정 쿠키를 설정하는 Middleware
+
+    WSGI/ASGI 모두 지원합니다. (ASGI에서는 스레드 전환 없이 실행)
+    """
+    cookie_name = 'db_pin'
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = ReplicaState(pinned=self.cookie_name in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin(state, response)
+
+    async def __acall__(self, request):
+        state = ReplicaState(pinned=self.cookie_name in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin(state, response)
+
+    def _pin(self, state, response):
+        """이 요청에서 쓰기를 했다면 다음 요청도 primary에서 읽도록 쿠키 설정"""
+        if state.wrote and replica_aliases():
+            response.set_cookie(
+                self.cookie_name,
+                '1',
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
@@ -0,0 +1,49 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model
+
+
+T = TypeVar('T', bound=Model)
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """키셋 페이지네이션 결과
+
+    items: 현재 페이지의 객체 목록
+    next_cursor: 다음 페이지를 조회할 때 사용할 불투명 커서 (마지막 페이지면 None)
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록을 URL에 안전한 불투명 문자열로 인코딩합니다."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """encode_cursor로 만든 커서를 정렬 키 값 목록으로 되돌립니다.
+
+    Raises:
+        ValidationError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValidationError({"cursor": "유효하지 않은 커서입니다."})
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError({"cursor": "유효하지 않은 커서입니다."})
+    return values
@@ -0,0 +1,15 @@
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """NDJSON(줄마다 JSON 객체 하나) 요청 본문을 줄 단위로 읽는 Parser
+
+    본문 전체를 메모리에 올리지 않도록 request.data로 줄(bytes)을 하나씩
+    내주는 iterator를 반환합니다. 각 줄의 JSON 해석은 사용하는 쪽에서 합니다.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return iter(())
+        return iter(stream.readline, b'')
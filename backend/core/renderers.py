@@ -0,0 +1,58 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 렌더링
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson으로 응답을 인코딩하는 JSONRenderer
+
+    orjson이 설치되어 있으면 C 구현으로 인코딩하고, 없으면 DRF 기본
+    JSONRenderer(표준 json)와 똑같이 동작합니다. 출력은 아래를 제외하면
+    기본 렌더러와 같습니다.
+    - float 표기: 지수 형식이 다름 (1e16 / 1e+16, 1e-7 / 1e-07)
+    - NaN/Infinity: 기본 렌더러는 ValueError(STRICT_JSON), orjson은 null
+    - 64비트를 넘는 정수는 orjson이 인코딩하지 못하므로 기본 렌더러 사용
+
+    그 밖의 형식은 기본 렌더러와 맞춥니다.
+    - 한글 등 비 ASCII 문자는 이스케이프하지 않은 UTF-8 (UNICODE_JSON)
+    - 공백 없는 compact 형식 (COMPACT_JSON)
+    - U+2028/U+2029는 JavaScript 호환을 위해 이스케이프
+    - orjson이 모르는 타입(datetime, Decimal, 지연 번역 문자열 등)은
+      DRF JSONEncoder로 변환
+    - 들여쓰기를 요청하면(Accept: application/json; indent=4) 기본 렌더러 사용
+    """
+    options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # 기본 렌더러와 마찬가지로 JavaScript에서 줄바꿈으로 해석되는 문자 이스케이프
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028')
+            ret = ret.replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+_encoder = encoders.JSONEncoder()
+
+
+def _default(obj):
+    return _encoder.default(obj)
@@ -0,0 +1,176 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Manager
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+# 값을 그대로 변환할 수 있는 필드 (정확히 이 클래스일 때만, 하위 클래스는 제외)
+_CONVERTERS = {
+    drf_fields.CharField: str,
+    drf_fields.EmailField: str,
+    drf_fields.IntegerField: int,
+    drf_fields.BooleanField: bool,
+    drf_fields.ReadOnlyField: None,
+    relations.PrimaryKeyRelatedField: None,
+}
+# context를 쓰지 않는 to_representation을 그대로 호출하는 필드
+_PURE_FIELDS = tuple(
+    field_class for field_class in (
+        drf_fields.DateTimeField,
+        drf_fields.DateField,
+        drf_fields.ChoiceField,
+        # DRF 3.16+ (BigAutoField 기본키)
+        getattr(drf_fields, 'BigIntegerField', None),
+    )
+    if field_class is not None
+)
+# request(context)로 URL을 만드는 필드
+_BOUND_FIELDS = (
+    drf_fields.FileField,
+    drf_fields.ImageField,
+)
+
+VALUE, BOUND, NESTED, FIELD = 'value', 'bound', 'nested', 'field'
+
+
+class CompiledSerializer:
+    """읽기 전용 ModelSerializer를 미리 분석해 dict를 바로 만드는 직렬화기
+
+    DRF serializer는 행마다 필드별 get_attribute/to_representation을 거치는데,
+    컬럼에 대응하는 기본 필드는 attrgetter와 변환 함수로 미리 풀어 두고
+    (중첩 ModelSerializer는 재귀적으로 컴파일) 나머지 커스텀 필드만
+    DRF 필드에 맡깁니다. 결과는 serializer.data와 같습니다.
+
+    Usage:
+        compile_serializer(PostFeedSerializer).serialize(posts, context)
+    """
+
+    def __init__(
+        self,
+        serializer_class: type[serializers.ModelSerializer],
+        fields: Optional[tuple] = None
+    ):
+        self.serializer_class = serializer_class
+        self.fields = fields
+        model = serializer_class.Meta.model
+        template = self.instantiate()
+        self.plan = [
+            self._compile(model, name, field)
+            for name, field in template.fields.items()
+            if not field.write_only
+        ]
+
+    def instantiate(self, **kwargs):
+        if self.fields is not None:
+            kwargs['fields'] = self.fields
+        return self.serializer_class(**kwargs)
+
+    def _compile(self, model, name, field) -> tuple:
+        """필드 하나를 (이름, 종류, getter, 변환) 단계로 만듭니다."""
+        getter = _column_getter(model, field)
+        if getter is None:
+            return name, FIELD, None, None
+
+        field_type = type(field)
+        if field_type in _CONVERTERS:
+            return name, VALUE, getter, _CONVERTERS[field_type]
+        if field_type in _PURE_FIELDS:
+            return name, VALUE, getter, field.to_representation
+        if field_type in _BOUND_FIELDS:
+            return name, BOUND, getter, None
+        if isinstance(field, serializers.ModelSerializer):
+            return name, NESTED, getter, compile_serializer(type(field))
+        return name, FIELD, None, None
+
+    def bind(self, serializer) -> Callable:
+        """serializer 인스턴스(context 포함)에 묶인 행 -> dict 함수를 만듭니다."""
+        bound_fields = serializer.fields
+        steps = []
+        for name, kind, getter, convert in self.plan:
+            if kind == NESTED:
+                convert = convert.bind(bound_fields[name])
+            elif kind == BOUND:
+                convert = bound_fields[name].to_representation
+            elif kind == FIELD:
+                convert = bound_fields[name]
+            steps.append((name, kind == FIELD, getter, convert))
+
+        def represent(instance) -> dict:
+            ret = {}
+            for name, fallback, getter, convert in steps:
+                if fallback:
+                    try:
+                        attribute = convert.get_attribute(instance)
+                    except SkipField:
+                        continue
+                    check_for_none = (
+                        attribute.pk if isinstance(attribute, PKOnlyObject)
+                        else attribute
+                    )
+                    ret[name] = (
+                        None if check_for_none is None
+                        else convert.to_representation(attribute)
+                    )
+                    continue
+
+                value = getter(instance)
+                if value is None or convert is None:
+                    ret[name] = value
+                else:
+                    ret[name] = convert(value)
+            return ret
+
+        return represent
+
+    def serialize(
+        self,
+        instances: Iterable,
+        context: Optional[dict] = None
+    ) -> List[dict]:
+        """instances를 serializer_class(instances, many=True).data와 같은 값으로 직렬화"""
+        if isinstance(instances, Manager):
+            instances = instances.all()
+        represent = self.bind(self.instantiate(context=context or {}))
+        return [represent(instance) for instance in instances]
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(
+    serializer_class: type[serializers.ModelSerializer],
+    fields: Optional[tuple] = None
+) -> CompiledSerializer:
+    """serializer 클래스(와 선택한 fields)별로 한 번만 컴파일합니다."""
+    return CompiledSerializer(serializer_class, fields)
+
+
+def _column_getter(model, field) -> Optional[Callable]:
+    """필드가 모델 컬럼(또는 정방향 관계)을 그대로 읽으면 attrgetter를 반환합니다.
+
+    get_attribute를 재정의했거나 여러 단계의 source를 쓰는 필드는 None
+    (DRF 필드로 처리)
+    """
+    if type(field).get_attribute not in (
+        drf_fields.Field.get_attribute,
+        relations.RelatedField.get_attribute,
+    ):
+        return None
+    if field.source == '*' or len(field.source_attrs) != 1:
+        return None
+    try:
+        model_field = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        return None
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+
+    if isinstance(field, relations.PrimaryKeyRelatedField):
+        if not field.use_pk_only_optimization():
+            return None
+        return attrgetter(model_field.attname)
+    return attrgetter(model_field.name)
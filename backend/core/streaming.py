@@ -0,0 +1,32 @@
+from typing import AsyncIterator, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterator: Iterator) -> AsyncIterator:
+    """동기 iterator를 한 항목씩 스레드에서 꺼내는 async iterator
+
+    DB 커서를 읽는 iterator도 같은 연결을 쓰도록 thread_sensitive 스레드에서
+    실행합니다.
+    """
+    while True:
+        item = await sync_to_async(next)(iterator, _DONE)
+        if item is _DONE:
+            return
+        yield item
+
+
+def streaming_content(request, iterator: Iterator):
+    """StreamingHttpResponse에 넘길 본문 iterator
+
+    Django는 ASGI에서 동기 iterator를(WSGI에서는 async iterator를) 끝까지
+    읽어 리스트로 모은 뒤 전송하므로, 서버 종류에 맞는 iterator로 바꿔
+    메모리 사용량을 일정하게 유지합니다.
+    """
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        return iterate_in_thread(iterator)
+    return iterator
@@ -0,0 +1,398 @@
+"""NDJSON 게시글/댓글 일괄 가져오기
+
+한 줄에 JSON 객체 하나씩, type으로 게시글과 댓글을 구분합니다.
+
+    {"type": "post", "ref": "p1", "author": "vivid", "title": "제목",
+     "content": "게시글 본문입니다.", "board_type": "free",
+     "created_at": "2021-03-01T09:00:00+09:00", "views": 10}
+    {"type": "comment", "ref": "c1", "post": "p1", "author": "vivid",
+     "content": "댓글", "created_at": "2021-03-01T10:00:00+09:00"}
+    {"type": "comment", "post": "p1", "parent": "c1", "content": "대댓글"}
+
+- ref: 같은 파일의 다른 줄에서 참조할 이름 (선택)
+- post / parent: 앞에서 가져온 ref(문자열) 또는 이미 있는 ID(정수)
+- author: 사용자 이름 (없으면 가져오기를 실행한 사용자)
+- created_at: 원래 작성 시각 (없으면 현재 시각)
+
+참조하는 게시글/부모 댓글은 파일에서 먼저 나와야 합니다.
+검증은 PostService의 게시글/댓글 규칙을 그대로 사용하고, 잘못된 줄은
+건너뛰고 줄 번호와 함께 보고합니다. 이미지는 가져오지 않습니다.
+"""
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from posts.counters import count_subquery
+from posts.models import (
+    BoardType, Comment, Post,
+    make_content_hash, make_excerpt, render_markdown
+)
+from posts.ranking import refresh_rankings
+from posts.response_cache import LIST_SCOPE, post_scope, response_cache
+from posts.serializers import PostCreateUpdateSerializer
+from posts.services import PostService
+from users.models import User
+
+
+# 한 트랜잭션에서 bulk_create할 줄 수
+IMPORT_CHUNK_SIZE = 500
+# 결과에 포함할 최대 오류 수 (나머지는 개수만 집계)
+MAX_REPORTED_ERRORS = 1000
+
+POST_FIELDS = ('title', 'content', 'board_type', 'category')
+
+
+@dataclass
+class ImportResult:
+    """가져오기 결과 (생성한 게시글/댓글 수와 줄별 오류)"""
+    posts: int = 0
+    comments: int = 0
+    failed: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, error) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': error})
+
+    def as_dict(self) -> dict:
+        return {
+            'posts': self.posts,
+            'comments': self.comments,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+
+def error_detail(error: ValidationError):
+    """ValidationError를 응답에 넣을 수 있는 dict/list로 변환"""
+    if hasattr(error, 'error_dict'):
+        return error.message_dict
+    return error.messages
+
+
+class BulkImporter:
+    """NDJSON 줄을 chunk 단위로 검증하고 bulk_create하는 가져오기
+
+    chunk마다 작성자/참조 대상을 한 번에 조회하고, 게시글 -> 댓글 -> 대댓글
+    순서로 bulk_create 합니다. chunk 저장이 DB 오류로 실패하면 그 chunk만
+    한 줄씩 다시 저장해 문제가 있는 줄만 오류로 보고합니다.
+
+    Usage:
+        result = BulkImporter(default_author=request.user).run(lines)
+    """
+
+    def __init__(
+        self,
+        default_author: Optional[User] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE
+    ):
+        self.default_author = default_author
+        self.chunk_size = chunk_size
+        self.service = PostService()
+        self.result = ImportResult()
+        # ref -> 게시글 ID
+        self.post_refs = {}
+        # ref -> (댓글 ID, 게시글 ID, 부모 댓글 ID)
+        self.comment_refs = {}
+        # 사용자 이름 -> 사용자 ID
+        self.authors = {}
+        # 댓글이 추가된 기존 게시글 (응답 캐시 무효화용)
+        self.touched_posts = set()
+
+    def run(self, lines: Iterable) -> ImportResult:
+        """NDJSON 줄(str 또는 bytes)을 모두 가져옵니다."""
+        chunk = []
+        for number, line in enumerate(lines, 1):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8', errors='replace')
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                self.result.add_error(number, f'JSON 형식이 올바르지 않습니다: {e}')
+                continue
+            if not isinstance(row, dict):
+                self.result.add_error(number, 'JSON 객체가 아닙니다.')
+                continue
+
+            chunk.append((number, row))
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk)
+
+        response_cache.invalidate(
+            LIST_SCOPE, *(post_scope(post_id) for post_id in self.touched_posts)
+        )
+        self.result.errors.sort(key=lambda error: error['line'])
+        return self.result
+
+    def _import_chunk(self, chunk: list) -> None:
+        posts, comments = [], []
+        for number, row in chunk:
+            kind = row.get('type')
+            if kind == 'post':
+                posts.append((number, row))
+            elif kind == 'comment':
+                comments.append((number, row))
+            else:
+                self.result.add_error(number, 'type은 post 또는 comment여야 합니다.')
+
+        self._load_authors(row for _, row in chunk)
+        post_ids = self._import_posts(posts)
+
+        # 같은 chunk 안의 부모 댓글을 먼저 저장한 뒤 대댓글 저장
+        existing_posts = self._existing_posts(comments)
+        existing_comments = self._existing_comments(comments)
+        first, replies = [], []
+        for item in comments:
+            has_ref_parent = isinstance(item[1].get('parent'), str)
+            (replies if has_ref_parent else first).append(item)
+        commented = set()
+        for wave in (first, replies):
+            commented |= self._import_comments(
+                wave, existing_posts, existing_comments
+            )
+
+        if commented:
+            Post.objects.filter(id__in=commented).update(
+                comment_count=count_subquery(Comment)
+            )
+            self.touched_posts |= commented & existing_posts
+        refresh_rankings(set(post_ids) | commented)
+
+    # 게시글
+
+    def _import_posts(self, rows: list) -> List[int]:
+        entries = []
+        for number, row in rows:
+            try:
+                entries.append((number, self._build_post(row)))
+            except ValidationError as e:
+                self.result.add_error(number, error_detail(e))
+
+        created = self._insert(Post, entries)
+        for _, post in created:
+            if post.import_ref is not None:
+                self.post_refs[post.import_ref] = post.id
+        self.result.posts += len(created)
+        return [post.id for _, post in created]
+
+    def _build_post(self, row: dict) -> Post:
+        serializer = PostCreateUpdateSerializer(data={
+            name: row[name] for name in POST_FIELDS
+            if row.get(name) is not None
+        })
+        if not serializer.is_valid():
+            raise ValidationError(
+                {name: [str(e) for e in errors]
+                 for name, errors in serializer.errors.items()}
+            )
+        data = serializer.validated_data
+        self.service.validate_post(
+            data['title'], data['content'],
+            data.get('board_type', BoardType.FREE)
+        )
+
+        rendered_html = render_markdown(data['content'])
+        post = Post(
+            author_id=self._author_id(row),
+            rendered_html=rendered_html,
+            excerpt=make_excerpt(rendered_html),
+            content_hash=make_content_hash(data['content']),
+            views=self._views(row),
+            **data
+        )
+        post.import_ref = self._ref(row)
+        post.import_created_at = self._created_at(row)
+        return post
+
+    # 댓글
+
+    def _import_comments(
+        self,
+        rows: list,
+        existing_posts: set,
+        existing_comments: dict
+    ) -> set:
+        """댓글을 저장하고 댓글이 추가된 게시글 ID를 반환합니다."""
+        entries = []
+        for number, row in rows:
+            try:
+                entries.append((number, self._build_comment(
+                    row, existing_posts, existing_comments
+                )))
+            except ValidationError as e:
+                self.result.add_error(number, error_detail(e))
+
+        created = self._insert(Comment, entries)
+        for _, comment in created:
+            if comment.import_ref is not None:
+                self.comment_refs[comment.import_ref] = (
+                    comment.id, comment.post_id, comment.parent_id
+                )
+        self.result.comments += len(created)
+        return {comment.post_id for _, comment in created}
+
+    def _build_comment(
+        self,
+        row: dict,
+        existing_posts: set,
+        existing_comments: dict
+    ) -> Comment:
+        content = row.get('content')
+        self.service.validate_comment(content)
+
+        post = row.get('post')
+        post_id = None
+        if isinstance(post, str):
+            post_id = self.post_refs.get(post)
+        elif isinstance(post, int) and post in existing_posts:
+            post_id = post
+        if post_id is None:
+            raise ValidationError({'post': '존재하지 않는 게시글입니다.'})
+
+        parent_id = None
+        if row.get('parent') is not None:
+            parent = row['parent']
+            found = None
+            if isinstance(parent, str):
+                found = self.comment_refs.get(parent)
+            elif isinstance(parent, int):
+                found = existing_comments.get(parent)
+            # 같은 게시글의 댓글만 부모로 허용
+            if found is not None and found[1] != post_id:
+                found = None
+            self.service.validate_parent(
+                Comment(id=found[0], post_id=found[1], parent_id=found[2])
+                if found else None
+            )
+            parent_id = found[0]
+
+        comment = Comment(
+            post_id=post_id,
+            author_id=self._author_id(row),
+            content=content,
+            parent_id=parent_id
+        )
+        comment.import_ref = self._ref(row)
+        comment.import_created_at = self._created_at(row)
+        return comment
+
+    def _existing_posts(self, rows: list) -> set:
+        """chunk의 댓글이 ID로 참조하는 기존 게시글"""
+        ids = {
+            row['post'] for _, row in rows
+            if isinstance(row.get('post'), int)
+        }
+        if not ids:
+            return set()
+        return set(Post.objects.filter(id__in=ids).values_list('id', flat=True))
+
+    def _existing_comments(self, rows: list) -> dict:
+        """chunk의 대댓글이 ID로 참조하는 기존 부모 댓글"""
+        ids = {
+            row['parent'] for _, row in rows
+            if isinstance(row.get('parent'), int)
+        }
+        if not ids:
+            return {}
+        return {
+            comment_id: (comment_id, post_id, parent_id)
+            for comment_id, post_id, parent_id in Comment.objects.filter(
+                id__in=ids
+            ).values_list('id', 'post_id', 'parent_id')
+        }
+
+    # 공통
+
+    def _insert(self, model, entries: list) -> list:
+        """(줄 번호, 객체) 목록을 저장하고 저장된 항목을 반환합니다."""
+        if not entries:
+            return []
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([obj for _, obj in entries])
+                self._restore_created_at(model, entries)
+            return entries
+        except DatabaseError:
+            pass
+
+        # chunk 전체가 실패하면 한 줄씩 저장해 실패한 줄만 보고
+        created = []
+        for number, obj in entries:
+            obj.pk = None
+            try:
+                with transaction.atomic():
+                    model.objects.bulk_create([obj])
+                    self._restore_created_at(model, [(number, obj)])
+            except DatabaseError as e:
+                self.result.add_error(number, f'저장하지 못했습니다: {e}')
+                continue
+            created.append((number, obj))
+        return created
+
+    def _restore_created_at(self, model, entries: list) -> None:
+        """auto_now_add로 덮어쓴 원래 작성 시각을 되돌립니다."""
+        dated = []
+        for _, obj in entries:
+            if obj.import_created_at is not None:
+                obj.created_at = obj.updated_at = obj.import_created_at
+                dated.append(obj)
+        if dated:
+            model.objects.bulk_update(dated, ['created_at', 'updated_at'])
+
+    def _load_authors(self, rows: Iterable[dict]) -> None:
+        """chunk에 나온 작성자 이름을 한 번에 조회합니다."""
+        names = {
+            row['author'] for row in rows
+            if isinstance(row.get('author'), str)
+        } - self.authors.keys()
+        if names:
+            self.authors.update(
+                User.objects.filter(username__in=names)
+                .values_list('username', 'id')
+            )
+
+    def _author_id(self, row: dict) -> int:
+        author = row.get('author')
+        if author is None:
+            if self.default_author is None:
+                raise ValidationError({'author': '작성자를 입력해주세요.'})
+            return self.default_author.id
+        author_id = self.authors.get(author) if isinstance(author, str) else None
+        if author_id is None:
+            raise ValidationError({'author': '존재하지 않는 사용자입니다.'})
+        return author_id
+
+    def _ref(self, row: dict) -> Optional[str]:
+        ref = row.get('ref')
+        if ref is not None and not isinstance(ref, str):
+            raise ValidationError({'ref': 'ref는 문자열이어야 합니다.'})
+        return ref
+
+    def _created_at(self, row: dict):
+        value = row.get('created_at')
+        if value is None:
+            return None
+        created_at = parse_datetime(value) if isinstance(value, str) else None
+        if created_at is None:
+            raise ValidationError({'created_at': '날짜 형식이 올바르지 않습니다.'})
+        if timezone.is_naive(created_at):
+            created_at = timezone.make_aware(created_at)
+        return created_at
+
+    def _views(self, row: dict) -> int:
+        views = row.get('views', 0)
+        if not isinstance(views, int) or isinstance(views, bool) or views < 0:
+            raise ValidationError({'views': '조회수는 0 이상의 정수여야 합니다.'})
+        return views
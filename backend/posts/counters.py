@@ -0,0 +1,49 @@
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from posts.models import Comment, Like, Post
+
+
+def count_subquery(model):
+    """게시글별 관계 객체 수를 세는 서브쿼리"""
+    counts = (
+        model.objects.filter(post=OuterRef('pk'))
+        .order_by()
+        .values('post')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(
+        Subquery(counts, output_field=IntegerField()), Value(0)
+    )
+
+
+def reconcile_post_counters(batch_size: int = 1000) -> int:
+    """like_count / comment_count를 실제 좋아요/댓글 수로 보정합니다.
+
+    id 범위 단위로 UPDATE 한 번씩 실행하며, 값이 어긋난 행만 갱신합니다.
+
+    Returns:
+        int: 보정한 게시글 수
+    """
+    repaired = 0
+    last_id = 0
+    while True:
+        ids = list(
+            Post.objects.filter(id__gt=last_id)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return repaired
+
+        likes = count_subquery(Like)
+        comments = count_subquery(Comment)
+        repaired += (
+            Post.objects.filter(id__gte=ids[0], id__lte=ids[-1])
+            .filter(
+                ~Q(like_count=likes) | ~Q(comment_count=comments)
+            )
+            .update(like_count=likes, comment_count=comments)
+        )
+        last_id = ids[-1]
@@ -0,0 +1,157 @@
+"""게시글/댓글/좋아요 테이블 스트리밍 내보내기
+
+테이블을 id 순서로 iterator(chunk_size)로 읽어(PostgreSQL에서는 서버 측 커서)
+NDJSON 또는 CSV로 변환하며, 필요하면 gzip으로 압축합니다.
+행을 모아 두지 않으므로 테이블 크기와 관계없이 메모리 사용량이 일정하고,
+중단되면 마지막으로 받은 id를 after로 넘겨 이어서 내보낼 수 있습니다.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.db_router import REPLICA_HINT
+from core.renderers import orjson
+from posts.models import Comment, Like, Post
+
+
+# 테이블 이름 -> (모델, 내보낼 컬럼)
+# 파생 컬럼(rendered_html, excerpt 등)은 원본에서 다시 만들 수 있으므로 제외
+EXPORT_TABLES = {
+    'posts': (Post, (
+        'id', 'author_id', 'title', 'content', 'board_type', 'category',
+        'image', 'views', 'like_count', 'comment_count',
+        'created_at', 'updated_at',
+    )),
+    'comments': (Comment, (
+        'id', 'post_id', 'author_id', 'parent_id', 'content',
+        'created_at', 'updated_at',
+    )),
+    'likes': (Like, ('id', 'post_id', 'user_id', 'created_at')),
+}
+EXPORT_FORMATS = ('ndjson', 'csv')
+CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+# DB에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 2000
+# 출력 버퍼가 이 크기를 넘으면 내보냄 (bytes)
+EXPORT_BUFFER_SIZE = 64 * 1024
+
+
+class TableExport:
+    """테이블 하나를 bytes 조각으로 내보내는 iterator
+
+    Usage:
+        export = TableExport('posts', fmt='csv', after=12000, compress=True)
+        for chunk in export:
+            output.write(chunk)
+        export.last_id  # 이어서 내보낼 때 after로 사용
+
+    Raises:
+        ValueError: 알 수 없는 테이블 또는 형식
+    """
+
+    def __init__(
+        self,
+        table: str,
+        fmt: str = 'ndjson',
+        after: Optional[int] = None,
+        compress: bool = False,
+        chunk_size: int = EXPORT_CHUNK_SIZE
+    ):
+        if table not in EXPORT_TABLES:
+            raise ValueError(f'알 수 없는 테이블입니다: {table}')
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+        self.table = table
+        self.model, self.columns = EXPORT_TABLES[table]
+        self.fmt = fmt
+        self.after = after
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.count = 0
+        self.last_id = after
+
+    @property
+    def content_type(self) -> str:
+        if self.compress:
+            return 'application/gzip'
+        return CONTENT_TYPES[self.fmt]
+
+    @property
+    def filename(self) -> str:
+        suffix = '.gz' if self.compress else ''
+        return f'{self.table}.{self.fmt}{suffix}'
+
+    def rows(self) -> Iterator[tuple]:
+        """id 순서로 행(tuple)을 읽습니다. (읽기 전용이므로 replica 사용)"""
+        queryset = self.model.objects.db_manager(
+            hints={REPLICA_HINT: True}
+        ).order_by('id')
+        if self.after is not None:
+            queryset = queryset.filter(id__gt=self.after)
+        for row in queryset.values_list(*self.columns).iterator(
+            chunk_size=self.chunk_size
+        ):
+            self.count += 1
+            self.last_id = row[0]
+            yield row
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunks = self._encode()
+        if self.compress:
+            chunks = gzip_chunks(chunks)
+        return iter(chunks)
+
+    def _encode(self) -> Iterator[bytes]:
+        """행을 형식에 맞게 인코딩해 EXPORT_BUFFER_SIZE 단위로 내보냅니다."""
+        encode = self._csv_encoder() if self.fmt == 'csv' else self._ndjson_line
+        buffer = bytearray(encode(self.columns) if self.fmt == 'csv' else b'')
+        for row in self.rows():
+            buffer += encode(row)
+            if len(buffer) >= EXPORT_BUFFER_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def _ndjson_line(self, row: tuple) -> bytes:
+        record = dict(zip(self.columns, row))
+        if orjson is not None:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        return json.dumps(
+            record, cls=DjangoJSONEncoder, ensure_ascii=False
+        ).encode() + b'\n'
+
+    def _csv_encoder(self):
+        text = io.StringIO()
+        writer = csv.writer(text)
+
+        def encode(row) -> bytes:
+            writer.writerow([
+                value.isoformat() if isinstance(value, (date, datetime))
+                else value
+                for value in row
+            ])
+            line = text.getvalue()
+            text.seek(0)
+            text.truncate()
+            return line.encode()
+
+        return encode
+
+
+def gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """bytes 조각을 gzip 스트림으로 압축합니다."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
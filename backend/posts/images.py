@@ -0,0 +1,218 @@
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+
+import django
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image
+
+from posts.models import ImageStatus, Post
+from posts.response_cache import response_cache
+
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+# 생성할 이미지 크기 (긴 변 기준 px), 큰 것부터 순서대로
+IMAGE_VARIANTS = {
+    'full': 800,
+    'card': 480,
+    'thumbnail': 240,
+}
+
+
+def render_variants(source) -> dict:
+    """이미지를 한 번만 디코딩해 크기별 WebP 변형을 만듭니다.
+
+    - IMAGE_VARIANTS 크기로 리사이징 (큰 크기의 결과를 다시 줄여 재사용)
+    - WebP 포맷으로 변환
+    - 품질 최적화
+
+    Returns:
+        dict: {이름: (임시 파일, 너비)} - 임시 파일은 호출한 쪽에서 close
+    """
+    largest = max(IMAGE_VARIANTS.values())
+    img = Image.open(source)
+    # JPEG는 디코딩 단계에서 축소해 메모리와 CPU 사용량을 줄임
+    img.draft('RGB', (largest, largest))
+
+    if img.mode in ('RGBA', 'LA'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    variants = {}
+    for label, max_size in sorted(
+        IMAGE_VARIANTS.items(), key=lambda item: -item[1]
+    ):
+        if img.width > max_size or img.height > max_size:
+            ratio = min(max_size/img.width, max_size/img.height)
+            new_size = (int(img.width * ratio), int(img.height * ratio))
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+
+        output = tempfile.TemporaryFile()
+        img.save(output, format='WebP', quality=85, optimize=True)
+        output.seek(0)
+        variants[label] = (output, img.width)
+    return variants
+
+
+def _save_variants(storage, stem: str, variants: dict) -> dict:
+    """변형 이미지를 저장하고 {이름: {"name", "width"}}를 반환합니다."""
+    saved = {}
+    try:
+        for label, (output, width) in variants.items():
+            name = f'{stem}.webp' if label == 'full' else f'{stem}_{label}.webp'
+            saved[label] = {
+                'name': storage.save(name, File(output)),
+                'width': width,
+            }
+    except Exception:
+        for variant in saved.values():
+            storage.delete(variant['name'])
+        raise
+    finally:
+        for output, _ in variants.values():
+            output.close()
+    return saved
+
+
+def process_post_image(post_id: int) -> bool:
+    """업로드된 원본 이미지로 크기별 변형을 만들어 게시글 이미지를 교체합니다.
+
+    PENDING 상태인 게시글만 PROCESSING으로 선점한 뒤 처리하므로
+    여러 워커가 동시에 실행돼도 한 번만 처리됩니다.
+    이미지 교체는 원본 파일명이 그대로인 경우에만 반영해, 처리 도중
+    사용자가 이미지를 바꿨다면 새 업로드를 덮어쓰지 않습니다.
+    응답 캐시 무효화는 호출한 쪽에서 합니다. (로컬 프로세스 풀의 워커는
+    웹 프로세스와 캐시를 공유하지 않을 수 있음)
+
+    Returns:
+        bool: 이미지를 교체했으면 True
+    """
+    claimed = Post.objects.filter(
+        id=post_id, image_status=ImageStatus.PENDING
+    ).update(
+        image_status=ImageStatus.PROCESSING,
+        image_claimed_at=timezone.now()
+    )
+    if not claimed:
+        return False
+
+    post = Post.objects.only('id', 'image', 'image_variants').get(id=post_id)
+    raw_name = post.image.name
+    old_variants = post.image_variants or {}
+    storage = post.image.storage
+
+    try:
+        with storage.open(raw_name, 'rb') as source:
+            variants = render_variants(source)
+        stem = os.path.splitext(raw_name)[0]
+        saved = _save_variants(storage, stem, variants)
+    except Exception:
+        logger.exception('게시글 %s 이미지 처리에 실패했습니다.', post_id)
+        Post.objects.filter(
+            id=post_id, image_status=ImageStatus.PROCESSING
+        ).update(image_status=ImageStatus.FAILED)
+        return False
+
+    # 조건부 UPDATE 한 번으로 교체 (원본이 그대로일 때만)
+    replaced = Post.objects.filter(
+        id=post_id, image=raw_name
+    ).update(
+        image=saved['full']['name'],
+        image_variants=saved,
+        image_status=ImageStatus.READY
+    )
+
+    # 교체에 성공하면 원본과 이전 변형을, 실패하면 새로 만든 파일을 정리
+    if replaced:
+        new_names = {variant['name'] for variant in saved.values()}
+        stale = {raw_name} | {
+            variant['name'] for variant in old_variants.values()
+        }
+        stale -= new_names
+    else:
+        stale = {variant['name'] for variant in saved.values()}
+    for name in stale:
+        storage.delete(name)
+    return bool(replaced)
+
+
+def reclaim_stale_images() -> int:
+    """처리 도중 워커가 중단되어 processing에 남은 이미지를 다시 대기열에 넣습니다.
+
+    IMAGE_PROCESSING_TIMEOUT(초)보다 오래 processing인 게시글을 pending으로
+    되돌립니다. (늦게 끝난 워커의 결과는 원본 파일명 조건으로 걸러짐)
+
+    Returns:
+        int: 다시 대기열에 넣은 게시글 수
+    """
+    stale_before = timezone.now() - timedelta(
+        seconds=settings.IMAGE_PROCESSING_TIMEOUT
+    )
+    return Post.objects.filter(
+        Q(image_claimed_at__lt=stale_before) | Q(image_claimed_at__isnull=True),
+        image_status=ImageStatus.PROCESSING
+    ).update(image_status=ImageStatus.PENDING, image_claimed_at=None)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESSING_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+            # spawn된 워커는 작업 함수를 불러오기 전에 Django를 초기화해야 함
+            initializer=django.setup,
+        )
+    return _executor
+
+
+def _invalidate_if_replaced(post_id: int, future) -> None:
+    """로컬 풀 워커가 이미지를 교체했으면 웹 프로세스에서 응답 캐시를 무효화합니다."""
+    try:
+        replaced = future.result()
+    except Exception:
+        logger.exception('게시글 %s 이미지 처리에 실패했습니다.', post_id)
+        return
+    if replaced:
+        response_cache.invalidate_post(post_id)
+
+
+def enqueue_image(post_id: int) -> None:
+    """게시글 이미지 처리를 예약합니다.
+
+    IMAGE_PROCESSING_BACKEND
+        local: 로컬 프로세스 풀에서 바로 처리
+        queue: PENDING 상태로 남겨두고 process_images 워커가 처리
+        sync: 현재 프로세스에서 즉시 처리 (테스트용)
+
+    게시글이 저장된 뒤(on_commit) 호출되므로 예약에 실패해도 예외를 올리지 않고
+    기록만 남깁니다. local 풀에서 잃어버린 작업(프로세스 재시작 등)은 pending으로
+    남으므로 process_images --once를 주기적으로 실행해 처리합니다.
+
+    local 풀의 워커는 별도 프로세스라 locmem 캐시를 공유하지 않으므로,
+    작업이 끝나면 웹 프로세스의 콜백에서 캐시된 응답을 무효화합니다.
+    """
+    backend = settings.IMAGE_PROCESSING_BACKEND
+    try:
+        if backend == 'sync':
+            if process_post_image(post_id):
+                response_cache.invalidate_post(post_id)
+        elif backend == 'local':
+            future = _get_executor().submit(process_post_image, post_id)
+            future.add_done_callback(partial(_invalidate_if_replaced, post_id))
+    except Exception:
+        logger.exception('게시글 %s 이미지 처리를 예약하지 못했습니다.', post_id)
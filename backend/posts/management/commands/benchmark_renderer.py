@@ -0,0 +1,114 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer, orjson
+from posts.models import ImageStatus, Post
+from posts.serializers import PostSerializer
+from users.models import User
+
+
+class Command(BaseCommand):
+    """PostSerializer 한 페이지를 인코딩하는 시간을 렌더러별로 비교합니다.
+
+    DB에 저장하지 않은 게시글로 페이지를 만들어 직렬화한 뒤
+    DRF 기본 JSONRenderer와 FastJSONRenderer의 인코딩 시간만 측정합니다.
+
+    Usage:
+        python manage.py benchmark_renderer [--size 100] [--repeat 200]
+    """
+    help = 'JSON 렌더러 인코딩 성능을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=100,
+            help='페이지당 게시글 수 (default: 100)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=200,
+            help='측정 반복 횟수 (default: 200)'
+        )
+
+    def handle(self, *args, **options):
+        data = PostSerializer(
+            self._page(options['size']),
+            many=True,
+            context={'viewer_state': {'liked': set()}}
+        ).data
+
+        renderers = [
+            ('JSONRenderer', JSONRenderer()),
+            ('FastJSONRenderer', FastJSONRenderer()),
+        ]
+        if orjson is None:
+            self.stdout.write(self.style.WARNING(
+                'orjson이 설치되어 있지 않아 FastJSONRenderer도 표준 json을 사용합니다.'
+            ))
+
+        baseline = None
+        for name, renderer in renderers:
+            body = renderer.render(data)
+            elapsed = self._measure(renderer, data, options['repeat'])
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f'{name:<18} {elapsed * 1000:8.3f} ms/page '
+                f'{len(body) / 1024:8.1f} KiB  x{baseline / elapsed:.1f}'
+            )
+
+    def _measure(self, renderer, data, repeat) -> float:
+        """가장 빠른 실행 시간 (초)"""
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            renderer.render(data)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    def _page(self, size):
+        """실제 게시글과 비슷한 크기의 한국어 게시글 목록"""
+        author = User(
+            id=1,
+            username='벤치마크',
+            email='bench@example.com',
+            bio='성능 측정용 사용자입니다.',
+            created_at=timezone.now()
+        )
+        paragraph = (
+            '## 파이썬 성능 최적화\n\n'
+            '직렬화와 인코딩은 목록 응답에서 CPU 시간의 큰 부분을 차지합니다. '
+            '`orjson`은 C로 구현되어 표준 json보다 빠릅니다.\n\n'
+            '```python\nprint("hello, world")\n```\n\n'
+        )
+        now = timezone.now()
+        posts = []
+        for index in range(size):
+            name = f'posts/2026/10/17/image_{index}'
+            posts.append(Post(
+                id=index + 1,
+                title=f'성능 최적화 기록 #{index}',
+                content=paragraph * 12,
+                author=author,
+                board_type='tech',
+                category='python',
+                image=f'{name}.webp',
+                image_status=ImageStatus.READY,
+                image_variants={
+                    'full': {'name': f'{name}.webp', 'width': 800},
+                    'card': {'name': f'{name}_card.webp', 'width': 480},
+                    'thumbnail': {
+                        'name': f'{name}_thumbnail.webp', 'width': 240
+                    },
+                },
+                views=index * 17,
+                like_count=index * 3,
+                comment_count=index,
+                created_at=now,
+                updated_at=now,
+            ))
+        return posts
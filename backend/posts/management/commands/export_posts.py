@@ -0,0 +1,77 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, EXPORT_TABLES, TableExport
+
+
+class Command(BaseCommand):
+    """posts/comments/likes 테이블을 NDJSON 또는 CSV로 내보냅니다.
+
+    서버 측 커서로 읽어 바로 파일에 쓰므로 테이블 크기와 관계없이
+    메모리 사용량이 일정합니다. 중단되면 출력된 마지막 id를 --after로
+    넘겨 이어서 내보냅니다.
+
+    Usage:
+        python manage.py export_posts posts -o posts.ndjson.gz --gzip
+        python manage.py export_posts comments --format csv --after 120000 > rest.csv
+    """
+    help = '게시글/댓글/좋아요 테이블을 스트리밍으로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', choices=sorted(EXPORT_TABLES))
+        parser.add_argument(
+            '-o', '--output',
+            default='-',
+            help='출력 파일 경로 (default: -, 표준 출력)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=EXPORT_FORMATS,
+            default='ndjson',
+            help='출력 형식 (default: ndjson)'
+        )
+        parser.add_argument(
+            '--gzip',
+            action='store_true',
+            help='gzip으로 압축'
+        )
+        parser.add_argument(
+            '--after',
+            type=int,
+            help='이 id 다음 행부터 내보내기 (이어서 내보낼 때)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f'DB에서 한 번에 읽을 행 수 (default: {EXPORT_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        export = TableExport(
+            options['table'],
+            fmt=options['format'],
+            after=options['after'],
+            compress=options['gzip'],
+            chunk_size=options['chunk_size']
+        )
+        if options['output'] == '-':
+            self._write(export, sys.stdout.buffer)
+        else:
+            with open(options['output'], 'wb') as output:
+                self._write(export, output)
+
+        self.stderr.write(self.style.SUCCESS(
+            f'{export.table} {export.count}행을 내보냈습니다. '
+            f'(마지막 id: {export.last_id})'
+        ))
+
+    def _write(self, export, output):
+        try:
+            for chunk in export:
+                output.write(chunk)
+        except BrokenPipeError:
+            raise CommandError(
+                f'출력이 중단되었습니다. --after {export.last_id}로 이어서 내보내세요.'
+            )
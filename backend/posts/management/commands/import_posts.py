@@ -0,0 +1,55 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.bulk_import import IMPORT_CHUNK_SIZE, BulkImporter
+from users.models import User
+
+
+class Command(BaseCommand):
+    """NDJSON 파일의 게시글/댓글을 일괄로 가져옵니다.
+
+    파일을 한 줄씩 읽어 chunk 단위로 저장하므로 파일 크기와 관계없이
+    메모리 사용량이 일정합니다. 형식은 posts.bulk_import를 참고하세요.
+
+    Usage:
+        python manage.py import_posts dump.ndjson [--author vivid] [--chunk-size 500]
+        cat dump.ndjson | python manage.py import_posts -
+    """
+    help = 'NDJSON 파일에서 게시글/댓글을 일괄로 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='NDJSON 파일 경로 (-: 표준 입력)')
+        parser.add_argument(
+            '--author',
+            help='author가 없는 줄의 작성자 (사용자 이름)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help=f'한 번에 저장할 줄 수 (default: {IMPORT_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        author = None
+        if options['author']:
+            author = User.objects.filter(username=options['author']).first()
+            if author is None:
+                raise CommandError(f"사용자 {options['author']}를 찾을 수 없습니다.")
+
+        importer = BulkImporter(
+            default_author=author, chunk_size=options['chunk_size']
+        )
+        if options['path'] == '-':
+            result = importer.run(sys.stdin)
+        else:
+            with open(options['path'], encoding='utf-8') as lines:
+                result = importer.run(lines)
+
+        for error in result.errors:
+            self.stderr.write(f"{error['line']}번째 줄: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f'게시글 {result.posts}개, 댓글 {result.comments}개를 가져왔습니다. '
+            f'(실패 {result.failed}줄)'
+        ))
@@ -0,0 +1,88 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from posts.images import process_post_image, reclaim_stale_images
+from posts.models import ImageStatus, Post
+from posts.response_cache import response_cache
+
+
+class Command(BaseCommand):
+    """처리 대기 중인 게시글 이미지를 최적화하는 워커
+
+    IMAGE_PROCESSING_BACKEND=queue 환경에서 실행합니다.
+    웹 프로세스와 별도로 실행되므로 응답 캐시를 무효화하려면 공유 캐시
+    (CACHE_BACKEND=redis 또는 file)가 필요합니다.
+    게시글의 image_status가 대기열 역할을 하므로 여러 워커를 동시에
+    띄워도 같은 이미지를 중복 처리하지 않습니다.
+
+    --backfill는 크기별 변형이 없는 기존 이미지를 다시 대기열에 넣습니다.
+    처리 도중 중단된 워커의 이미지(IMAGE_PROCESSING_TIMEOUT보다 오래 processing)는
+    시작할 때와 이후 그 주기마다 다시 대기열에 넣습니다.
+
+    Usage:
+        python manage.py process_images [--once] [--interval 2] [--batch-size 20]
+                                        [--backfill]
+    """
+    help = '처리 대기 중인 게시글 이미지를 최적화합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기열을 한 번만 처리하고 종료'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2,
+            help='대기열이 비었을 때 다시 확인하기까지 대기할 시간(초)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='한 번에 가져올 게시글 수 (default: 20)'
+        )
+
+        parser.add_argument(
+            '--backfill',
+            action='store_true',
+            help='크기별 변형이 없는 기존 이미지를 대기열에 추가'
+        )
+
+    def handle(self, *args, **options):
+        if options['backfill']:
+            queued = Post.objects.filter(
+                image_status=ImageStatus.READY, image_variants={}
+            ).update(image_status=ImageStatus.PENDING)
+            self.stdout.write(f'{queued}개의 이미지를 대기열에 추가했습니다.')
+
+        next_reclaim = 0.0
+        while True:
+            if time.monotonic() >= next_reclaim:
+                reclaimed = reclaim_stale_images()
+                if reclaimed:
+                    self.stdout.write(
+                        f'중단된 이미지 {reclaimed}개를 대기열에 다시 추가했습니다.'
+                    )
+                next_reclaim = time.monotonic() + settings.IMAGE_PROCESSING_TIMEOUT
+
+            post_ids = list(
+                Post.objects.filter(image_status=ImageStatus.PENDING)
+                .order_by('id')
+                .values_list('id', flat=True)[:options['batch_size']]
+            )
+            processed = 0
+            for post_id in post_ids:
+                if process_post_image(post_id):
+                    response_cache.invalidate_post(post_id)
+                    processed += 1
+            if processed:
+                self.stdout.write(f'{processed}개의 이미지를 처리했습니다.')
+
+            if options['once']:
+                break
+            if not post_ids:
+                time.sleep(options['interval'])
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from posts.counters import reconcile_post_counters
+
+
+class Command(BaseCommand):
+    """게시글 좋아요/댓글 카운터를 실제 값으로 보정합니다.
+
+    사용자 삭제 등으로 카운터를 거치지 않고 좋아요/댓글이 지워진 경우
+    생기는 차이를 일괄 수정합니다.
+
+    Usage:
+        python manage.py reconcile_counters [--batch-size 1000]
+    """
+    help = '게시글 좋아요/댓글 카운터를 보정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 검사할 게시글 수 (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        repaired = reconcile_post_counters(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'{repaired}개 게시글의 카운터를 보정했습니다.')
+        )
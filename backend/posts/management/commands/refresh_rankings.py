@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from posts.ranking import refresh_rankings
+
+
+class Command(BaseCommand):
+    """게시글 인기 점수를 전체 재계산합니다.
+
+    평소에는 활동이 생긴 게시글만 갱신되므로, 가중치를 바꾼 뒤에만
+    실행하면 됩니다. (기존 게시글의 최초 점수는 마이그레이션 0016에서 채움)
+
+    Usage:
+        python manage.py refresh_rankings [--batch-size 500]
+    """
+    help = '게시글 인기 점수를 전체 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 저장할 게시글 수 (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        updated = refresh_rankings(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'{updated}개 게시글의 인기 점수를 갱신했습니다.')
+        )
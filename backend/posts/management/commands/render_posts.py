@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand
+
+from posts.models import Post
+
+
+class Command(BaseCommand):
+    """게시글 마크다운과 목록용 요약을 미리 렌더링해 저장합니다.
+
+    content 해시가 저장된 값과 다른(렌더링되지 않았거나 오래된) 게시글만
+    다시 렌더링하고, batch-size 단위로 bulk_update 합니다.
+
+    Usage:
+        python manage.py render_posts [--batch-size 500] [--force]
+    """
+    help = '게시글 마크다운 HTML을 일괄 렌더링합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 저장할 게시글 수 (default: 500)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='해시가 일치해도 모든 게시글을 다시 렌더링'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        force = options['force']
+
+        queryset = Post.objects.only(
+            'id', 'content', 'rendered_html', 'excerpt', 'content_hash'
+        ).order_by('id')
+
+        batch = []
+        rendered = 0
+        for post in queryset.iterator(chunk_size=batch_size):
+            if force:
+                post.content_hash = ''
+            if not post.render_content():
+                continue
+            batch.append(post)
+            if len(batch) >= batch_size:
+                rendered += self._flush(batch)
+
+        rendered += self._flush(batch)
+        self.stdout.write(
+            self.style.SUCCESS(f'{rendered}개의 게시글을 렌더링했습니다.')
+        )
+
+    def _flush(self, batch):
+        count = len(batch)
+        if count:
+            Post.objects.bulk_update(
+                batch, ['rendered_html', 'excerpt', 'content_hash']
+            )
+            batch.clear()
+        return count
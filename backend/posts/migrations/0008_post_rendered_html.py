@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-17 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0007_post_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='rendered_html',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
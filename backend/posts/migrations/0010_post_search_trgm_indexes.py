@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """title/content에 pg_trgm GIN 인덱스 생성 (PostgreSQL 전용)
+
+    ILIKE '%검색어%'도 trigram 인덱스로 처리되므로 한국어 부분 검색이
+    본문 전체를 순차 탐색하지 않습니다.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS posts_title_trgm_idx '
+        'ON posts USING gin (title gin_trgm_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS posts_content_trgm_idx '
+        'ON posts USING gin (content gin_trgm_ops)'
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS posts_title_trgm_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS posts_content_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0009_postranking'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
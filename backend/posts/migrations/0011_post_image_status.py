@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-17 10:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_existing_images_ready(apps, schema_editor):
+    """기존 이미지는 업로드 시 이미 최적화되었으므로 처리 완료로 표시"""
+    Post = apps.get_model('posts', 'Post')
+    Post.objects.exclude(image='').exclude(image__isnull=True).update(
+        image_status='ready'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0010_post_search_trgm_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_status',
+            field=models.CharField(choices=[('none', '이미지 없음'), ('pending', '처리 대기'), ('processing', '처리 중'), ('ready', '처리 완료'), ('failed', '처리 실패')], default='none', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('image_status', 'pending')), fields=['id'], name='posts_image_pending_idx'),
+        ),
+        migrations.RunPython(
+            mark_existing_images_ready, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.1.15 on 2026-10-17 10:29
+
+import hashlib
+import re
+from html import unescape
+
+import markdown
+from django.db import migrations, models
+from django.utils.html import escape, strip_tags
+
+
+# 이 마이그레이션을 작성할 때의 렌더링/요약 규칙 (posts.models의 함수가 나중에
+# 바뀌어도 마이그레이션 결과가 달라지지 않도록 복사해 고정)
+MARKDOWN_RENDER_VERSION = 1
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.codehilite'
+]
+EXCERPT_LENGTH = 200
+
+
+def render_markdown(content):
+    return markdown.markdown(escape(content), extensions=MARKDOWN_EXTENSIONS)
+
+
+def make_content_hash(content):
+    raw = f'{MARKDOWN_RENDER_VERSION}:{content}'.encode()
+    return hashlib.sha256(raw).hexdigest()
+
+
+def make_excerpt(html):
+    text = re.sub(r'\s+', ' ', unescape(strip_tags(html))).strip()
+    if len(text) > EXCERPT_LENGTH:
+        return text[:EXCERPT_LENGTH].rstrip() + '…'
+    return text
+
+
+def fill_excerpts(apps, schema_editor):
+    """기존 게시글의 목록용 요약 채우기 (저장된 HTML이 최신이면 재사용)"""
+    Post = apps.get_model('posts', 'Post')
+    batch = []
+    for post in Post.objects.only(
+        'id', 'content', 'rendered_html', 'content_hash'
+    ).iterator(chunk_size=500):
+        html = post.rendered_html
+        if post.content_hash != make_content_hash(post.content):
+            html = render_markdown(post.content)
+        post.excerpt = make_excerpt(html)
+        batch.append(post)
+        if len(batch) >= 500:
+            Post.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    Post.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0013_post_like_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', max_length=201),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-17 11:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0014_post_excerpt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
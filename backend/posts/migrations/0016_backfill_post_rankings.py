@@ -0,0 +1,61 @@
+import math
+
+from django.db import migrations
+from django.utils import timezone
+
+
+# 이 마이그레이션을 작성할 때의 인기 점수 규칙 (posts.ranking.compute_score가
+# 나중에 바뀌어도 마이그레이션 결과가 달라지지 않도록 복사해 고정)
+VIEW_WEIGHT = 1
+LIKE_WEIGHT = 5
+COMMENT_WEIGHT = 3
+HALF_LIFE_HOURS = 24
+
+
+def compute_score(views, likes, comments, created_at):
+    engagement = (
+        views * VIEW_WEIGHT
+        + likes * LIKE_WEIGHT
+        + comments * COMMENT_WEIGHT
+    )
+    half_life = HALF_LIFE_HOURS * 3600
+    return math.log2(1 + engagement) + created_at.timestamp() / half_life
+
+
+def backfill_rankings(apps, schema_editor):
+    """랭킹 행이 없는 기존 게시글의 인기 점수 채우기
+
+    랭킹은 활동이 생긴 게시글만 갱신하므로, 배포 전에 있던 게시글이
+    인기글 목록에서 빠지지 않도록 한 번 계산해 둡니다.
+    """
+    Post = apps.get_model('posts', 'Post')
+    PostRanking = apps.get_model('posts', 'PostRanking')
+    now = timezone.now()
+    rows = Post.objects.filter(ranking__isnull=True).values_list(
+        'id', 'views', 'like_count', 'comment_count', 'created_at'
+    )
+    batch = []
+    for post_id, views, likes, comments, created_at in rows.iterator(
+        chunk_size=500
+    ):
+        batch.append(PostRanking(
+            post_id=post_id,
+            score=compute_score(views, likes, comments, created_at),
+            created_at=created_at,
+            updated_at=now,
+        ))
+        if len(batch) >= 500:
+            PostRanking.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    PostRanking.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0015_post_image_claimed_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rankings, migrations.RunPython.noop),
+    ]
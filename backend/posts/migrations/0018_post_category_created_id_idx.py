@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-17 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0017_moderationjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='posts_category_created_id_idx'),
+        ),
+    ]
@@ -1,7 +1,41 @@
+import hashlib
+import re
+from html import unescape
+
 from django.db import models
 from django.conf import settings
 import markdown
-from django.utils.html import escape
+from django.utils.html import escape, strip_tags
+
+
+# 렌더링 방식(확장 등)이 바뀌면 올려서 기존 캐시를 무효화
+MARKDOWN_RENDER_VERSION = 1
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.tables',
+    'markdown.extensions.codehilite'
+]
+# 목록에 보여줄 본문 요약 길이 (글자 수)
+EXCERPT_LENGTH = 200
+
+
+def render_markdown(content: str) -> str:
+    """마크다운 내용을 HTML로 변환"""
+    return markdown.markdown(escape(content), extensions=MARKDOWN_EXTENSIONS)
+
+
+def make_content_hash(content: str) -> str:
+    """렌더링 캐시 키로 사용할 content 해시"""
+    raw = f'{MARKDOWN_RENDER_VERSION}:{content}'.encode()
+    return hashlib.sha256(raw).hexdigest()
+
+
+def make_excerpt(html: str) -> str:
+    """렌더링된 HTML에서 태그를 제거한 본문 요약(평문)을 만듭니다."""
+    text = re.sub(r'\s+', ' ', unescape(strip_tags(html))).strip()
+    if len(text) > EXCERPT_LENGTH:
+        return text[:EXCERPT_LENGTH].rstrip() + '…'
+    return text
 
 
 class BoardType(models.TextChoices):
@@ -22,6 +56,15 @@ class ProgrammingLanguage(models.TextChoices):
     OTHER = 'other', '기타'
 
 
+class ImageStatus(models.TextChoices):
+    """게시글 이미지 처리 상태"""
+    NONE = 'none', '이미지 없음'
+    PENDING = 'pending', '처리 대기'
+    PROCESSING = 'processing', '처리 중'
+    READY = 'ready', '처리 완료'
+    FAILED = 'failed', '처리 실패'
+
+
 class Post(models.Model):
     """Blog Post Model"""
 
@@ -47,23 +90,78 @@ class Post(models.Model):
         null=True,
         blank=True
     )
+    image_status = models.CharField(
+        max_length=10,
+        choices=ImageStatus.choices,
+        default=ImageStatus.NONE
+    )
+    # 워커가 처리를 시작한 시각 (오래된 processing 상태를 다시 대기열에 넣을 때 사용)
+    image_claimed_at = models.DateTimeField(null=True, blank=True)
+    # 크기별 WebP 변형 {이름: {"name": 저장 경로, "width": 너비}} (posts.images 참고)
+    image_variants = models.JSONField(default=dict, blank=True)
     views = models.PositiveIntegerField(default=0)
+    # 비정규화된 카운터 (PostService가 F() 식으로 갱신, reconcile_counters로 보정)
+    like_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    # 미리 렌더링한 HTML과 렌더링 당시 content 해시
+    rendered_html = models.TextField(blank=True, default='')
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    # 목록용 평문 요약 (본문과 함께 렌더링 시 갱신)
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH + 1, blank=True, default=''
+    )
 
     class Meta:
         db_table = "posts"
         ordering = ["-created_at"]
+        indexes = [
+            # 키셋 페이지네이션 (created_at, id) 내림차순 탐색용
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="posts_created_id_idx",
+            ),
+            # 게시판별 목록 조회용
+            models.Index(
+                fields=["board_type", "-created_at", "-id"],
+                name="posts_board_created_id_idx",
+            ),
+            # 카테고리별 목록(기술 블로그) 조회용
+            models.Index(
+                fields=["category", "-created_at", "-id"],
+                name="posts_category_created_id_idx",
+            ),
+            # 이미지 처리 대기열 조회용
+            models.Index(
+                fields=["id"],
+                name="posts_image_pending_idx",
+                condition=models.Q(image_status="pending"),
+            ),
+        ]
 
     @property
     def html_content(self):
-        """마크다운 내용을 HTML로 변환"""
-        return markdown.markdown(
-            escape(self.content),
-            extensions=[
-                'markdown.extensions.fenced_code',
-                'markdown.extensions.tables',
-                'markdown.extensions.codehilite'
-            ]
-        )
+        """마크다운 내용을 HTML로 변환
+
+        미리 렌더링된 HTML이 현재 content와 일치하면 그대로 사용하고,
+        아직 렌더링되지 않은 게시글만 즉석에서 변환합니다.
+        """
+        if self.content_hash == make_content_hash(self.content):
+            return self.rendered_html
+        return render_markdown(self.content)
+
+    def render_content(self) -> bool:
+        """content가 바뀐 경우에만 HTML과 요약을 다시 렌더링
+
+        Returns:
+            bool: 다시 렌더링했으면 True
+        """
+        content_hash = make_content_hash(self.content)
+        if self.content_hash == content_hash:
+            return False
+        self.rendered_html = render_markdown(self.content)
+        self.excerpt = make_excerpt(self.rendered_html)
+        self.content_hash = content_hash
+        return True
 
     def increase_views(self):
         """조회수 증가"""
@@ -116,3 +214,60 @@ class Comment(models.Model):
     class Meta:
         db_table = 'comments'
         ordering = ['created_at']
+
+
+class PostRanking(models.Model):
+    """게시글 인기 점수 (미리 계산된 랭킹 테이블)
+
+    score는 시간 감쇠를 반영한 점수로, 활동(조회/좋아요/댓글)이 바뀐
+    게시글만 다시 계산합니다. (posts.ranking 참고)
+    """
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='ranking'
+    )
+    score = models.FloatField(default=0)
+    # 기간 필터용으로 게시글 작성일을 함께 저장
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'post_rankings'
+        indexes = [
+            models.Index(
+                fields=['-score', 'created_at'],
+                name='post_rankings_score_idx',
+            ),
+        ]
+
+
+class JobStatus(models.TextChoices):
+    """백그라운드 작업 상태"""
+    PENDING = 'pending', '대기'
+    RUNNING = 'running', '실행 중'
+    DONE = 'done', '완료'
+    FAILED = 'failed', '실패'
+
+
+class ModerationJob(models.Model):
+    """관리자 일괄 삭제 백그라운드 작업 (posts.moderation 참고)
+
+    상태를 DB에 저장하므로 어느 워커에서든 조회할 수 있고,
+    실행 중에는 batch마다 updated_at을 갱신해 중단된 작업을 알아냅니다.
+    """
+    id = models.CharField(max_length=32, primary_key=True)
+    target = models.CharField(max_length=10)
+    status = models.CharField(
+        max_length=10,
+        choices=JobStatus.choices,
+        default=JobStatus.PENDING
+    )
+    # 삭제한 수 (실행 중에는 지금까지 삭제한 수)
+    result = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'moderation_jobs'
@@ -0,0 +1,258 @@
+"""게시글/댓글 일괄 삭제 (관리자 모더레이션)
+
+ID 목록, 작성자, 작성 시각 범위로 대상을 고르고 객체를 불러오지 않고
+집합 단위 DELETE로 지웁니다. Django의 delete()는 연쇄 삭제할 댓글/좋아요를
+모두 메모리로 불러오므로, 연관 테이블을 먼저 DELETE 한 뒤 본 테이블을
+DELETE 합니다. batch_size개씩 트랜잭션을 나누어 잠금 시간을 짧게 유지합니다.
+
+대상이 MODERATION_SYNC_LIMIT개를 넘으면 백그라운드 작업으로 실행하고
+작업 상태는 ModerationJob 테이블에 저장합니다.
+"""
+import logging
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from posts.counters import count_subquery
+from posts.models import (
+    Comment, JobStatus, Like, ModerationJob, Post, PostRanking
+)
+from posts.ranking import refresh_rankings
+from posts.response_cache import LIST_SCOPE, post_scope, response_cache
+
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+MODERATION_TARGETS = ('posts', 'comments')
+# 한 트랜잭션에서 삭제할 게시글/댓글 수
+MODERATION_BATCH_SIZE = 1000
+# 끝난 작업 기록을 보관하는 시간
+JOB_RETENTION = timedelta(days=1)
+
+
+def moderation_queryset(
+    target: str,
+    ids: Optional[List[int]] = None,
+    author_id: Optional[int] = None,
+    since=None,
+    until=None,
+    board_type: Optional[str] = None
+) -> QuerySet:
+    """삭제 대상 queryset (조건은 모두 AND)"""
+    model = Post if target == 'posts' else Comment
+    queryset = model.objects.all()
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    if author_id is not None:
+        queryset = queryset.filter(author_id=author_id)
+    if since is not None:
+        queryset = queryset.filter(created_at__gte=since)
+    if until is not None:
+        queryset = queryset.filter(created_at__lt=until)
+    if board_type is not None:
+        queryset = queryset.filter(board_type=board_type)
+    return queryset
+
+
+def _raw_delete(queryset: QuerySet) -> int:
+    """Collector 없이 DELETE 한 문장을 실행합니다.
+
+    연쇄 삭제할 행은 호출하는 쪽에서 먼저 지워야 합니다.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+def _next_batch(queryset: QuerySet, batch_size: int) -> List[int]:
+    """다음 batch의 ID를 잠그고 가져옵니다.
+
+    잠근 게시글/댓글에는 삭제하는 동안 새 댓글/좋아요가 추가되지 않습니다.
+    """
+    return list(
+        queryset.select_for_update()
+        .order_by('id')
+        .values_list('id', flat=True)[:batch_size]
+    )
+
+
+def delete_posts(
+    queryset: QuerySet,
+    batch_size: int = MODERATION_BATCH_SIZE,
+    progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """게시글과 그 댓글/좋아요/랭킹을 batch 단위로 삭제합니다.
+
+    Args:
+        progress: batch마다 지금까지 삭제한 수를 받는 함수 (선택)
+
+    Returns:
+        dict: 삭제한 posts, comments, likes 수
+    """
+    deleted = Counter(posts=0, comments=0, likes=0)
+    while True:
+        with transaction.atomic():
+            ids = _next_batch(queryset, batch_size)
+            if not ids:
+                break
+            deleted['likes'] += _raw_delete(Like.objects.filter(post_id__in=ids))
+            deleted['comments'] += _raw_delete(
+                Comment.objects.filter(post_id__in=ids)
+            )
+            _raw_delete(PostRanking.objects.filter(post_id__in=ids))
+            deleted['posts'] += _raw_delete(Post.objects.filter(id__in=ids))
+        response_cache.invalidate(LIST_SCOPE)
+        response_cache.forget(*(post_scope(post_id) for post_id in ids))
+        if progress:
+            progress(dict(deleted))
+    return dict(deleted)
+
+
+def delete_comments(
+    queryset: QuerySet,
+    batch_size: int = MODERATION_BATCH_SIZE,
+    progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """댓글과 그 대댓글을 batch 단위로 삭제하고 게시글 댓글 수를 보정합니다.
+
+    Args:
+        progress: batch마다 지금까지 삭제한 수를 받는 함수 (선택)
+
+    Returns:
+        dict: 삭제한 comments 수 (함께 삭제된 대댓글 포함)
+    """
+    deleted = 0
+    while True:
+        with transaction.atomic():
+            ids = _next_batch(queryset, batch_size)
+            if not ids:
+                break
+            targets = Comment.objects.filter(
+                Q(id__in=ids) | Q(parent_id__in=ids)
+            )
+            post_ids = set(targets.values_list('post_id', flat=True).distinct())
+            deleted += _raw_delete(targets)
+            Post.objects.filter(id__in=post_ids).update(
+                comment_count=count_subquery(Comment)
+            )
+        refresh_rankings(post_ids)
+        response_cache.invalidate(
+            LIST_SCOPE, *(post_scope(post_id) for post_id in post_ids)
+        )
+        if progress:
+            progress({'comments': deleted})
+    return {'comments': deleted}
+
+
+def run_moderation(
+    target: str,
+    batch_size: int = MODERATION_BATCH_SIZE,
+    progress: Optional[Callable[[dict], None]] = None,
+    **criteria
+) -> dict:
+    """조건에 맞는 게시글/댓글을 삭제합니다. (criteria는 moderation_queryset 참고)"""
+    queryset = moderation_queryset(target, **criteria)
+    if target == 'posts':
+        return delete_posts(queryset, batch_size, progress)
+    return delete_comments(queryset, batch_size, progress)
+
+
+class ModerationJobs:
+    """백그라운드 삭제 작업 실행과 상태 조회
+
+    MODERATION_BACKEND
+        local: 프로세스 안의 스레드에서 실행
+        sync: 요청 안에서 바로 실행 (테스트용)
+    상태는 ModerationJob 테이블에 저장하므로 어느 워커에서든 조회할 수 있습니다.
+    실행 중인 작업은 batch마다 updated_at을 갱신하고, MODERATION_JOB_TIMEOUT(초)
+    동안 갱신이 없으면 실행하던 프로세스가 중단된 것으로 보고 failed로 바꿉니다.
+    """
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 상태 {"id", "status", "target", "result"} (없으면 None)"""
+        job = ModerationJob.objects.filter(id=job_id).first()
+        if job is None:
+            return None
+        if self._is_stale(job):
+            ModerationJob.objects.filter(
+                id=job.id, updated_at=job.updated_at
+            ).update(status=JobStatus.FAILED, updated_at=timezone.now())
+            logger.error('일괄 삭제 작업 %s이 중단되었습니다.', job.id)
+            job.status = JobStatus.FAILED
+        return self._as_dict(job)
+
+    def start(self, target: str, **criteria) -> str:
+        """작업을 예약하고 작업 ID를 반환합니다."""
+        ModerationJob.objects.filter(
+            created_at__lt=timezone.now() - JOB_RETENTION
+        ).delete()
+        job = ModerationJob.objects.create(id=uuid.uuid4().hex, target=target)
+        if settings.MODERATION_BACKEND == 'sync':
+            self._run(job.id, target, criteria)
+            return job.id
+        try:
+            _get_executor().submit(self._run, job.id, target, criteria)
+        except Exception:
+            logger.exception('일괄 삭제 작업 %s을 예약하지 못했습니다.', job.id)
+            self._set(job.id, JobStatus.FAILED)
+        return job.id
+
+    def _run(self, job_id: str, target: str, criteria: dict) -> None:
+        self._set(job_id, JobStatus.RUNNING)
+        try:
+            result = run_moderation(
+                target,
+                progress=lambda deleted: self._set(
+                    job_id, JobStatus.RUNNING, result=deleted
+                ),
+                **criteria
+            )
+        except Exception:
+            logger.exception('일괄 삭제 작업 %s에 실패했습니다.', job_id)
+            self._set(job_id, JobStatus.FAILED)
+        else:
+            self._set(job_id, JobStatus.DONE, result=result)
+        finally:
+            # 요청 밖의 스레드이므로 연결을 직접 정리
+            if settings.MODERATION_BACKEND != 'sync':
+                connection.close()
+
+    def _set(self, job_id: str, status: str, **fields) -> None:
+        ModerationJob.objects.filter(id=job_id).update(
+            status=status, updated_at=timezone.now(), **fields
+        )
+
+    @staticmethod
+    def _is_stale(job: ModerationJob) -> bool:
+        timeout = timedelta(seconds=settings.MODERATION_JOB_TIMEOUT)
+        return (
+            job.status in (JobStatus.PENDING, JobStatus.RUNNING)
+            and job.updated_at < timezone.now() - timeout
+        )
+
+    @staticmethod
+    def _as_dict(job: ModerationJob) -> dict:
+        data = {'id': job.id, 'status': job.status, 'target': job.target}
+        if job.result is not None:
+            data['result'] = job.result
+        return data
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 같은 행을 두고 작업끼리 잠금 경쟁하지 않도록 한 번에 하나씩 실행
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='moderation'
+        )
+    return _executor
+
+
+moderation_jobs = ModerationJobs()
@@ -0,0 +1,90 @@
+import math
+from typing import Iterable, Optional
+
+from django.utils import timezone
+
+from posts.models import Post, PostRanking
+from posts.response_cache import RANKING_SCOPE, response_cache
+
+
+# 활동별 가중치
+VIEW_WEIGHT = 1
+LIKE_WEIGHT = 5
+COMMENT_WEIGHT = 3
+# 점수가 절반으로 줄어드는 시간 (시간 감쇠)
+HALF_LIFE_HOURS = 24
+
+
+def compute_score(views: int, likes: int, comments: int, created_at) -> float:
+    """시간 감쇠를 반영한 인기 점수를 계산합니다.
+
+    engagement * 2^(-(now - created_at) / half_life) 순서와 같은 순서를 갖도록
+    log2(1 + engagement) + created_at / half_life 형태로 저장합니다.
+    현재 시각이 점수에 들어가지 않으므로 시간이 지나도 다시 계산할 필요가 없고,
+    활동이 바뀐 게시글만 갱신하면 됩니다.
+    """
+    engagement = (
+        views * VIEW_WEIGHT
+        + likes * LIKE_WEIGHT
+        + comments * COMMENT_WEIGHT
+    )
+    half_life = HALF_LIFE_HOURS * 3600
+    return math.log2(1 + engagement) + created_at.timestamp() / half_life
+
+
+def refresh_rankings(
+    post_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 500
+) -> int:
+    """게시글 인기 점수를 다시 계산해 랭킹 테이블에 반영합니다.
+
+    Args:
+        post_ids: 갱신할 게시글 ID 목록 (None이면 전체)
+        batch_size: 한 번에 저장할 행 수
+
+    Returns:
+        int: 갱신한 게시글 수
+    """
+    queryset = Post.objects.all()
+    if post_ids is not None:
+        post_ids = list(post_ids)
+        if not post_ids:
+            return 0
+        queryset = queryset.filter(id__in=post_ids)
+
+    rows = queryset.values_list(
+        'id', 'views', 'like_count', 'comment_count', 'created_at'
+    )
+
+    now = timezone.now()
+    updated = 0
+    batch = []
+    for post_id, views, likes, comments, created_at in rows.iterator(
+        chunk_size=batch_size
+    ):
+        batch.append(PostRanking(
+            post_id=post_id,
+            score=compute_score(views, likes, comments, created_at),
+            created_at=created_at,
+            updated_at=now,
+        ))
+        if len(batch) >= batch_size:
+            updated += _save(batch)
+
+    updated += _save(batch)
+    if updated:
+        response_cache.invalidate(RANKING_SCOPE)
+    return updated
+
+
+def _save(batch) -> int:
+    count = len(batch)
+    if count:
+        PostRanking.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['post'],
+            update_fields=['score', 'created_at', 'updated_at'],
+        )
+        batch.clear()
+    return count
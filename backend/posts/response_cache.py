@@ -0,0 +1,264 @@
+import hashlib
+import math
+import time
+from functools import wraps
+from typing import Callable, Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+
+# 게시글 목록(게시판, 인기글 등) 전체에 적용되는 무효화 범위
+LIST_SCOPE = 'posts'
+# 인기 점수(랭킹)가 바뀔 때 무효화되는 범위 (조회수 반영 등)
+RANKING_SCOPE = 'rankings'
+
+
+def post_scope(post_id: int) -> str:
+    """게시글 하나에 대한 무효화 범위"""
+    return f'post:{post_id}'
+
+
+class ResponseCache:
+    """읽기 API 응답 캐시
+
+    캐시 키에 범위(scope)별 세대 번호를 포함하고, 쓰기가 일어나면 해당 범위의
+    세대 번호만 올려 이전 응답을 한 번에 무효화합니다. 키를 찾아 지울 필요가
+    없어 Redis, 파일, 로컬 메모리 백엔드 모두 같은 방식으로 동작합니다.
+    (여러 프로세스가 캐시를 공유하려면 redis 또는 file 백엔드를 사용)
+    """
+
+    @property
+    def timeout(self) -> int:
+        return settings.RESPONSE_CACHE_TIMEOUT
+
+    def _generation(self, scope: str) -> int:
+        key = f'gen:{scope}'
+        generation = cache.get(key)
+        if generation is None:
+            # 세대 번호가 사라졌다면 이전 번호와 겹치지 않도록 시각으로 시작
+            cache.add(key, time.time_ns(), timeout=None)
+            generation = cache.get(key)
+        return generation
+
+    def _modified(self, scope: str, seed: Optional[Callable] = None) -> float:
+        key = f'modified:{scope}'
+        modified = cache.get(key)
+        if modified is None:
+            # 변경 시각을 모르면 seed(예: 게시글 updated_at) 또는 현재 시각으로 시작
+            cache.add(key, seed() if seed else time.time(), timeout=None)
+            modified = cache.get(key)
+        return modified
+
+    def key(self, endpoint: str, request, scopes: Iterable[str]) -> str:
+        """엔드포인트, 쿼리 파라미터(커서 포함), 범위별 세대로 캐시 키를 만듭니다."""
+        generations = ':'.join(
+            str(self._generation(scope)) for scope in scopes
+        )
+        params = sorted(request.query_params.lists())
+        digest = hashlib.md5(repr(params).encode()).hexdigest()
+        return f'resp:{endpoint}:{generations}:{digest}'
+
+    def validators(
+        self,
+        request,
+        scopes: Iterable[str],
+        seed: Optional[Callable] = None
+    ) -> Tuple[str, int]:
+        """조건부 GET에 사용할 ETag와 Last-Modified를 계산합니다.
+
+        범위별 세대 번호와 마지막 변경 시각만 사용하므로 DB를 조회하거나
+        응답을 직렬화하지 않고도 계산할 수 있습니다.
+
+        Args:
+            request: 요청 (로그인 사용자는 is_liked 등이 달라 ETag에 사용자 포함)
+            scopes: 응답이 의존하는 무효화 범위 목록
+            seed: 변경 시각이 캐시에 없을 때 사용할 timestamp를 반환하는 함수
+
+        Returns:
+            tuple: (약한 ETag, Last-Modified timestamp)
+        """
+        scopes = list(scopes)
+        generations = ':'.join(
+            str(self._generation(scope)) for scope in scopes
+        )
+        viewer = request.user.id if request.user.is_authenticated else ''
+        digest = hashlib.md5(f'{generations}:{viewer}'.encode()).hexdigest()
+        last_modified = max(self._modified(scope, seed) for scope in scopes)
+        return f'W/"{digest}"', math.ceil(last_modified)
+
+    def settled(self, scopes: Iterable[str]) -> bool:
+        """범위가 마지막으로 바뀐 뒤 replica 복제 지연 시간이 지났는지
+
+        replica에서 읽은 응답은 방금 쓴 내용이 아직 반영되지 않았을 수 있으므로
+        지연 시간(REPLICA_PIN_SECONDS) 안에는 캐시하거나 검증자를 붙이지 않습니다.
+        """
+        lag = replica_lag()
+        if not lag:
+            return True
+        now = time.time()
+        return all(now - self._modified(scope) >= lag for scope in scopes)
+
+    def get(self, key: str):
+        return cache.get(key)
+
+    def set(self, key: str, data) -> None:
+        cache.set(key, data, timeout=self.timeout)
+
+    # async View용: redis/file 백엔드 호출이 이벤트 루프를 막지 않도록 스레드에서
+    # 실행합니다. 캐시만 사용하므로 DB 연결을 쓰는 스레드와 섞지 않습니다.
+
+    async def akey(self, endpoint: str, request, scopes: Iterable[str]) -> str:
+        return await sync_to_async(self.key, thread_sensitive=False)(
+            endpoint, request, list(scopes)
+        )
+
+    async def avalidators(
+        self,
+        request,
+        scopes: Iterable[str],
+        seed: Optional[Callable] = None
+    ) -> Tuple[str, int]:
+        # seed는 DB를 조회할 수 있으므로 DB 연결을 쓰는 스레드에서 실행
+        return await sync_to_async(
+            self.validators, thread_sensitive=seed is not None
+        )(request, list(scopes), seed=seed)
+
+    async def asettled(self, scopes: Iterable[str]) -> bool:
+        return await sync_to_async(self.settled, thread_sensitive=False)(
+            list(scopes)
+        )
+
+    async def aget(self, key: str):
+        return await sync_to_async(self.get, thread_sensitive=False)(key)
+
+    async def aset(self, key: str, data) -> None:
+        await sync_to_async(self.set, thread_sensitive=False)(key, data)
+
+    def invalidate(self, *scopes: str) -> None:
+        """범위의 세대 번호를 올려 해당 범위의 캐시된 응답을 무효화합니다."""
+        now = time.time()
+        for scope in scopes:
+            cache.set(f'modified:{scope}', now, timeout=None)
+            key = f'gen:{scope}'
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, time.time_ns(), timeout=None)
+
+    def forget(self, *scopes: str) -> None:
+        """삭제된 대상의 범위 키를 지웁니다.
+
+        세대 번호가 없어지면 새 번호(현재 시각)로 다시 시작하므로 이전 응답은
+        더 이상 사용되지 않습니다. 많은 게시글을 한 번에 삭제할 때 범위마다
+        키를 새로 쓰는 invalidate 대신 사용합니다.
+        """
+        cache.delete_many([
+            f'{prefix}:{scope}'
+            for scope in scopes
+            for prefix in ('gen', 'modified')
+        ])
+
+    def invalidate_post(self, post_id: int) -> None:
+        """게시글 상세와 게시글 목록 응답을 무효화합니다."""
+        self.invalidate(LIST_SCOPE, post_scope(post_id))
+
+
+response_cache = ResponseCache()
+
+
+def replica_lag() -> int:
+    """replica를 사용할 때 허용하는 복제 지연 시간 (초, replica가 없으면 0)"""
+    if not settings.DATABASE_REPLICAS:
+        return 0
+    return settings.REPLICA_PIN_SECONDS
+
+
+def cache_response(endpoint: str, scopes=lambda request, **kwargs: [LIST_SCOPE]):
+    """비로그인 GET 응답을 캐시하는 async APIView 메서드 데코레이터
+
+    로그인 사용자의 응답은 사용자별 상태(is_liked 등)를 포함하므로 캐시하지 않습니다.
+
+    Args:
+        endpoint: 캐시 키에 사용할 엔드포인트 이름
+        scopes: (request, **kwargs) -> 무효화 범위 목록
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(view, request, *args, **kwargs):
+            if request.user.is_authenticated:
+                return await method(view, request, *args, **kwargs)
+
+            response_scopes = scopes(request, **kwargs)
+            key = await response_cache.akey(endpoint, request, response_scopes)
+            data = await response_cache.aget(key)
+            if data is not None:
+                return Response(data)
+
+            response = await method(view, request, *args, **kwargs)
+            if (
+                response.status_code == status.HTTP_200_OK
+                and await response_cache.asettled(response_scopes)
+            ):
+                await response_cache.aset(key, response.data)
+            return response
+        return wrapper
+    return decorator
+
+
+def not_modified(request, validators: Tuple[str, int]):
+    """If-None-Match/If-Modified-Since가 일치하면 304 응답을, 아니면 None을 반환합니다."""
+    etag, last_modified = validators
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+def set_validators(response, validators: Tuple[str, int]):
+    """200 응답에 ETag/Last-Modified 헤더를 설정합니다.
+
+    replica 복제 지연 시간 안에 바뀐 응답은 오래된 내용일 수 있으므로 설정하지 않습니다.
+    """
+    etag, last_modified = validators
+    lag = replica_lag()
+    if response.status_code == status.HTTP_200_OK and (
+        not lag or time.time() - last_modified >= lag
+    ):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+def conditional_response(scopes=lambda request, **kwargs: [LIST_SCOPE]):
+    """ETag/Last-Modified 조건부 GET을 처리하는 async APIView 메서드 데코레이터
+
+    검증자는 무효화 범위의 세대 번호로 계산하므로 응답이 바뀌지 않았다면
+    조회와 직렬화 없이 304 Not Modified를 반환합니다.
+    cache_response보다 바깥쪽에 적용합니다.
+
+    Args:
+        scopes: (request, **kwargs) -> 무효화 범위 목록
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(view, request, *args, **kwargs):
+            validators = await response_cache.avalidators(
+                request, scopes(request, **kwargs)
+            )
+            response = not_modified(request, validators)
+            if response is not None:
+                return response
+            return set_validators(
+                await method(view, request, *args, **kwargs), validators
+            )
+        return wrapper
+    return decorator
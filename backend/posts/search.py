@@ -0,0 +1,115 @@
+import re
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from django.db.models import (
+    Case,
+    CharField,
+    IntegerField,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast
+from django.db.models.lookups import IContains
+from django.utils.html import escape
+
+
+# 검색 결과 하이라이트 스니펫 앞뒤로 보여줄 글자 수
+SNIPPET_RADIUS = 60
+# 제목 일치를 본문 일치보다 높게 평가하는 가중치
+TITLE_WEIGHT = 2
+# 관련도를 정수로 저장할 배율 (소수점 4자리까지 구분)
+RANK_SCALE = 10000
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class ILikeContains(IContains):
+    """컬럼을 UPPER()로 감싸지 않는 icontains
+
+    Django의 icontains는 PostgreSQL에서 UPPER("title"::text) LIKE UPPER(%s)로
+    컴파일되어 컬럼에 만든 pg_trgm 인덱스를 쓰지 못합니다. PostgreSQL에서는
+    "title" ILIKE %s로 비교하고, 다른 DB에서는 icontains와 같게 동작합니다.
+    """
+
+    lookup_name = 'ilike_contains'
+
+    def as_postgresql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs_sql} ILIKE {rhs_sql}', (*lhs_params, *rhs_params)
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+
+def search_filter(query: str) -> Q:
+    """제목 또는 본문에 검색어가 포함된 게시글 조건
+
+    PostgreSQL에서는 ILIKE로 비교하므로 title/content의 pg_trgm GIN 인덱스
+    (posts_title_trgm_idx, posts_content_trgm_idx)가 검색을 처리하고,
+    형태소 분석이 필요한 한국어도 부분 일치로 인덱스를 탈 수 있습니다.
+    (LC_CTYPE가 C인 데이터베이스에서는 한글 trigram이 추출되지 않습니다.)
+    """
+    return Q(title__ilike_contains=query) | Q(content__ilike_contains=query)
+
+
+def annotate_rank(queryset: QuerySet, query: str) -> QuerySet:
+    """검색 관련도(search_rank)를 annotate 합니다.
+
+    PostgreSQL은 trigram 단어 유사도로, 그 외 DB는 제목/본문 일치 여부로
+    점수를 매깁니다. 어느 쪽이든 제목 일치가 더 높은 점수를 받습니다.
+    점수는 RANK_SCALE배 한 정수로 반올림합니다. 유사도는 real(float4)이라
+    커서에 담았다가 JSON으로 되돌린 값과 정확히 비교되지 않아 페이지 경계에서
+    행을 건너뛰거나 반복할 수 있으므로, 키셋 비교는 정수로 합니다.
+    """
+    if connections[queryset.db].vendor == 'postgresql':
+        similarity = (
+            TrigramWordSimilarity(query, 'title') * TITLE_WEIGHT
+            + TrigramWordSimilarity(query, 'content')
+        )
+        # PostgreSQL은 실수를 정수로 CAST할 때 반올림
+        rank = Cast(similarity * RANK_SCALE, IntegerField())
+    else:
+        rank = Case(
+            When(
+                title__icontains=query,
+                then=Value((TITLE_WEIGHT + 1) * RANK_SCALE)
+            ),
+            default=Value(RANK_SCALE),
+            output_field=IntegerField()
+        )
+    return queryset.annotate(search_rank=rank)
+
+
+def highlight(content: str, query: str) -> str:
+    """본문에서 검색어 주변을 잘라 <mark>로 강조한 HTML 스니펫을 만듭니다.
+
+    본문에 검색어가 없으면(제목만 일치) 본문 앞부분을 반환합니다.
+    """
+    if not query:
+        return escape(content[:SNIPPET_RADIUS * 2])
+
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    match = pattern.search(content)
+    if not match:
+        return escape(content[:SNIPPET_RADIUS * 2])
+
+    start = max(match.start() - SNIPPET_RADIUS, 0)
+    end = min(match.end() + SNIPPET_RADIUS, len(content))
+    window = content[start:end]
+
+    parts = []
+    position = 0
+    for found in pattern.finditer(window):
+        parts.append(escape(window[position:found.start()]))
+        parts.append(f'<mark>{escape(found.group())}</mark>')
+        position = found.end()
+    parts.append(escape(window[position:]))
+
+    prefix = '…' if start > 0 else ''
+    suffix = '…' if end < len(content) else ''
+    return prefix + ''.join(parts) + suffix
@@ -1,10 +1,104 @@
 from rest_framework import serializers
+
+from core.serialization import compile_serializer
 from posts.models import Post, Like, Comment, BoardType
-from users.serializers import UserSerializer
+from posts.search import highlight
+from users.models import User
+from users.serializers import UserSerializer, UserSummarySerializer
 from django.core.exceptions import ValidationError
 from django.conf import settings
 
 
+class ImageVariantsField(serializers.JSONField):
+    """크기별 이미지 변형을 srcset용 {이름: {"url", "width"}} 형태로 표시"""
+
+    def to_representation(self, value):
+        storage = Post._meta.get_field('image').storage
+        return {
+            label: {
+                'url': storage.url(variant['name']),
+                'width': variant['width'],
+            }
+            for label, variant in (value or {}).items()
+        }
+
+
+class ViewerStateField(serializers.BooleanField):
+    """현재 사용자 상태(좋아요 여부 등)를 표시하는 필드
+
+    뷰가 context['viewer_state']로 넘긴 {상태 이름: 게시글 ID 집합}에서
+    찾기만 하므로 게시글마다 쿼리를 실행하지 않습니다.
+    (posts.viewer_state.load_viewer_state 참고)
+    """
+
+    def __init__(self, state, **kwargs):
+        self.state = state
+        kwargs.setdefault('source', 'id')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        viewer_state = self.context.get('viewer_state') or {}
+        return value in viewer_state.get(self.state, ())
+
+
+class ThumbnailField(serializers.Field):
+    """목록용 썸네일 URL (thumbnail 변형이 아직 없으면 원본 이미지)"""
+    # image_variants 외에 image 컬럼도 읽음 (core.base_service.serializer_columns)
+    extra_sources = ('image',)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', 'image_variants')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        return instance.image_variants, instance.image
+
+    def to_representation(self, value):
+        variants, image = value
+        thumbnail = (variants or {}).get('thumbnail')
+        if thumbnail:
+            return image.storage.url(thumbnail['name'])
+        return image.url if image else None
+
+
+class FieldSelectionMixin:
+    """요청한 필드만 직렬화하는 Mixin
+
+    serializer(..., fields=('id', 'title'))처럼 필드 이름을 넘기면
+    나머지 필드는 제외합니다. PostService.shape_queryset에도 같은 fields를
+    넘기면 선택한 필드의 컬럼만 조회합니다.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls, raw):
+        """?fields=id,title 값을 정렬된 필드 이름 튜플로 변환합니다.
+
+        Returns:
+            tuple | None: 필드 이름 (값이 없으면 None)
+
+        Raises:
+            ValidationError: 존재하지 않는 필드를 요청한 경우
+        """
+        if not raw:
+            return None
+        names = {name.strip() for name in raw.split(',') if name.strip()}
+        unknown = names - set(cls.Meta.fields)
+        if unknown:
+            raise ValidationError({
+                'fields': f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+            })
+        # 커서 페이지네이션과 사용자 상태 조회에 id가 필요
+        return tuple(sorted(names | {'id'}))
+
+
 class PostSerializer(serializers.ModelSerializer):
     """게시글 조회를 위한 Serializer
     
@@ -13,6 +107,9 @@ class PostSerializer(serializers.ModelSerializer):
     """
     # 작성자 정보를 중첩하여 표시 (UserSerializer 사용)
     author = UserSerializer(read_only=True)
+    # 크기별 이미지 (목록은 thumbnail/card, 상세는 full 사용)
+    image_variants = ImageVariantsField(read_only=True)
+    is_liked = ViewerStateField('liked')  # 현재 사용자의 좋아요 여부
 
     class Meta:
         model = Post
@@ -24,11 +121,74 @@ class PostSerializer(serializers.ModelSerializer):
             'board_type',    # 추가
             'category',      # 추가
             'image',         # 추가
+            'image_variants',  # 크기별 이미지 (srcset)
+            'image_status',  # 이미지 처리 상태
+            'views',        # 조회수
+            'like_count',   # 좋아요 수
+            'comment_count',  # 댓글 수
+            'is_liked',     # 현재 사용자 좋아요 여부
             'created_at',   # 작성일
             'updated_at'    # 수정일
         ]
         # 자동으로 설정되는 필드들은 읽기 전용
-        read_only_fields = ['id', 'author', 'created_at', 'updated_at']
+        read_only_fields = [
+            'id', 'author', 'image_variants', 'image_status', 'views',
+            'like_count', 'comment_count', 'is_liked', 'created_at', 'updated_at'
+        ]
+        # 조회 시 함께 가져올 관계 (PostService.shape_queryset에서 사용)
+        select_related = ['author']
+        # 페이지 단위로 미리 조회할 사용자 상태 (PostService.load_viewer_state)
+        viewer_state = ['liked']
+
+
+class PostFeedSerializer(FieldSelectionMixin, serializers.ModelSerializer):
+    """게시글 목록(피드)용 경량 Serializer
+
+    본문(content) 대신 미리 만든 평문 요약(excerpt)과 썸네일, 작성자 요약만
+    포함하므로 글 길이와 관계없이 목록 응답 크기가 일정합니다.
+    모든 필드가 컬럼에 대응해 shape_queryset이 content 없이 조회합니다.
+    """
+    author = UserSummarySerializer(read_only=True)
+    thumbnail = ThumbnailField()
+    is_liked = ViewerStateField('liked')
+
+    class Meta:
+        model = Post
+        fields = [
+            'id',
+            'title',
+            'excerpt',        # 본문 요약 (평문)
+            'thumbnail',      # 썸네일 URL
+            'author',         # 작성자 요약
+            'board_type',
+            'category',
+            'views',
+            'like_count',
+            'comment_count',
+            'is_liked',
+            'created_at',
+        ]
+        read_only_fields = fields
+        select_related = ['author']
+        viewer_state = ['liked']
+
+
+class SearchHighlightField(serializers.CharField):
+    """본문에서 검색어(context['search']) 주변을 강조한 스니펫"""
+
+    def to_representation(self, value):
+        return highlight(value, self.context.get('search'))
+
+
+class PostSearchSerializer(PostSerializer):
+    """게시글 검색 결과 Serializer
+
+    PostSerializer에 검색어가 강조된 본문 스니펫(highlight)을 추가
+    """
+    highlight = SearchHighlightField(source='content', read_only=True)
+
+    class Meta(PostSerializer.Meta):
+        fields = PostSerializer.Meta.fields + ['highlight']
 
 
 class PostCreateUpdateSerializer(serializers.ModelSerializer):
@@ -92,17 +252,18 @@ class CommentSerializer(serializers.ModelSerializer):
             'id', 'author', 'reply_count', 
             'replies', 'created_at', 'updated_at'
         ]
-
-    def get_reply_count(self, obj):
-        """대댓글 수를 계산합니다."""
-        return obj.replies.count()
+        select_related = ['author']
 
     def get_replies(self, obj):
-        """대댓글 목록을 가져옵니다."""
+        """대댓글 목록을 가져옵니다.
+
+        PostService.get_comment_tree로 prefetch된 경우 추가 쿼리가 없습니다.
+        """
         # 첫 레벨 댓글인 경우에만 대댓글을 포함
-        if obj.parent is None:
-            replies = obj.replies.all()
-            return CommentSerializer(replies, many=True).data
+        if obj.parent_id is None:
+            return compile_serializer(CommentSerializer).serialize(
+                obj.replies.all()
+            )
         return []
 
 
@@ -113,8 +274,7 @@ class PostDetailSerializer(serializers.ModelSerializer):
     작성자 정보, 좋아요 수, HTML 변환된 내용을 포함합니다.
     """
     author = UserSerializer(read_only=True)
-    like_count = serializers.IntegerField(read_only=True)  # 좋아요 수
-    is_liked = serializers.SerializerMethodField()  # 현재 사용자의 좋아요 여부
+    is_liked = ViewerStateField('liked')  # 현재 사용자의 좋아요 여부
     html_content = serializers.CharField(read_only=True)  # 마크다운 -> HTML
     comments = CommentSerializer(many=True, read_only=True)  # 댓글 목록
 
@@ -127,23 +287,58 @@ class PostDetailSerializer(serializers.ModelSerializer):
             'html_content', # HTML 변환된 내용
             'author',       # 작성자 정보
             'like_count',   # 좋아요 수
+            'comment_count',  # 댓글 수
             'is_liked',     # 현재 사용자 좋아요 여부
             'comments',     # 댓글 목록
             'created_at',   # 작성일
             'updated_at'    # 수정일
         ]
         read_only_fields = [
-            'id', 'author', 'like_count', 'is_liked',
+            'id', 'author', 'like_count', 'comment_count', 'is_liked',
             'html_content', 'comments', 'created_at', 'updated_at'
         ]
+        select_related = ['author']
+        viewer_state = ['liked']
+
 
-    def get_like_count(self, obj):
-        """게시글의 좋아요 수를 계산합니다."""
-        return obj.likes.count()
+class ModerationSerializer(serializers.Serializer):
+    """일괄 삭제 요청 검증 (조건은 모두 AND)"""
+    target = serializers.ChoiceField(choices=['posts', 'comments'])
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=10000
+    )
+    author = serializers.CharField(required=False)  # 사용자 이름
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    board_type = serializers.ChoiceField(
+        choices=BoardType.choices, required=False
+    )
+    dry_run = serializers.BooleanField(default=False)
 
-    def get_is_liked(self, obj):
-        """현재 사용자의 좋아요 여부를 확인합니다."""
-        user = self.context['request'].user
-        if user.is_authenticated:
-            return obj.likes.filter(user=user).exists()
-        return False
\ No newline at end of file
+    def validate_author(self, value):
+        author_id = User.objects.filter(username=value).values_list(
+            'id', flat=True
+        ).first()
+        if author_id is None:
+            raise serializers.ValidationError('존재하지 않는 사용자입니다.')
+        return author_id
+
+    def validate(self, data):
+        if not any(name in data for name in ('ids', 'author', 'since', 'until')):
+            raise serializers.ValidationError(
+                'ids, author, since, until 중 하나 이상을 지정해주세요.'
+            )
+        if 'board_type' in data and data['target'] != 'posts':
+            raise serializers.ValidationError({
+                'board_type': '게시글을 삭제할 때만 사용할 수 있습니다.'
+            })
+        if 'since' in data and 'until' in data and data['since'] >= data['until']:
+            raise serializers.ValidationError({
+                'until': 'until은 since보다 늦어야 합니다.'
+            })
+        if 'author' in data:
+            data['author_id'] = data.pop('author')
+        return data
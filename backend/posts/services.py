@@ -1,12 +1,22 @@
-from typing import List, Optional
+from datetime import timedelta
+from typing import List, Optional, Tuple
 from django.core.exceptions import ValidationError
-from django.db.models import Q
-from PIL import Image
-from io import BytesIO
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.utils import timezone
+from django.db import connection, transaction
+from django.db.models import Count, F, Prefetch, QuerySet
+from django.db.models.functions import Greatest
 
 from core.base_service import BaseService
-from posts.models import Post, Like, Comment, BoardType
+from posts.images import enqueue_image
+from posts.models import (
+    Post, Like, Comment, BoardType, ImageStatus,
+    render_markdown, make_content_hash, make_excerpt
+)
+from posts.ranking import refresh_rankings
+from posts.response_cache import response_cache
+from posts.search import annotate_rank, search_filter
+from posts.view_counter import view_counter
+from posts.viewer_state import load_viewer_state
 from users.models import User
 
 
@@ -17,6 +27,14 @@ class PostService(BaseService[Post]):
     게시글 관련 추가 비즈니스 로직을 구현합니다.
     """
     model = Post
+    # 검색 결과는 관련도 순으로 페이지네이션
+    search_cursor_fields = ('search_rank', 'id')
+
+    def delete(self, instance: Post) -> None:
+        """게시글을 삭제하고 캐시된 응답을 무효화합니다."""
+        post_id = instance.id
+        super().delete(instance)
+        response_cache.invalidate_post(post_id)
 
     def get_user_posts(self, user: User) -> List[Post]:
         """특정 사용자가 작성한 게시글 목록을 조회합니다.
@@ -38,7 +56,7 @@ class PostService(BaseService[Post]):
         Returns:
             List[Post]: 최근 게시글 목록
         """
-        return self.get_queryset().order_by('-created_at')[:limit]
+        return self.get_queryset().order_by('-created_at', '-id')[:limit]
 
     def create_post(
         self, 
@@ -47,26 +65,72 @@ class PostService(BaseService[Post]):
         content: str,
         **extra_fields
     ) -> Post:
-        """새 게시글을 생성합니다."""
-        # 제목 길이 검증
-        if len(title) < 2:
-            raise ValidationError({"title": "제목은 최소 2자 이상이어야 합니다."})
-        
-        # 내용 길이 검증 (방명록은 제외)
-        board_type = extra_fields.get('board_type', BoardType.FREE)
-        if board_type != BoardType.GUEST and len(content) < 10:
-            raise ValidationError({"content": "내용은 최소 10자 이상이어야 합니다."})
+        """새 게시글을 생성합니다.
+
+        이미지가 있으면 원본을 먼저 저장하고(image_status=pending),
+        커밋 후 백그라운드에서 최적화해 교체합니다.
+        """
+        self.validate_post(
+            title, content, extra_fields.get('board_type', BoardType.FREE)
+        )
 
-        # 이미지 최적화
-        if 'image' in extra_fields and extra_fields['image']:
-            extra_fields['image'] = self.optimize_image(extra_fields['image'])
+        # 이미지는 원본 그대로 저장하고 최적화는 백그라운드에서 처리
+        has_image = bool(extra_fields.get('image'))
+        if has_image:
+            extra_fields['image_status'] = ImageStatus.PENDING
         
-        return self.create(
+        rendered_html = render_markdown(content)
+        post = self.create(
             author=author,
             title=title,
             content=content,
+            rendered_html=rendered_html,
+            excerpt=make_excerpt(rendered_html),
+            content_hash=make_content_hash(content),
             **extra_fields
         )
+        refresh_rankings([post.id])
+        response_cache.invalidate_post(post.id)
+        if has_image:
+            transaction.on_commit(lambda: enqueue_image(post.id))
+        return post
+
+    @staticmethod
+    def validate_post(title: str, content: str, board_type: str) -> None:
+        """게시글 제목/내용 규칙을 검증합니다.
+
+        Raises:
+            ValidationError: 제목이 2자 미만이거나 내용이 10자 미만인 경우
+                (방명록은 내용 길이 제한 없음)
+        """
+        # 제목 길이 검증
+        if len(title) < 2:
+            raise ValidationError({"title": "제목은 최소 2자 이상이어야 합니다."})
+
+        # 내용 길이 검증 (방명록은 제외)
+        if board_type != BoardType.GUEST and len(content) < 10:
+            raise ValidationError({"content": "내용은 최소 10자 이상이어야 합니다."})
+
+    def update(self, instance: Post, **kwargs) -> Post:
+        """게시글을 수정합니다.
+
+        content가 실제로 바뀐 경우에만 HTML을 다시 렌더링하고,
+        새 이미지가 있으면 백그라운드 처리를 예약합니다.
+        """
+        if 'content' in kwargs:
+            instance.content = kwargs['content']
+            instance.render_content()
+
+        # 새 이미지는 원본으로 저장하고 백그라운드에서 최적화
+        has_image = bool(kwargs.get('image'))
+        if has_image:
+            kwargs['image_status'] = ImageStatus.PENDING
+
+        post = super().update(instance, **kwargs)
+        response_cache.invalidate_post(post.id)
+        if has_image:
+            transaction.on_commit(lambda: enqueue_image(post.id))
+        return post
 
     def search_posts(
         self, 
@@ -76,6 +140,9 @@ class PostService(BaseService[Post]):
     ) -> List[Post]:
         """게시글 검색
         
+        검색어가 있으면 관련도(search_rank) 순, 없으면 최신순으로 정렬합니다.
+        검색어로 조회한 결과는 search_cursor_fields로 페이지네이션해야 합니다.
+
         Args:
             query: 검색어
             board_type: 게시판 유형
@@ -90,12 +157,12 @@ class PostService(BaseService[Post]):
             queryset = queryset.filter(category=category)
             
         if query:
-            queryset = queryset.filter(
-                Q(title__icontains=query) |
-                Q(content__icontains=query)
+            queryset = annotate_rank(
+                queryset.filter(search_filter(query)), query
             )
+            return queryset.order_by('-search_rank', '-id')
             
-        return queryset.order_by('-created_at')
+        return queryset.order_by('-created_at', '-id')
 
     def get_posts_by_date_range(
         self, 
@@ -112,37 +179,143 @@ class PostService(BaseService[Post]):
 
     def get_popular_posts(self, days: int = 7, limit: int = 10) -> List[Post]:
         """인기 게시글을 조회합니다.
-        (나중에 좋아요/조회수 기능 추가 시 구현)
+
+        조회수/좋아요/댓글 수에 시간 감쇠를 적용해 미리 계산해 둔
+        랭킹 테이블(PostRanking)에서 점수 순으로 가져옵니다.
+
+        Args:
+            days: 최근 며칠 동안 작성된 게시글을 대상으로 할지 (기본값: 7)
+            limit: 조회할 게시글 수 (기본값: 10)
+        """
+        since = timezone.now() - timedelta(days=days)
+        return self.filter(
+            ranking__created_at__gte=since
+        ).order_by('-ranking__score')[:limit]
+
+    def record_view(
+        self,
+        post_id: int,
+        views: int,
+        viewer: Optional[str] = None
+    ) -> int:
+        """게시글 조회를 집계하고 대략적인 현재 조회수를 반환합니다.
+
+        조회수는 view_counter에 모았다가 주기적으로 일괄 반영하므로,
+        DB 값에 아직 반영되지 않은 증가분을 더해 반환합니다.
+        (이번 조회로 flush되어도 views를 읽을 때 미반영이던 증가분을 더함)
+
+        Args:
+            post_id: 조회한 게시글 ID
+            views: DB에 저장된 조회수
+            viewer: 중복 조회 판단용 사용자/IP 키
         """
-        # TODO: 좋아요/조회수 기준으로 수정
-        return self.get_recent_posts(limit)
+        return views + view_counter.record(post_id, viewer)
 
-    def toggle_like(self, post: Post, user: User) -> bool:
+    def load_viewer_state(
+        self,
+        user: User,
+        posts,
+        serializer_class,
+        fields: Optional[tuple] = None
+    ) -> dict:
+        """serializer가 선언한 사용자 상태를 posts 전체에 대해 한 번에 조회합니다.
+
+        serializer의 Meta.viewer_state에 선언된 상태마다 쿼리 한 번을 실행하며,
+        결과는 serializer context['viewer_state']로 넘깁니다.
+        fields로 일부 필드만 직렬화하면 선택된 상태 필드만 조회합니다.
+        """
+        names = getattr(serializer_class.Meta, 'viewer_state', ())
+        if fields is not None:
+            selected = serializer_class(fields=fields).fields.values()
+            states = {getattr(field, 'state', None) for field in selected}
+            names = [name for name in names if name in states]
+        return load_viewer_state(user, [post.id for post in posts], names)
+
+    def toggle_like(self, post: Post, user: User) -> Tuple[bool, int]:
         """게시글 좋아요 토글
         
+        PostgreSQL에서는 삭제, INSERT ... ON CONFLICT DO NOTHING, 카운터 갱신을
+        쿼리 한 번(데이터 변경 CTE)으로 처리하므로 연속 클릭이나 동시 요청에도
+        IntegrityError 없이 일관된 결과를 반환합니다.
+        
         Args:
             post: 좋아요/취소할 게시글
             user: 요청한 사용자
             
         Returns:
-            bool: True면 좋아요 생성, False면 좋아요 취소
+            Tuple[bool, int]: (좋아요 상태, 갱신된 좋아요 수)
             
         Raises:
             ValidationError: 자신의 게시글에 좋아요를 시도할 경우
         """
-        if post.author == user:
+        if post.author_id == user.id:
             raise ValidationError("자신의 게시글에는 좋아요할 수 없습니다.")
-            
-        like, created = Like.objects.get_or_create(
-            post=post,
-            user=user,
-            defaults={'post': post, 'user': user}
-        )
-        
-        if not created:  # 이미 좋아요가 있으면 취소
-            like.delete()
-            
-        return created
+
+        if connection.vendor == 'postgresql':
+            liked, like_count = self._toggle_like_single_statement(post, user)
+        else:
+            liked, like_count = self._toggle_like_atomic(post, user)
+
+        refresh_rankings([post.id])
+        response_cache.invalidate_post(post.id)
+        return liked, like_count
+
+    def _toggle_like_single_statement(self, post: Post, user: User):
+        """삭제/추가/카운터 갱신을 하나의 SQL 문으로 실행 (PostgreSQL)
+
+        이미 좋아요가 있으면 삭제하고, 없으면 추가합니다. 동시에 다른 요청이
+        먼저 추가한 경우 ON CONFLICT로 무시하고 좋아요 상태로 응답합니다.
+        """
+        sql = f"""
+            WITH deleted AS (
+                DELETE FROM {Like._meta.db_table}
+                WHERE post_id = %(post_id)s AND user_id = %(user_id)s
+                RETURNING 1
+            ), inserted AS (
+                INSERT INTO {Like._meta.db_table} (post_id, user_id, created_at)
+                SELECT %(post_id)s, %(user_id)s, %(now)s
+                WHERE NOT EXISTS (SELECT 1 FROM deleted)
+                ON CONFLICT (post_id, user_id) DO NOTHING
+                RETURNING 1
+            )
+            UPDATE {Post._meta.db_table}
+            SET like_count = GREATEST(
+                like_count
+                + (SELECT COUNT(*) FROM inserted)
+                - (SELECT COUNT(*) FROM deleted),
+                0
+            )
+            WHERE id = %(post_id)s
+            RETURNING NOT EXISTS (SELECT 1 FROM deleted), like_count
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {
+                'post_id': post.id,
+                'user_id': user.id,
+                'now': timezone.now(),
+            })
+            row = cursor.fetchone()
+        return (row[0], row[1]) if row else (False, 0)
+
+    def _toggle_like_atomic(self, post: Post, user: User):
+        """같은 동작을 한 트랜잭션 안의 여러 쿼리로 실행 (그 외 DB)"""
+        with transaction.atomic():
+            deleted, _ = Like.objects.filter(post=post, user=user).delete()
+            if deleted:
+                delta = -1
+            else:
+                # 동시에 추가된 경우 get_or_create가 기존 행을 반환
+                _, created = Like.objects.get_or_create(post=post, user=user)
+                delta = 1 if created else 0
+
+            if delta:
+                self.filter(id=post.id).update(
+                    like_count=Greatest(F('like_count') + delta, 0)
+                )
+            like_count = self.filter(id=post.id).values_list(
+                'like_count', flat=True
+            ).first() or 0
+        return not deleted, like_count
 
     def add_comment(
         self, 
@@ -165,23 +338,63 @@ class PostService(BaseService[Post]):
         Raises:
             ValidationError: 댓글 내용이 비어있거나, 부모 댓글이 존재하지 않는 경우
         """
-        if not content.strip():
-            raise ValidationError({"content": "댓글 내용을 입력해주세요."})
+        self.validate_comment(content)
 
         # 대댓글인 경우 부모 댓글 확인
         parent = None
         if parent_id:
             parent = Comment.objects.filter(id=parent_id, post=post).first()
-            if not parent:
-                raise ValidationError({"parent": "존재하지 않는 댓글입니다."})
-            if parent.parent:  # 대댓글의 대댓글 방지
-                raise ValidationError({"parent": "대댓글에는 답글을 달 수 없습니다."})
+            self.validate_parent(parent)
 
-        return Comment.objects.create(
-            post=post,
-            author=author,
-            content=content,
-            parent=parent
+        with transaction.atomic():
+            comment = Comment.objects.create(
+                post=post,
+                author=author,
+                content=content,
+                parent=parent
+            )
+            self.filter(id=post.id).update(comment_count=F('comment_count') + 1)
+
+        refresh_rankings([post.id])
+        response_cache.invalidate_post(post.id)
+        return comment
+
+    @staticmethod
+    def validate_comment(content: Optional[str]) -> None:
+        """댓글 내용이 비어 있으면 ValidationError"""
+        if not isinstance(content, str) or not content.strip():
+            raise ValidationError({"content": "댓글 내용을 입력해주세요."})
+
+    @staticmethod
+    def validate_parent(parent: Optional[Comment]) -> None:
+        """대댓글의 부모 댓글을 검증합니다.
+
+        Args:
+            parent: 같은 게시글에서 찾은 부모 댓글 (없으면 None)
+
+        Raises:
+            ValidationError: 부모 댓글이 없거나 부모 댓글도 대댓글인 경우
+        """
+        if not parent:
+            raise ValidationError({"parent": "존재하지 않는 댓글입니다."})
+        if parent.parent_id:  # 대댓글의 대댓글 방지
+            raise ValidationError({"parent": "대댓글에는 답글을 달 수 없습니다."})
+
+    def get_comment_tree(self, post: Post) -> QuerySet[Comment]:
+        """게시글의 최상위 댓글 queryset (대댓글 포함)
+
+        최상위 댓글은 작성자를 join하고 대댓글 수(reply_count)를 annotate하며,
+        대댓글은 작성자와 함께 한 번의 쿼리로 prefetch 합니다.
+        페이지 단위로 평가하면 댓글 수와 관계없이 쿼리 2번으로 트리가 완성됩니다.
+        """
+        replies = Comment.objects.select_related('author').annotate(
+            reply_count=Count('replies')
+        )
+        return (
+            Comment.objects.filter(post=post, parent=None)
+            .select_related('author')
+            .annotate(reply_count=Count('replies'))
+            .prefetch_related(Prefetch('replies', queryset=replies))
         )
 
     def update_comment(
@@ -211,6 +424,7 @@ class PostService(BaseService[Post]):
             
         comment.content = content
         comment.save()
+        response_cache.invalidate_post(comment.post_id)
         return comment
 
     def delete_comment(self, comment: Comment, author: User) -> None:
@@ -226,62 +440,32 @@ class PostService(BaseService[Post]):
         if comment.author != author:
             raise ValidationError("댓글 작성자만 삭제할 수 있습니다.")
             
-        comment.delete()
+        with transaction.atomic():
+            # 대댓글도 함께 삭제되므로 실제 삭제된 댓글 수만큼 감소
+            _, deleted = comment.delete()
+            removed = deleted.get('posts.Comment', 0)
+            self.filter(id=comment.post_id).update(
+                comment_count=Greatest(F('comment_count') - removed, 0)
+            )
+
+        refresh_rankings([comment.post_id])
+        response_cache.invalidate_post(comment.post_id)
 
     def get_tech_posts(self, category=None):
         """기술 블로그 글 목록"""
         queryset = self.filter(board_type=BoardType.TECH)
         if category:
             queryset = queryset.filter(category=category)
-        return queryset.order_by('-created_at')
+        return queryset.order_by('-created_at', '-id')
     
     def get_free_posts(self):
         """자유게시판 글 목록"""
         return self.filter(
             board_type=BoardType.FREE
-        ).order_by('-created_at')
+        ).order_by('-created_at', '-id')
     
     def get_guest_posts(self):
         """방명록 목록"""
         return self.filter(
             board_type=BoardType.GUEST
-        ).order_by('-created_at')
-    
-    def optimize_image(
-        self, 
-        image: InMemoryUploadedFile, 
-        max_size: int = 800
-    ) -> InMemoryUploadedFile:
-        """이미지 최적화
-        
-        - 이미지 리사이징 (max_size 기준)
-        - WebP 포맷으로 변환
-        - 품질 최적화
-        """
-        img = Image.open(image)
-        
-        # 리사이징
-        if img.width > max_size or img.height > max_size:
-            ratio = min(max_size/img.width, max_size/img.height)
-            new_size = (int(img.width * ratio), int(img.height * ratio))
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
-        
-        # WebP로 변환
-        output = BytesIO()
-        if img.mode in ('RGBA', 'LA'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[-1])
-            img = background
-        
-        img.save(output, format='WebP', quality=85, optimize=True)
-        output.seek(0)
-        
-        return InMemoryUploadedFile(
-            output,
-            'ImageField',
-            f"{image.name.split('.')[0]}.webp",
-            'image/webp',
-            output.getbuffer().nbytes,
-            None
-        )
-  
\ No newline at end of file
+        ).order_by('-created_at', '-id')
@@ -1,10 +1,66 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from decimal import Decimal
+import csv
+from concurrent.futures import Future
+import gzip
+import json
+from io import BytesIO, StringIO
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, router
+from django.http import HttpResponse
+from django.test import (
+    AsyncClient,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings
+)
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.renderers import JSONRenderer
+from PIL import Image
+from rest_framework.test import APIClient, APIRequestFactory
 
+from core.db_router import ReplicaPinningMiddleware, background_writes
+from core.pagination import decode_cursor
+from core.renderers import FastJSONRenderer
+from core.serialization import compile_serializer
+from users.authentication import user_cache
 from users.models import User
-from posts.models import Post, Comment, Like
+from users.serializers import UserSerializer
+from users.tokens import RefreshToken
+from posts.bulk_import import BulkImporter
+from posts.images import _invalidate_if_replaced, process_post_image
+from posts.models import (
+    Post, PostRanking, Comment, Like, ImageStatus, ModerationJob
+)
+from posts.ranking import compute_score
+from posts.search import search_filter
+from posts.serializers import (
+    CommentSerializer,
+    PostFeedSerializer,
+    PostSearchSerializer,
+    PostSerializer
+)
+from posts.services import PostService
+from posts.view_counter import view_counter
+from posts.views import (
+    CommentListCreateView,
+    FreeBoardView,
+    PopularPostsView,
+    PostDetailView,
+    PostListCreateView
+)
 
 
 class PostTests(TestCase):
@@ -82,15 +138,1447 @@ class PostTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Like.objects.count(), 1)
         self.assertTrue(response.data['liked'])
+        self.assertEqual(response.data['like_count'], 1)
         
         # 좋아요 취소
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(Like.objects.count(), 0)
         self.assertFalse(response.data['liked'])
+        self.assertEqual(response.data['like_count'], 0)
 
     def test_like_own_post(self):
         """자신의 게시글 좋아요 시도 테스트"""
         url = reverse('post-like', kwargs={'pk': self.post.id})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PostPaginationTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='pageuser',
+            email='page@example.com',
+            password='testpass123'
+        )
+        # created_at이 같은 게시글도 id로 순서가 정해지는지 확인하기 위해 일괄 생성
+        Post.objects.bulk_create([
+            Post(title=f'Post {i}', content='Test Content', author=self.user)
+            for i in range(25)
+        ])
+
+    def test_cursor_pages_cover_all_posts(self):
+        """커서를 따라가면 모든 게시글을 중복 없이 조회"""
+        url = reverse('post-list')
+        seen = []
+        cursor = None
+        while True:
+            params = {'size': 10}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen += [post['id'] for post in response.data['results']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                break
+
+        expected = list(
+            Post.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 400 응답"""
+        url = reverse('post-list')
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_query_count_is_constant(self):
+        """페이지 크기와 관계없이 목록 조회 쿼리 수가 일정"""
+        other = User.objects.create_user(
+            username='pageuser2',
+            email='page2@example.com',
+            password='testpass123'
+        )
+        Post.objects.bulk_create([
+            Post(title=f'Other {i}', content='Test Content', author=other)
+            for i in range(5)
+        ])
+        url = reverse('post-list')
+        for size in (5, 30):
+            with self.assertNumQueries(1):
+                response = self.client.get(url, {'size': size})
+            self.assertEqual(len(response.data['results']), size)
+
+
+class PostRenderTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.user = User.objects.create_user(
+            username='renderuser',
+            email='render@example.com',
+            password='testpass123'
+        )
+        self.service = PostService()
+
+    def test_create_post_stores_html(self):
+        """게시글 생성 시 HTML을 미리 렌더링"""
+        post = self.service.create_post(
+            author=self.user,
+            title='Render',
+            content='# Title\n\nbody text'
+        )
+        self.assertIn('<h1>Title</h1>', post.rendered_html)
+        self.assertEqual(post.html_content, post.rendered_html)
+
+    def test_update_rerenders_only_changed_content(self):
+        """content가 바뀐 경우에만 다시 렌더링"""
+        post = self.service.create_post(
+            author=self.user,
+            title='Render',
+            content='# Title\n\nbody text'
+        )
+        post.rendered_html = 'cached'
+        self.service.update(post, title='Renamed', content=post.content)
+        self.assertEqual(post.rendered_html, 'cached')
+
+        self.service.update(post, content='# Changed\n\nbody text')
+        self.assertIn('<h1>Changed</h1>', post.rendered_html)
+
+    def test_render_posts_command_backfills(self):
+        """render_posts 명령으로 기존 게시글 일괄 렌더링"""
+        post = Post.objects.create(
+            title='Legacy',
+            content='**bold** content',
+            author=self.user
+        )
+        self.assertEqual(post.rendered_html, '')
+
+        call_command('render_posts', batch_size=1, stdout=StringIO())
+        post.refresh_from_db()
+        self.assertIn('<strong>bold</strong>', post.rendered_html)
+
+    def test_tech_post_api_renders_excerpt(self):
+        """기술 블로그 작성 API도 서비스로 생성 (요약, 랭킹 포함)"""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.post(reverse('tech-posts'), {
+            'title': 'Tech',
+            'content': '**Django** tips'
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        post = Post.objects.get(id=response.data['id'])
+        self.assertEqual(post.category, 'tech')
+        self.assertEqual(post.excerpt, 'Django tips')
+        self.assertTrue(PostRanking.objects.filter(post=post).exists())
+
+
+@override_settings(VIEW_COUNT_FLUSH_THRESHOLD=100, VIEW_COUNT_FLUSH_INTERVAL=3600)
+class PostViewCountTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='viewuser',
+            email='view@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(
+            title='Viewed Post',
+            content='Test Content',
+            author=self.user
+        )
+        self.url = reverse('post-detail', kwargs={'pk': self.post.id})
+        view_counter.clear()
+        self.addCleanup(view_counter.clear)
+
+    def test_views_are_buffered(self):
+        """조회수는 모았다가 일괄 반영하고, 응답에는 현재 조회수 표시"""
+        for expected in (1, 2, 3):
+            response = self.client.get(self.url)
+            self.assertEqual(response.data['views'], expected)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        self.assertEqual(view_counter.flush(), 3)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 3)
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=2)
+    def test_flush_on_threshold(self):
+        """누적 증가분이 임계값에 도달하면 즉시 반영 (flush한 응답도 조회수 유지)"""
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['views'], 2)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 2)
+
+    @override_settings(VIEW_COUNT_DEDUP_WINDOW=60)
+    def test_dedup_window(self):
+        """중복 조회 방지 시간 내 같은 사용자의 반복 조회는 한 번만 집계"""
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.assertEqual(view_counter.pending(self.post.id), 1)
+
+
+@override_settings(VIEW_COUNT_FLUSH_THRESHOLD=100, VIEW_COUNT_FLUSH_INTERVAL=0.1)
+class ViewCountTimerTests(TransactionTestCase):
+    """백그라운드 스레드의 주기 반영 (다른 스레드에서 보이도록 커밋되는 테스트)"""
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        user = User.objects.create_user(
+            username='timeruser',
+            email='timer@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(
+            title='Timer', content='Test Content', author=user
+        )
+        view_counter.clear()
+        self.addCleanup(view_counter.clear)
+
+    def test_timer_flushes_without_later_views(self):
+        """이후 조회가 없어도 flush 주기가 지나면 반영"""
+        view_counter.start()
+        self.addCleanup(view_counter.stop)
+        view_counter.record(self.post.id)
+
+        deadline = time.monotonic() + 5
+        while view_counter.pending(self.post.id) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        view_counter.stop()
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 1)
+
+
+class PopularPostsTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.service = PostService()
+        self.author = User.objects.create_user(
+            username='popauthor',
+            email='pop@example.com',
+            password='testpass123'
+        )
+        self.readers = [
+            User.objects.create_user(
+                username=f'reader{i}',
+                email=f'reader{i}@example.com',
+                password='testpass123'
+            )
+            for i in range(3)
+        ]
+        # 나중에 작성한 quiet가 시간 점수에서 앞서므로 순서는 활동량으로만 정해짐
+        self.hot = self.service.create_post(
+            author=self.author, title='Hot', content='Hot content here!!'
+        )
+        self.quiet = self.service.create_post(
+            author=self.author, title='Quiet', content='Quiet content here'
+        )
+
+    def test_popular_posts_ordered_by_engagement(self):
+        """좋아요/댓글이 많은 게시글이 먼저 조회"""
+        for reader in self.readers:
+            self.service.toggle_like(self.hot, reader)
+        self.service.add_comment(self.hot, self.readers[0], 'Nice')
+
+        response = self.client.get(reverse('popular-posts'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [post['id'] for post in response.data],
+            [self.hot.id, self.quiet.id]
+        )
+
+    def test_recent_activity_outweighs_old_activity(self):
+        """오래된 게시글은 시간 감쇠로 점수가 낮아짐"""
+        now = timezone.now()
+        old = compute_score(100, 0, 0, now - timedelta(days=5))
+        fresh = compute_score(10, 0, 0, now)
+        self.assertGreater(fresh, old)
+
+    def test_popular_posts_window(self):
+        """기간 밖의 게시글은 제외"""
+        self.assertEqual(
+            list(self.service.get_popular_posts(days=0)),
+            []
+        )
+
+
+class PostSearchTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='searchuser',
+            email='search@example.com',
+            password='testpass123'
+        )
+        self.body_match = Post.objects.create(
+            title='장고 입문',
+            content='이 글은 파이썬 웹 프레임워크를 다룹니다.',
+            author=self.user
+        )
+        self.title_match = Post.objects.create(
+            title='파이썬 테스트 코드',
+            content='테스트는 중요합니다.',
+            author=self.user
+        )
+        Post.objects.create(
+            title='러스트',
+            content='소유권 개념 정리',
+            author=self.user
+        )
+
+    def test_search_ranks_title_matches_first(self):
+        """제목 일치가 본문 일치보다 먼저 조회"""
+        response = self.client.get(reverse('post-list'), {'search': '파이썬'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [post['id'] for post in response.data['results']],
+            [self.title_match.id, self.body_match.id]
+        )
+
+    def test_search_highlight(self):
+        """검색 결과에 검색어가 강조된 스니펫 포함"""
+        response = self.client.get(reverse('post-list'), {'search': '파이썬'})
+        body = response.data['results'][1]
+        self.assertIn('<mark>파이썬</mark>', body['highlight'])
+
+    def test_search_pagination(self):
+        """관련도 순 검색 결과도 커서로 이어서 조회"""
+        url = reverse('post-list')
+        first = self.client.get(url, {'search': '파이썬', 'size': 1})
+        # 관련도는 정수로 커서에 담겨 페이지 경계에서 정확히 비교
+        rank, _ = decode_cursor(first.data['next_cursor'], 2)
+        self.assertIsInstance(rank, int)
+        second = self.client.get(url, {
+            'search': '파이썬',
+            'size': 1,
+            'cursor': first.data['next_cursor']
+        })
+        self.assertEqual(second.data['results'][0]['id'], self.body_match.id)
+        self.assertIsNone(second.data['next_cursor'])
+
+    def test_search_is_case_insensitive(self):
+        """영문 검색어는 대소문자를 구분하지 않음"""
+        post = Post.objects.create(
+            title='Django ORM', content='QuerySet 정리', author=self.user
+        )
+        response = self.client.get(reverse('post-list'), {'search': 'queryset'})
+        self.assertEqual(
+            [item['id'] for item in response.data['results']], [post.id]
+        )
+
+    @skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 전용')
+    def test_search_filter_uses_ilike(self):
+        """pg_trgm 인덱스를 타도록 컬럼을 UPPER()로 감싸지 않음"""
+        sql = str(Post.objects.filter(search_filter('파이썬')).query)
+        self.assertIn('"posts"."title" ILIKE', sql)
+        self.assertIn('"posts"."content" ILIKE', sql)
+        self.assertNotIn('UPPER', sql)
+
+
+TEST_MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=TEST_MEDIA_ROOT, IMAGE_PROCESSING_BACKEND='queue')
+class PostImageTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(TEST_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='imageuser',
+            email='image@example.com',
+            password='testpass123'
+        )
+        self.client.force_authenticate(user=self.user)
+        # 파일명이 겹치면 저장소가 이름을 바꾸므로 테스트마다 비움
+        self.addCleanup(shutil.rmtree, TEST_MEDIA_ROOT, ignore_errors=True)
+
+    def _upload(self, size=(1600, 1200)):
+        buffer = BytesIO()
+        Image.new('RGB', size, (200, 50, 50)).save(buffer, format='PNG')
+        return SimpleUploadedFile(
+            'photo.png', buffer.getvalue(), content_type='image/png'
+        )
+
+    def test_upload_is_processed_in_background(self):
+        """원본을 먼저 저장하고 워커가 최적화 이미지로 교체"""
+        response = self.client.post(reverse('post-list'), {
+            'title': 'Image Post',
+            'content': 'Post with an image',
+            'image': self._upload()
+        }, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['image_status'], ImageStatus.PENDING)
+
+        post = Post.objects.get(id=response.data['id'])
+        raw_name = post.image.name
+        self.assertTrue(raw_name.endswith('.png'))
+
+        call_command('process_images', once=True, stdout=StringIO())
+
+        post.refresh_from_db()
+        self.assertEqual(post.image_status, ImageStatus.READY)
+        self.assertTrue(post.image.name.endswith('.webp'))
+        self.assertFalse(post.image.storage.exists(raw_name))
+        with Image.open(post.image.path) as img:
+            self.assertEqual(img.format, 'WEBP')
+            self.assertEqual(max(img.size), 800)
+
+    def test_responsive_variants(self):
+        """크기별 변형을 만들고 상세 응답에 srcset용 URL, 목록에 썸네일 제공"""
+        self.client.post(reverse('post-list'), {
+            'title': 'Image Post',
+            'content': 'Post with an image',
+            'image': self._upload()
+        }, format='multipart')
+        call_command('process_images', once=True, stdout=StringIO())
+        post = Post.objects.get()
+
+        response = self.client.get(
+            reverse('post-detail', kwargs={'pk': post.id})
+        )
+        variants = response.data['image_variants']
+        self.assertEqual(
+            {label: variant['width'] for label, variant in variants.items()},
+            {'full': 800, 'card': 480, 'thumbnail': 240}
+        )
+        for variant in post.image_variants.values():
+            self.assertTrue(post.image.storage.exists(variant['name']))
+
+        response = self.client.get(reverse('post-list'))
+        self.assertEqual(
+            response.data['results'][0]['thumbnail'],
+            variants['thumbnail']['url']
+        )
+        self.assertTrue(variants['thumbnail']['url'].endswith('_thumbnail.webp'))
+
+    def test_stale_processing_is_reclaimed(self):
+        """처리 도중 중단된 이미지는 다시 대기열에 넣어 처리"""
+        response = self.client.post(reverse('post-list'), {
+            'title': 'Image Post',
+            'content': 'Post with an image',
+            'image': self._upload()
+        }, format='multipart')
+        Post.objects.filter(id=response.data['id']).update(
+            image_status=ImageStatus.PROCESSING,
+            image_claimed_at=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command('process_images', once=True, stdout=StringIO())
+        post = Post.objects.get(id=response.data['id'])
+        self.assertEqual(post.image_status, ImageStatus.READY)
+
+    def test_processed_image_invalidates_cached_detail(self):
+        """워커가 이미지를 교체하면 캐시된 상세 응답도 갱신"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        response = self.client.post(reverse('post-list'), {
+            'title': 'Image Post',
+            'content': 'Post with an image',
+            'image': self._upload()
+        }, format='multipart')
+        # 상세 응답은 비로그인 사용자만 캐시
+        url = reverse('post-detail', kwargs={'pk': response.data['id']})
+        self.assertEqual(
+            APIClient().get(url).data['image_status'], ImageStatus.PENDING
+        )
+
+        call_command('process_images', once=True, stdout=StringIO())
+        self.assertEqual(
+            APIClient().get(url).data['image_status'], ImageStatus.READY
+        )
+
+    def test_local_pool_result_invalidates_in_web_process(self):
+        """로컬 풀 작업이 끝나면 웹 프로세스 콜백에서 캐시를 무효화"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        response = self.client.post(reverse('post-list'), {
+            'title': 'Image Post',
+            'content': 'Post with an image',
+            'image': self._upload()
+        }, format='multipart')
+        post_id = response.data['id']
+        url = reverse('post-detail', kwargs={'pk': post_id})
+        APIClient().get(url)
+
+        # 워커 프로세스에서 처리한 것처럼 캐시 무효화 없이 교체
+        future = Future()
+        future.set_result(process_post_image(post_id))
+        self.assertEqual(
+            APIClient().get(url).data['image_status'], ImageStatus.PENDING
+        )
+
+        _invalidate_if_replaced(post_id, future)
+        self.assertEqual(
+            APIClient().get(url).data['image_status'], ImageStatus.READY
+        )
+
+
+class CommentTreeTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.users = [
+            User.objects.create_user(
+                username=f'commenter{i}',
+                email=f'commenter{i}@example.com',
+                password='testpass123'
+            )
+            for i in range(3)
+        ]
+        self.post = Post.objects.create(
+            title='Discussion',
+            content='Test Content',
+            author=self.users[0]
+        )
+        self.url = reverse('comment-list', kwargs={'post_id': self.post.id})
+
+    def _create_tree(self, parents, replies_per_parent):
+        for i in range(parents):
+            parent = Comment.objects.create(
+                post=self.post,
+                author=self.users[i % 3],
+                content=f'Parent {i}'
+            )
+            Comment.objects.bulk_create([
+                Comment(
+                    post=self.post,
+                    author=self.users[j % 3],
+                    parent=parent,
+                    content=f'Reply {i}-{j}'
+                )
+                for j in range(replies_per_parent)
+            ])
+
+    def test_comment_tree_query_count_is_constant(self):
+        """댓글 수와 관계없이 트리 조회 쿼리 수가 일정"""
+        self._create_tree(parents=2, replies_per_parent=1)
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+        self._create_tree(parents=8, replies_per_parent=5)
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, {'size': 10})
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_comment_tree_structure(self):
+        """최상위 댓글은 작성순, 대댓글과 대댓글 수 포함"""
+        self._create_tree(parents=3, replies_per_parent=2)
+        response = self.client.get(self.url, {'size': 2})
+        results = response.data['results']
+        self.assertEqual(
+            [comment['content'] for comment in results],
+            ['Parent 0', 'Parent 1']
+        )
+        self.assertEqual(results[0]['reply_count'], 2)
+        self.assertEqual(
+            [reply['content'] for reply in results[0]['replies']],
+            ['Reply 0-0', 'Reply 0-1']
+        )
+
+        response = self.client.get(
+            self.url, {'size': 2, 'cursor': response.data['next_cursor']}
+        )
+        self.assertEqual(
+            [comment['content'] for comment in response.data['results']],
+            ['Parent 2']
+        )
+
+
+class PostCounterTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.service = PostService()
+        self.author = User.objects.create_user(
+            username='counterauthor',
+            email='counter@example.com',
+            password='testpass123'
+        )
+        self.reader = User.objects.create_user(
+            username='counterreader',
+            email='reader@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(
+            title='Counted',
+            content='Test Content',
+            author=self.author
+        )
+
+    def test_like_count_follows_toggle(self):
+        """좋아요 토글에 따라 like_count 증감"""
+        self.assertEqual(self.service.toggle_like(self.post, self.reader), (True, 1))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 1)
+
+        self.assertEqual(self.service.toggle_like(self.post, self.reader), (False, 0))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 0)
+
+    def test_toggle_like_with_existing_like(self):
+        """다른 요청이 먼저 만든 좋아요가 있어도 오류 없이 취소"""
+        Like.objects.create(post=self.post, user=self.reader)
+        Post.objects.filter(id=self.post.id).update(like_count=1)
+
+        liked, like_count = self.service.toggle_like(self.post, self.reader)
+        self.assertFalse(liked)
+        self.assertEqual(like_count, 0)
+        self.assertFalse(Like.objects.exists())
+
+    def test_comment_count_includes_cascaded_replies(self):
+        """댓글 삭제 시 함께 삭제된 대댓글 수도 반영"""
+        parent = self.service.add_comment(self.post, self.reader, 'Parent')
+        self.service.add_comment(self.post, self.author, 'Reply', parent.id)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+
+        self.service.delete_comment(parent, self.reader)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+
+    def test_reconcile_counters_command(self):
+        """reconcile_counters 명령으로 어긋난 카운터 보정"""
+        Like.objects.create(post=self.post, user=self.reader)
+        Comment.objects.create(post=self.post, author=self.reader, content='Hi')
+        Post.objects.filter(id=self.post.id).update(like_count=7)
+
+        out = StringIO()
+        call_command('reconcile_counters', stdout=out)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 1)
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertIn('1개', out.getvalue())
+
+
+class ViewerStateTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            username='stateauthor',
+            email='state@example.com',
+            password='testpass123'
+        )
+        self.reader = User.objects.create_user(
+            username='statereader',
+            email='statereader@example.com',
+            password='testpass123'
+        )
+        Post.objects.bulk_create([
+            Post(title=f'Post {i}', content='Test Content', author=self.author)
+            for i in range(20)
+        ])
+        self.liked_ids = set(
+            Post.objects.order_by('id').values_list('id', flat=True)[::3]
+        )
+        Like.objects.bulk_create([
+            Like(post_id=post_id, user=self.reader) for post_id in self.liked_ids
+        ])
+        self.client.force_authenticate(user=self.reader)
+
+    def test_is_liked_in_list(self):
+        """목록의 좋아요 여부를 페이지 단위로 한 번에 조회"""
+        url = reverse('post-list')
+        for size in (5, 20):
+            with self.assertNumQueries(2):
+                response = self.client.get(url, {'size': size})
+            for post in response.data['results']:
+                self.assertEqual(post['is_liked'], post['id'] in self.liked_ids)
+
+    def test_is_liked_anonymous(self):
+        """비로그인 사용자는 좋아요 조회 없이 False"""
+        self.client.force_authenticate(user=None)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('post-list'))
+        self.assertFalse(any(post['is_liked'] for post in response.data['results']))
+
+
+@override_settings(VIEW_COUNT_FLUSH_THRESHOLD=100, VIEW_COUNT_FLUSH_INTERVAL=3600)
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        view_counter.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(view_counter.clear)
+
+        self.client = APIClient()
+        self.service = PostService()
+        self.author = User.objects.create_user(
+            username='cacheauthor',
+            email='cache@example.com',
+            password='testpass123'
+        )
+        self.reader = User.objects.create_user(
+            username='cachereader',
+            email='cachereader@example.com',
+            password='testpass123'
+        )
+        self.post = self.service.create_post(
+            author=self.author, title='Cached', content='Cached content'
+        )
+
+    def test_list_is_cached_until_write(self):
+        """목록 응답은 캐시되고 쓰기 이벤트가 있으면 무효화"""
+        url = reverse('free-board')
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['comment_count'], 0)
+
+        self.service.add_comment(self.post, self.reader, 'First!')
+        response = self.client.get(url)
+        self.assertEqual(response.data['results'][0]['comment_count'], 1)
+
+    def test_authenticated_list_is_not_cached(self):
+        """로그인 사용자 응답은 사용자별 상태가 있으므로 캐시하지 않음"""
+        self.client.force_authenticate(user=self.reader)
+        url = reverse('free-board')
+        self.client.get(url)
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+    def test_cached_detail_still_counts_views(self):
+        """캐시된 상세 응답도 조회수를 집계"""
+        url = reverse('post-detail', kwargs={'pk': self.post.id})
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data['views'], 2)
+
+        self.service.update(self.post, title='Renamed')
+        response = self.client.get(url)
+        self.assertEqual(response.data['title'], 'Renamed')
+
+    def test_flush_invalidates_cached_detail(self):
+        """조회수를 반영하면 캐시된 상세 응답도 갱신 (조회수가 줄어들지 않음)"""
+        url = reverse('post-detail', kwargs={'pk': self.post.id})
+        self.client.get(url)
+        self.assertEqual(self.client.get(url).data['views'], 2)
+
+        view_counter.flush()
+        self.assertEqual(self.client.get(url).data['views'], 3)
+
+    def test_list_conditional_get(self):
+        """ETag가 일치하면 304, 쓰기 이후에는 새 응답"""
+        url = reverse('free-board')
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.service.toggle_like(self.post, self.reader)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_detail_conditional_get(self):
+        """상세 조회는 Last-Modified로도 304를 반환하고 조회수를 집계"""
+        url = reverse('post-detail', kwargs={'pk': self.post.id})
+        response = self.client.get(url)
+        last_modified = response['Last-Modified']
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(view_counter.pending(self.post.id), 2)
+
+    def test_etag_differs_per_user(self):
+        """로그인 사용자별 응답(is_liked)이 다르므로 ETag도 다름"""
+        url = reverse('free-board')
+        anonymous_etag = self.client.get(url)['ETag']
+        self.client.force_authenticate(user=self.reader)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=anonymous_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class PostFeedTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.service = PostService()
+        self.user = User.objects.create_user(
+            username='feeduser',
+            email='feed@example.com',
+            password='testpass123'
+        )
+        self.post = self.service.create_post(
+            author=self.user,
+            title='Feed Post',
+            content='# Heading\n\nSome **bold** text & more. ' * 20
+        )
+
+    def test_feed_excludes_content(self):
+        """목록은 본문 대신 평문 요약과 작성자 요약을 반환"""
+        response = self.client.get(reverse('free-board'))
+        item = response.data['results'][0]
+        self.assertNotIn('content', item)
+        self.assertEqual(item['excerpt'], self.post.excerpt)
+        self.assertTrue(item['excerpt'].startswith('Heading Some bold text & more.'))
+        self.assertTrue(item['excerpt'].endswith('…'))
+        self.assertEqual(
+            set(item['author']), {'id', 'username', 'profile_image'}
+        )
+        self.assertIsNone(item['thumbnail'])
+
+    def test_feed_query_skips_content(self):
+        """목록 조회 쿼리는 content 컬럼을 읽지 않음"""
+        queryset = self.service.shape_queryset(
+            self.service.get_free_posts(), PostFeedSerializer
+        )
+        self.assertNotIn('content', str(queryset.query).split('FROM')[0])
+
+    def test_fields_parameter(self):
+        """fields로 필요한 필드만 요청"""
+        response = self.client.get(
+            reverse('free-board'), {'fields': 'title,like_count'}
+        )
+        self.assertEqual(
+            set(response.data['results'][0]), {'id', 'title', 'like_count'}
+        )
+
+        response = self.client.get(reverse('free-board'), {'fields': 'password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('fields', response.data['error'])
+
+
+class FastJSONRendererTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.service = PostService()
+        self.user = User.objects.create_user(
+            username='렌더러',
+            email='renderer@example.com',
+            password='testpass123'
+        )
+        self.service.create_post(
+            author=self.user,
+            title='한글 제목',
+            content='본문에 한글과 줄 구분자(\u2028)와 "따옴표"가 있습니다.'
+        )
+
+    def test_matches_default_renderer(self):
+        """기본 JSONRenderer와 같은 바이트를 출력"""
+        posts = self.service.shape_queryset(
+            self.service.get_free_posts(), PostSerializer
+        )
+        data = {
+            'results': PostSerializer(posts, many=True).data,
+            'generated_at': timezone.now(),
+            'score': Decimal('1.50'),
+            1: 'non-string key',
+        }
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+        # orjson이 인코딩하지 못하는 값은 기본 렌더러로 처리
+        data['big'] = 2 ** 70
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+    def test_configured_for_api(self):
+        """API 응답에 FastJSONRenderer 사용"""
+        response = APIClient().get(reverse('free-board'))
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertIn('한글 제목', response.content.decode())
+
+
+class CompiledSerializerTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.service = PostService()
+        self.author = User.objects.create_user(
+            username='parity',
+            email='parity@example.com',
+            password='testpass123',
+            bio='소개글'
+        )
+        self.reader = User.objects.create_user(
+            username='parityreader',
+            email='parityreader@example.com',
+            password='testpass123'
+        )
+        self.post = self.service.create_post(
+            author=self.author,
+            title='일치 확인용 게시글',
+            content='컴파일된 직렬화 결과가 같은지 확인합니다.',
+            board_type='tech',
+            category='python',
+            image='posts/2026/10/17/parity.webp'
+        )
+        self.service.create_post(
+            author=self.reader, title='Second', content='Without an image'
+        )
+        self.service.toggle_like(self.post, self.reader)
+        comment = self.service.add_comment(self.post, self.reader, '댓글')
+        self.service.add_comment(
+            self.post, self.author, '대댓글', parent_id=comment.id
+        )
+
+    def assertParity(self, serializer_class, items, context=None, fields=None):
+        kwargs = {'fields': fields} if fields is not None else {}
+        expected = serializer_class(
+            items, many=True, context=context or {}, **kwargs
+        ).data
+        actual = compile_serializer(serializer_class, fields).serialize(
+            items, context
+        )
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            JSONRenderer().render(actual), JSONRenderer().render(expected)
+        )
+
+    def test_post_serializers(self):
+        """게시글 serializer들과 같은 결과"""
+        posts = list(self.service.filter().order_by('id'))
+        viewer_state = self.service.load_viewer_state(
+            self.reader, posts, PostSerializer
+        )
+        context = {'viewer_state': viewer_state}
+        self.assertParity(PostSerializer, posts, context)
+        self.assertParity(PostFeedSerializer, posts, context)
+        self.assertParity(
+            PostFeedSerializer, posts, context, fields=('id', 'thumbnail')
+        )
+        self.assertParity(
+            PostSearchSerializer, posts, {**context, 'search': '확인'}
+        )
+
+    def test_request_context_urls(self):
+        """request가 있으면 이미지 URL도 같은 절대 URL"""
+        request = APIRequestFactory().get('/')
+        posts = list(self.service.filter().order_by('id'))
+        self.assertParity(PostSerializer, posts, {'request': request})
+        self.assertParity(UserSerializer, [self.author], {'request': request})
+
+    def test_comment_tree(self):
+        """대댓글을 포함한 댓글 트리도 같은 결과"""
+        comments = list(self.service.get_comment_tree(self.post))
+        self.assertParity(CommentSerializer, comments)
+        self.assertTrue(
+            compile_serializer(CommentSerializer).serialize(comments)[0]['replies']
+        )
+        self.assertParity(CommentSerializer, Comment.objects.filter(
+            parent__isnull=False
+        ))
+
+
+@override_settings(DATABASE_REPLICAS=['replica1'], REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTests(SimpleTestCase):
+    """트랜잭션 밖에서 라우팅 결과(queryset.db)만 확인 (replica에 연결하지 않음)"""
+
+    def setUp(self):
+        self.service = PostService()
+        self.factory = RequestFactory()
+
+    def _request(self, view, **cookies):
+        request = self.factory.get('/')
+        request.COOKIES.update(cookies)
+        return ReplicaPinningMiddleware(view)(request)
+
+    def test_service_reads_use_replica(self):
+        """서비스 읽기만 replica, 모델 직접 조회와 쓰기는 primary"""
+        self.assertEqual(self.service.filter(board_type='free').db, 'replica1')
+        self.assertEqual(Post.objects.all().db, 'default')
+        self.assertEqual(
+            self.service.filter(id=1).select_for_update().db, 'default'
+        )
+
+    def test_read_your_writes(self):
+        """쓰기 이후 같은 요청의 읽기는 primary, 다음 요청은 쿠키로 primary"""
+        routed = []
+
+        def view(request):
+            routed.append(self.service.filter().db)
+            router.db_for_write(Post)
+            routed.append(self.service.filter().db)
+            return HttpResponse()
+
+        response = self._request(view)
+        self.assertEqual(routed, ['replica1', 'default'])
+        self.assertEqual(response.cookies['db_pin']['max-age'], 5)
+
+        def read_view(request):
+            routed.append(self.service.filter().db)
+            return HttpResponse()
+
+        response = self._request(read_view, db_pin='1')
+        self.assertEqual(routed[-1], 'default')
+        self.assertNotIn('db_pin', response.cookies)
+
+    def test_background_writes_do_not_pin(self):
+        """조회 요청이 대신 실행한 쓰기(조회수 반영 등)는 primary 고정 안 함"""
+        routed = []
+
+        def view(request):
+            with background_writes():
+                router.db_for_write(Post)
+            routed.append(self.service.filter().db)
+            return HttpResponse()
+
+        response = self._request(view)
+        self.assertEqual(routed, ['replica1'])
+        self.assertNotIn('db_pin', response.cookies)
+
+
+@skipUnless(
+    'replica1' in settings.DATABASES,
+    'replica DB가 필요합니다. (--ds=config.settings_replica_test)'
+)
+@override_settings(DATABASE_REPLICAS=['replica1'], REPLICA_PIN_SECONDS=5)
+class ReplicaDatabaseTests(TransactionTestCase):
+    """primary와 replica를 서로 다른 실제 DB로 두고 어느 DB에서 읽었는지 확인
+
+    복제 지연을 흉내 내기 위해 replica에는 같은 id의 이전 버전 게시글만 넣습니다.
+    (TestCase는 트랜잭션 안에서 실행되어 읽기가 모두 primary로 가므로 사용하지 않음)
+    """
+    databases = {'default', 'replica1'}
+
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(view_counter.clear)
+        self.service = PostService()
+        self.author = User.objects.create_user(
+            username='primaryauthor',
+            email='primary@example.com',
+            password='testpass123'
+        )
+        self.reader = User.objects.create_user(
+            username='primaryreader',
+            email='primaryreader@example.com',
+            password='testpass123'
+        )
+        self.post = Post.objects.create(
+            title='primary', content='최신 내용', author=self.author
+        )
+
+        # 라우터가 replica 마이그레이션을 막아 flush 대상이 아니므로 직접 정리
+        self.addCleanup(User.objects.using('replica1').all().delete)
+        replica_author = User.objects.db_manager('replica1').create_user(
+            username='replicaauthor',
+            email='replica@example.com',
+            password='testpass123'
+        )
+        Post.objects.using('replica1').create(
+            id=self.post.id,
+            title='replica',
+            content='복제 전 내용',
+            author=replica_author
+        )
+
+    def _titles(self):
+        return sorted(self.service.filter().values_list('title', flat=True))
+
+    def test_hinted_reads_use_replica(self):
+        """서비스 읽기는 replica, 모델 직접 조회는 primary에서 읽음"""
+        self.assertEqual(self._titles(), ['replica'])
+        self.assertEqual(
+            list(Post.objects.values_list('title', flat=True)), ['primary']
+        )
+
+    def test_reads_after_write_use_primary(self):
+        """같은 요청에서 쓰기 이후의 읽기는 primary"""
+        titles = []
+
+        def view(request):
+            titles.append(self._titles())
+            Post.objects.create(
+                title='written', content='새 글', author=self.author
+            )
+            titles.append(self._titles())
+            return HttpResponse()
+
+        request = RequestFactory().get('/')
+        response = ReplicaPinningMiddleware(view)(request)
+        self.assertEqual(titles, [['replica'], ['primary', 'written']])
+        self.assertIn('db_pin', response.cookies)
+
+    def test_pin_cookie_reads_primary(self):
+        """db_pin 쿠키가 있는 동안 API 읽기는 primary"""
+        client = APIClient()
+        client.force_authenticate(user=self.reader)
+        url = reverse('post-detail', kwargs={'pk': self.post.id})
+        self.assertEqual(client.get(url).data['title'], 'replica')
+
+        client.cookies['db_pin'] = '1'
+        self.assertEqual(client.get(url).data['title'], 'primary')
+
+    def test_like_reads_post_from_primary(self):
+        """replica에 아직 없는 게시글도 좋아요 가능"""
+        post = Post.objects.create(
+            title='new', content='방금 쓴 글', author=self.author
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.reader)
+        response = client.post(reverse('post-like', kwargs={'pk': post.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['liked'])
+        self.assertIn('db_pin', response.cookies)
+
+
+class AsyncViewTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(view_counter.clear)
+        self.user = User.objects.create_user(
+            username='asyncuser',
+            email='async@example.com',
+            password='testpass123'
+        )
+        self.post = PostService().create_post(
+            author=self.user, title='Async', content='Served by async views'
+        )
+
+    def test_read_views_are_async(self):
+        """읽기 API는 async View (쓰기 핸들러는 스레드에서 실행)"""
+        for view in (PostListCreateView, PostDetailView, PopularPostsView,
+                     CommentListCreateView, FreeBoardView):
+            self.assertTrue(view.view_is_async)
+
+    async def test_async_client(self):
+        """ASGI 요청으로 목록, 상세, 댓글을 조회"""
+        client = AsyncClient()
+        response = await client.get(reverse('free-board'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'][0]['id'], self.post.id)
+
+        response = await client.get(
+            reverse('post-detail', kwargs={'pk': self.post.id})
+        )
+        self.assertEqual(response.json()['title'], 'Async')
+
+        response = await client.get(
+            reverse('comment-list', kwargs={'post_id': self.post.id})
+        )
+        self.assertEqual(response.json()['results'], [])
+
+        response = await client.get(reverse('post-detail', kwargs={'pk': 0}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BulkImportTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='testpass123',
+            is_staff=True
+        )
+        self.writer = User.objects.create_user(
+            username='writer',
+            email='writer@example.com',
+            password='testpass123'
+        )
+        self.url = reverse('post-import')
+
+    def ndjson(self, *rows):
+        return '\n'.join(json.dumps(row, ensure_ascii=False) for row in rows)
+
+    def test_import(self):
+        """게시글과 댓글 트리를 가져오고 잘못된 줄은 보고"""
+        body = self.ndjson(
+            {'type': 'post', 'ref': 'p1', 'author': 'writer',
+             'title': '옛 블로그 글', 'content': '옛 블로그에서 옮긴 글입니다.',
+             'created_at': '2021-03-01T09:00:00+09:00', 'views': 7},
+            {'type': 'post', 'title': '짧음', 'content': '짧다'},
+            {'type': 'comment', 'ref': 'c1', 'post': 'p1', 'content': '댓글'},
+            {'type': 'comment', 'post': 'p1', 'parent': 'c1',
+             'author': 'writer', 'content': '대댓글'},
+            {'type': 'comment', 'post': 'missing', 'content': '고아 댓글'},
+        ) + '\nnot json'
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            self.url, body, content_type='application/x-ndjson'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['posts'], 1)
+        self.assertEqual(response.data['comments'], 2)
+        self.assertEqual(
+            [error['line'] for error in response.data['errors']], [2, 5, 6]
+        )
+        self.assertIn('content', response.data['errors'][0]['error'])
+
+        post = Post.objects.get()
+        self.assertEqual(post.author, self.writer)
+        self.assertEqual(post.views, 7)
+        self.assertEqual(post.comment_count, 2)
+        self.assertEqual(post.created_at.year, 2021)
+        self.assertTrue(post.excerpt)
+        reply = Comment.objects.get(content='대댓글')
+        self.assertEqual(reply.parent.content, '댓글')
+        self.assertEqual(reply.parent.author, self.admin)
+
+    def test_parent_across_chunks(self):
+        """앞 chunk의 댓글과 기존 댓글을 부모로 참조"""
+        post = PostService().create_post(
+            author=self.writer, title='기존 글', content='기존에 있던 게시글 본문'
+        )
+        existing = Comment.objects.create(
+            post=post, author=self.writer, content='기존 댓글'
+        )
+        lines = self.ndjson(
+            {'type': 'comment', 'ref': 'c1', 'post': post.id, 'content': '새 댓글'},
+            {'type': 'comment', 'post': post.id, 'content': '답글 1',
+             'parent': existing.id},
+            {'type': 'comment', 'post': post.id, 'content': '답글 2',
+             'parent': 'c1'},
+            {'type': 'comment', 'post': post.id, 'content': '답글의 답글',
+             'parent': 'c1x'},
+        ).splitlines()
+
+        result = BulkImporter(default_author=self.writer, chunk_size=1).run(lines)
+
+        self.assertEqual(result.comments, 3)
+        self.assertEqual([error['line'] for error in result.errors], [4])
+        self.assertEqual(
+            Comment.objects.get(content='답글 2').parent.content, '새 댓글'
+        )
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, 4)
+
+    def test_admin_only(self):
+        """관리자가 아니면 가져올 수 없음"""
+        self.client.force_authenticate(user=self.writer)
+        response = self.client.post(
+            self.url, self.ndjson({'type': 'post'}),
+            content_type='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ExportTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='testpass123',
+            is_staff=True
+        )
+        self.posts = [
+            PostService().create_post(
+                author=self.admin,
+                title=f'백업 {i}',
+                content=f'내보내기 테스트 본문 {i}, "따옴표"'
+            )
+            for i in range(5)
+        ]
+        Comment.objects.create(
+            post=self.posts[0], author=self.admin, content='댓글'
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def export(self, table, **params):
+        response = self.client.get(
+            reverse('export', kwargs={'table': table}), params
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content)
+
+    def test_ndjson_resume(self):
+        """id 순서로 내보내고 after로 이어서 받기"""
+        rows = [json.loads(line) for line in self.export('posts').splitlines()]
+        self.assertEqual(
+            [row['id'] for row in rows], [post.id for post in self.posts]
+        )
+        self.assertEqual(rows[0]['title'], '백업 0')
+        self.assertEqual(rows[0]['author_id'], self.admin.id)
+
+        body = self.export('posts', after=self.posts[2].id)
+        self.assertEqual(
+            [json.loads(line)['id'] for line in body.splitlines()],
+            [post.id for post in self.posts[3:]]
+        )
+
+    def test_csv_gzip(self):
+        """CSV를 gzip으로 압축해 내보내기"""
+        body = gzip.decompress(self.export('comments', output='csv', gzip='1'))
+        rows = list(csv.reader(body.decode().splitlines()))
+        self.assertEqual(rows[0][:4], ['id', 'post_id', 'author_id', 'parent_id'])
+        self.assertEqual(rows[1][1], str(self.posts[0].id))
+        self.assertEqual(rows[1][3], '')
+        self.assertEqual(len(rows), 2)
+
+    async def test_asgi_stream(self):
+        """ASGI에서는 async iterator로 스트리밍"""
+        self.addCleanup(user_cache.clear)
+        token = RefreshToken.for_user(self.admin).access_token
+        response = await AsyncClient().get(
+            reverse('export', kwargs={'table': 'posts'}),
+            headers={'Authorization': f'Bearer {token}'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertEqual(len(body.splitlines()), 5)
+
+    def test_invalid_requests(self):
+        """관리자 전용, 알 수 없는 테이블/형식 거부"""
+        url = reverse('export', kwargs={'table': 'posts'})
+        self.assertEqual(
+            self.client.get(url, {'output': 'xml'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse('export', kwargs={'table': 'users'})
+            ).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        self.client.force_authenticate(user=None)
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+
+class ModerationTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='testpass123',
+            is_staff=True
+        )
+        self.spammer = User.objects.create_user(
+            username='spammer',
+            email='spam@example.com',
+            password='testpass123'
+        )
+        self.service = PostService()
+        self.post = self.service.create_post(
+            author=self.admin, title='공지', content='정상적인 게시글 본문'
+        )
+        self.spam = [
+            self.service.create_post(
+                author=self.spammer,
+                title=f'광고 {i}',
+                content='스팸',
+                board_type='guest'
+            )
+            for i in range(3)
+        ]
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('moderation')
+
+    def test_delete_posts_by_author(self):
+        """작성자의 게시글을 댓글/좋아요와 함께 삭제"""
+        spam = self.spam[0]
+        comment = self.service.add_comment(spam, self.admin, '신고합니다')
+        self.service.add_comment(spam, self.spammer, '답글', comment.id)
+        self.service.toggle_like(spam, self.admin)
+
+        response = self.client.post(
+            self.url,
+            {'target': 'posts', 'author': 'spammer', 'board_type': 'guest'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['matched'], 3)
+        self.assertEqual(
+            response.data['deleted'], {'posts': 3, 'comments': 2, 'likes': 1}
+        )
+        self.assertEqual(list(Post.objects.all()), [self.post])
+        self.assertFalse(Comment.objects.exists())
+
+    def test_delete_comments(self):
+        """댓글과 대댓글을 삭제하고 댓글 수 보정"""
+        kept = self.service.add_comment(self.post, self.admin, '정상 댓글')
+        spam = self.service.add_comment(self.post, self.spammer, '광고 댓글')
+        self.service.add_comment(self.post, self.admin, '답글', spam.id)
+
+        response = self.client.post(
+            self.url, {'target': 'comments', 'ids': [spam.id]}, format='json'
+        )
+
+        self.assertEqual(response.data['deleted'], {'comments': 2})
+        self.assertEqual(list(Comment.objects.all()), [kept])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+    def test_dry_run_and_validation(self):
+        """dry_run은 삭제하지 않고, 조건 없는 요청은 거부"""
+        response = self.client.post(
+            self.url,
+            {'target': 'posts', 'since': timezone.now() - timedelta(hours=1),
+             'dry_run': True},
+            format='json'
+        )
+        self.assertEqual(response.data, {'matched': 4})
+        self.assertEqual(Post.objects.count(), 4)
+
+        response = self.client.post(
+            self.url, {'target': 'posts'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.spammer)
+        response = self.client.post(
+            self.url, {'target': 'posts', 'author': 'admin'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(MODERATION_SYNC_LIMIT=2, MODERATION_BACKEND='sync')
+    def test_background_job(self):
+        """대상이 많으면 백그라운드 작업으로 실행하고 상태 조회"""
+        response = self.client.post(
+            self.url, {'target': 'posts', 'author': 'spammer'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self.client.get(reverse(
+            'moderation-job', kwargs={'job_id': response.data['job']['id']}
+        ))
+        self.assertEqual(response.data['status'], 'done')
+        self.assertEqual(response.data['result']['posts'], 3)
+        self.assertEqual(Post.objects.count(), 1)
+
+    def test_interrupted_job_is_failed(self):
+        """진행이 멈춘 작업(프로세스 재시작 등)은 failed로 조회"""
+        ModerationJob.objects.create(id='stalled', target='posts')
+        ModerationJob.objects.filter(id='stalled').update(
+            status='running', updated_at=timezone.now() - timedelta(hours=1)
+        )
+        response = self.client.get(
+            reverse('moderation-job', kwargs={'job_id': 'stalled'})
+        )
+        self.assertEqual(response.data['status'], 'failed')
+        self.assertEqual(
+            ModerationJob.objects.get(id='stalled').status, 'failed'
+        )
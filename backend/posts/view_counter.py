@@ -0,0 +1,190 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+
+from core.db_router import background_writes
+from posts.models import Post
+from posts.ranking import refresh_rankings
+from posts.response_cache import post_scope, response_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """조회수 증가분을 메모리에 모았다가 한 번에 반영하는 집계기
+
+    요청마다 UPDATE를 실행하는 대신 게시글별 증가분을 프로세스 메모리에 모으고,
+    UPDATE 한 번으로 일괄 반영합니다.
+    - flush 주기(VIEW_COUNT_FLUSH_INTERVAL): start()로 띄운 백그라운드 스레드가
+      반영하므로 이후 조회가 없어도 반영되고 요청 처리를 지연시키지 않습니다.
+      (스레드가 없는 프로세스에서는 주기가 지난 뒤 다음 조회에서 반영)
+    - 누적 증가분이 VIEW_COUNT_FLUSH_THRESHOLD에 도달하면 그 조회에서 바로 반영
+    VIEW_COUNT_DEDUP_WINDOW(초)가 설정되면 같은 사용자/IP의 반복 조회는
+    해당 시간 동안 한 번만 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._total = 0
+        self._seen = {}
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._stopped = threading.Event()
+
+    @property
+    def flush_interval(self) -> int:
+        return getattr(settings, 'VIEW_COUNT_FLUSH_INTERVAL', 10)
+
+    @property
+    def flush_threshold(self) -> int:
+        return getattr(settings, 'VIEW_COUNT_FLUSH_THRESHOLD', 100)
+
+    @property
+    def dedup_window(self) -> int:
+        return getattr(settings, 'VIEW_COUNT_DEDUP_WINDOW', 0)
+
+    def record(self, post_id: int, viewer: Optional[str] = None) -> int:
+        """조회 1회를 집계합니다.
+
+        Args:
+            post_id: 조회한 게시글 ID
+            viewer: 중복 조회 판단에 사용할 사용자/IP 키 (없으면 항상 집계)
+
+        Returns:
+            int: 이 게시글의 미반영 증가분 (이번 조회 포함, 중복 조회면 제외)
+                이번 호출에서 flush가 일어나도 flush 전 값을 반환하므로,
+                호출 전에 읽은 조회수에 더하면 현재 조회수가 됩니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if viewer and self.dedup_window > 0:
+                key = (post_id, viewer)
+                expires_at = self._seen.get(key)
+                if expires_at and expires_at > now:
+                    return self._pending.get(post_id, 0)
+                self._seen[key] = now + self.dedup_window
+
+            self._pending[post_id] += 1
+            self._total += 1
+            pending = self._pending[post_id]
+            should_flush = self._total >= self.flush_threshold or (
+                self._timer is None
+                and now - self._last_flush >= self.flush_interval
+            )
+
+        if should_flush:
+            self.flush()
+        return pending
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수 증가분"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def flush(self) -> int:
+        """모아둔 증가분을 UPDATE 한 번으로 반영합니다.
+
+        Returns:
+            int: 반영한 조회수 합계
+        """
+        now = time.monotonic()
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._total = 0
+            self._last_flush = now
+            self._seen = {
+                key: expires_at
+                for key, expires_at in self._seen.items()
+                if expires_at > now
+            }
+
+        if not pending:
+            return 0
+
+        increments = Case(
+            *[When(id=post_id, then=Value(count))
+              for post_id, count in pending.items()],
+            default=Value(0),
+            output_field=PositiveIntegerField()
+        )
+        # 조회 요청이 대신 실행하는 쓰기이므로 조회한 클라이언트를 primary에 고정하지 않음
+        with background_writes():
+            try:
+                Post.objects.filter(id__in=pending).update(
+                    views=F('views') + increments
+                )
+            except DatabaseError:
+                # 반영하지 못한 증가분은 다음 flush에서 다시 시도
+                with self._lock:
+                    self._pending.update(pending)
+                    self._total += sum(pending.values())
+                logger.exception('조회수 반영에 실패했습니다.')
+                return 0
+
+            refresh_rankings(pending.keys())
+        # 캐시된 상세 응답의 views는 flush 전 값이므로 함께 무효화
+        # (그대로 두면 pending이 0이 되어 조회수가 줄어든 것처럼 보임)
+        response_cache.invalidate(*(post_scope(post_id) for post_id in pending))
+        return sum(pending.values())
+
+    def start(self) -> None:
+        """flush 주기마다 증가분을 반영하는 백그라운드 스레드를 시작합니다.
+
+        웹 서버 프로세스에서 한 번 호출합니다. (config.asgi, config.wsgi)
+        """
+        if self.flush_interval <= 0:
+            return
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._stopped.clear()
+            self._timer = threading.Thread(
+                target=self._run_timer, name='view-count-flush', daemon=True
+            )
+        self._timer.start()
+
+    def stop(self) -> None:
+        """백그라운드 스레드를 멈춥니다. (남은 증가분은 반영하지 않음)"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            self._stopped.set()
+            timer.join()
+
+    def _run_timer(self) -> None:
+        while not self._stopped.is_set():
+            with self._lock:
+                remaining = (
+                    self._last_flush + self.flush_interval - time.monotonic()
+                )
+            if remaining > 0:
+                self._stopped.wait(remaining)
+                continue
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('조회수 반영에 실패했습니다.')
+            finally:
+                # 요청 밖의 스레드이므로 연결을 직접 정리 (풀 사용 시 반납)
+                close_old_connections()
+
+    def clear(self) -> None:
+        """반영하지 않은 증가분과 중복 조회 기록을 모두 버립니다."""
+        with self._lock:
+            self._pending.clear()
+            self._total = 0
+            self._seen.clear()
+            self._last_flush = time.monotonic()
+
+
+view_counter = ViewCountBuffer()
+atexit.register(view_counter.flush)
@@ -0,0 +1,37 @@
+from typing import Callable, Dict, Iterable, Set
+
+from posts.models import Like
+
+
+def liked_post_ids(user, post_ids: Iterable[int]) -> Set[int]:
+    """post_ids 중 사용자가 좋아요한 게시글 ID"""
+    return set(
+        Like.objects.filter(user=user, post_id__in=post_ids)
+        .values_list('post_id', flat=True)
+    )
+
+
+# 사용자별 상태 로더 {이름: (user, post_ids) -> 해당하는 게시글 ID 집합}
+# 북마크 등 새 상태는 여기에 로더를 추가하고 ViewerStateField로 표시
+VIEWER_STATE_LOADERS: Dict[str, Callable[..., Set[int]]] = {
+    'liked': liked_post_ids,
+}
+
+
+def load_viewer_state(
+    user,
+    post_ids: Iterable[int],
+    names: Iterable[str]
+) -> Dict[str, Set[int]]:
+    """페이지에 포함된 게시글에 대한 사용자 상태를 상태별 쿼리 한 번으로 조회합니다.
+
+    Returns:
+        dict: {상태 이름: 해당하는 게시글 ID 집합}
+    """
+    post_ids = list(post_ids)
+    if not user.is_authenticated or not post_ids:
+        return {name: set() for name in names}
+    return {
+        name: VIEWER_STATE_LOADERS[name](user, post_ids)
+        for name in names
+    }
@@ -1,3 +1,6 @@
+import time
+
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ValidationError
 from rest_framework import status
 from rest_framework.views import APIView
@@ -5,24 +8,135 @@ from rest_framework.response import Response
 from rest_framework.permissions import (
     IsAuthenticated, 
     IsAuthenticatedOrReadOnly,
+    IsAdminUser,
     AllowAny
 )
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 
-from posts.models import Comment, Post
+from core.async_views import AsyncAPIView
+from core.parsers import NDJSONParser
+from core.streaming import streaming_content
+from core.serialization import compile_serializer
+from posts.bulk_import import BulkImporter
+from posts.export import EXPORT_TABLES, TableExport
+from posts.moderation import moderation_jobs, moderation_queryset, run_moderation
+from posts.models import Comment
 from posts.serializers import (
     PostSerializer, 
+    PostFeedSerializer,
     PostCreateUpdateSerializer,
-    CommentSerializer
+    PostSearchSerializer,
+    CommentSerializer,
+    ModerationSerializer
 )
 from posts.services import PostService
 from posts.permissions import BoardTypePermission
+from posts.response_cache import (
+    LIST_SCOPE,
+    RANKING_SCOPE,
+    cache_response,
+    conditional_response,
+    not_modified,
+    post_scope,
+    response_cache,
+    set_validators
+)
+
+
+def viewer_key(request):
+    """조회수 중복 판단에 사용할 사용자/IP 키"""
+    if request.user.is_authenticated:
+        return f'user:{request.user.id}'
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+def selected_fields(request, serializer_class):
+    """?fields= 파라미터로 선택한 필드 (fields를 지원하지 않는 serializer면 None)
+
+    Raises:
+        ValidationError: 존재하지 않는 필드를 요청한 경우
+    """
+    if not hasattr(serializer_class, 'parse_fields'):
+        return None
+    return serializer_class.parse_fields(request.query_params.get('fields'))
+
+
+def serialize(serializer_class, items, fields=None, context=None):
+    """목록을 직렬화합니다. (fields가 있으면 해당 필드만)
+
+    읽기 전용 목록이므로 DRF 필드 처리를 건너뛰는 컴파일된 직렬화기를 사용합니다.
+    (결과는 serializer_class(items, many=True).data와 같음)
+    """
+    return compile_serializer(serializer_class, fields).serialize(items, context)
+
+
+class CursorPaginationMixin:
+    """키셋(커서) 페이지네이션 응답을 만드는 Mixin (async View용)
+
+    Query Parameters:
+        cursor: str - 이전 응답의 next_cursor (첫 페이지는 생략)
+        size: int - 페이지 크기 (default: 10, max: 100)
+        fields: str - 포함할 필드 (쉼표 구분, PostFeedSerializer 등 지원 시)
+
+    Returns:
+        {"results": [...], "next_cursor": str | null}
+    """
+
+    async def paginated_response(
+        self,
+        request,
+        queryset,
+        serializer_class,
+        cursor_fields=None,
+        descending=True,
+        context=None
+    ):
+        try:
+            size = int(request.query_params.get('size', self.service.page_size))
+        except ValueError:
+            return Response(
+                {"error": {"size": "페이지 크기는 정수여야 합니다."}},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            fields = selected_fields(request, serializer_class)
+            queryset = self.service.shape_queryset(
+                queryset, serializer_class, fields
+            )
+            page = await self.service.apaginate(
+                queryset,
+                cursor=request.query_params.get('cursor'),
+                size=size,
+                cursor_fields=cursor_fields,
+                descending=descending
+            )
+        except ValidationError as e:
+            return Response(
+                {"error": e.message_dict},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        context = dict(context or {})
+        if getattr(serializer_class.Meta, 'viewer_state', None):
+            context['viewer_state'] = await sync_to_async(
+                self.service.load_viewer_state
+            )(request.user, page.items, serializer_class, fields)
+
+        return Response({
+            'results': serialize(
+                serializer_class, page.items, fields, context=context
+            ),
+            'next_cursor': page.next_cursor,
+        })
 
 
 @method_decorator(csrf_exempt, name='dispatch')
-class PostListCreateView(APIView):
+class PostListCreateView(CursorPaginationMixin, AsyncAPIView):
     """게시글 목록 조회 및 생성 API View
     
     게시글 목록을 조회하거나 새 게시글을 생성하는 엔드포인트를 제공합니다.
@@ -33,15 +147,21 @@ class PostListCreateView(APIView):
         POST /api/v1/posts/ - 새 게시글 생성
     
     Query Parameters (GET):
-        page: int - 페이지 번호 (default: 1)
+        search: str - 검색어
+        board_type: str - 게시판 유형
+        category: str - 카테고리
+        cursor: str - 다음 페이지 커서 (이전 응답의 next_cursor)
         size: int - 페이지 크기 (default: 10)
+        fields: str - 포함할 필드 (쉼표 구분, 검색이 아닐 때)
         
     Request Body (POST):
         title: str - 게시글 제목
         content: str - 게시글 내용
         
     Returns:
-        GET - 200 OK: 게시글 목록
+        GET - 200 OK: 게시글 목록 ({"results": [...], "next_cursor": ...})
+            본문 대신 요약(excerpt)과 썸네일을 포함하는 피드 형식
+            search가 있으면 관련도 순으로 정렬하고 highlight 스니펫을 포함
         POST - 201 Created: 생성된 게시글
         401 Unauthorized: 인증되지 않은 사용자 (POST 시)
         400 Bad Request: 유효하지 않은 데이터
@@ -50,7 +170,8 @@ class PostListCreateView(APIView):
     parser_classes = (MultiPartParser, FormParser, JSONParser)
     service = PostService()
     
-    def get(self, request):
+    @conditional_response()
+    async def get(self, request):
         """게시글 목록 조회"""
         query = request.query_params.get('search')
         board_type = request.query_params.get('board_type')
@@ -61,8 +182,17 @@ class PostListCreateView(APIView):
             board_type=board_type,
             category=category
         )
-        serializer = PostSerializer(posts, many=True)
-        return Response(serializer.data)
+        if query:
+            return await self.paginated_response(
+                request,
+                posts,
+                PostSearchSerializer,
+                cursor_fields=self.service.search_cursor_fields,
+                context={'search': query}
+            )
+        return await self.paginated_response(
+            request, posts, PostFeedSerializer
+        )
     
     def post(self, request):
         """새 게시글 생성"""
@@ -104,7 +234,7 @@ class PostListCreateView(APIView):
             )
 
 
-class PostDetailView(APIView):
+class PostDetailView(AsyncAPIView):
     """게시글 상세 조회, 수정, 삭제 API View
     
     특정 게시글의 상세 정보를 조회하고, 수정하거나 삭제하는 엔드포인트를 제공합니다.
@@ -132,20 +262,67 @@ class PostDetailView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]  # GET은 모두 허용, 나머지는 인증 필요
     service = PostService()
     
-    def get(self, request, pk):
-        """게시글 상세 조회"""
-        post = self.service.get(id=pk)
-        if not post:
-            return Response(status=status.HTTP_404_NOT_FOUND)
+    async def get(self, request, pk):
+        """게시글 상세 조회
+
+        비로그인 사용자의 응답은 캐시하며, 캐시된 응답이어도 조회수는 집계합니다.
+        If-None-Match/If-Modified-Since가 일치하면 직렬화 없이 304를 반환합니다.
+        (304 응답도 조회 1회로 집계)
+        """
+        # 변경 시각이 캐시에 없으면 updated_at을 조회
+        validators = await response_cache.avalidators(
+            request,
+            [post_scope(pk)],
+            seed=lambda: self._updated_at(pk)
+        )
+        response = not_modified(request, validators)
+        if response is not None:
+            await sync_to_async(self.service.record_view)(
+                pk, 0, viewer_key(request)
+            )
+            return response
+
+        cache_key = None
+        data = None
+        if not request.user.is_authenticated:
+            cache_key = await response_cache.akey(
+                'post-detail', request, [post_scope(pk)]
+            )
+            data = await response_cache.aget(cache_key)
+
+        if data is None:
+            post = await self.service.shape_queryset(
+                self.service.filter(id=pk), PostSerializer
+            ).afirst()
+            if not post:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+
+            viewer_state = await sync_to_async(self.service.load_viewer_state)(
+                request.user, [post], PostSerializer
+            )
+            data = PostSerializer(
+                post, context={'viewer_state': viewer_state}
+            ).data
+            if cache_key and await response_cache.asettled([post_scope(pk)]):
+                await response_cache.aset(cache_key, data)
             
-        # 조회수 증가
-        post.increase_views()
-        
-        return Response(PostSerializer(post).data)
+        # 조회수 집계 (일괄 반영, 응답에는 대략적인 현재 조회수 표시)
+        data = dict(data)
+        data['views'] = await sync_to_async(self.service.record_view)(
+            pk, data['views'], viewer_key(request)
+        )
+        return set_validators(Response(data), validators)
+
+    def _updated_at(self, pk) -> float:
+        """Last-Modified 초기값으로 사용할 게시글 updated_at"""
+        updated_at = self.service.filter(id=pk).values_list(
+            'updated_at', flat=True
+        ).first()
+        return updated_at.timestamp() if updated_at else time.time()
     
     def put(self, request, pk):
         """게시글 수정 (작성자만 가능)"""
-        post = self.service.get(id=pk)
+        post = self.service.get_primary_queryset().filter(id=pk).first()
         if not post:
             return Response(status=status.HTTP_404_NOT_FOUND)
         if post.author != request.user:
@@ -158,7 +335,7 @@ class PostDetailView(APIView):
     
     def delete(self, request, pk):
         """게시글 삭제 (작성자만 가능)"""
-        post = self.service.get(id=pk)
+        post = self.service.get_primary_queryset().filter(id=pk).first()
         if not post:
             return Response(status=status.HTTP_404_NOT_FOUND)
         if post.author != request.user:
@@ -168,15 +345,41 @@ class PostDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class PopularPostsView(APIView):
+class PopularPostsView(AsyncAPIView):
     """인기 게시글 API View"""
     permission_classes = [AllowAny]
     service = PostService()
 
-    def get(self, request):
-        posts = self.service.get_popular_posts()
-        serializer = PostSerializer(posts, many=True)
-        return Response(serializer.data)
+    @conditional_response(
+        scopes=lambda request, **kwargs: [LIST_SCOPE, RANKING_SCOPE]
+    )
+    @cache_response(
+        'popular-posts',
+        scopes=lambda request, **kwargs: [LIST_SCOPE, RANKING_SCOPE]
+    )
+    async def get(self, request):
+        try:
+            fields = selected_fields(request, PostFeedSerializer)
+        except ValidationError as e:
+            return Response(
+                {"error": e.message_dict},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        posts = [
+            post async for post in self.service.shape_queryset(
+                self.service.get_popular_posts(), PostFeedSerializer, fields
+            )
+        ]
+        viewer_state = await sync_to_async(self.service.load_viewer_state)(
+            request.user, posts, PostFeedSerializer, fields
+        )
+        return Response(serialize(
+            PostFeedSerializer,
+            posts,
+            fields,
+            context={'viewer_state': viewer_state}
+        ))
 
 
 class PostLikeView(APIView):
@@ -185,7 +388,8 @@ class PostLikeView(APIView):
     POST /api/v1/posts/<int:pk>/like/ - 좋아요 토글
     
     Returns:
-        200 OK: {"liked": true/false} - true면 좋아요 생성, false면 취소
+        200 OK: {"liked": true/false, "like_count": int}
+            liked가 true면 좋아요 상태, false면 취소된 상태
         404 Not Found: 게시글이 존재하지 않음
         400 Bad Request: 자신의 게시글에 좋아요 시도 등
     """
@@ -193,13 +397,15 @@ class PostLikeView(APIView):
     service = PostService()
     
     def post(self, request, pk):
-        post = self.service.get(id=pk)
+        post = self.service.get_primary_queryset().filter(
+            id=pk
+        ).only('id', 'author_id').first()
         if not post:
             return Response(status=status.HTTP_404_NOT_FOUND)
             
         try:
-            liked = self.service.toggle_like(post, request.user)
-            return Response({"liked": liked})
+            liked, like_count = self.service.toggle_like(post, request.user)
+            return Response({"liked": liked, "like_count": like_count})
         except ValidationError as e:
             return Response(
                 {"error": str(e)},
@@ -207,18 +413,170 @@ class PostLikeView(APIView):
             )
 
 
-class CommentListCreateView(APIView):
+class PostImportView(APIView):
+    """게시글/댓글 일괄 가져오기 API View (관리자 전용)
+
+    POST /api/v1/posts/import/
+
+    Request Body:
+        application/x-ndjson 본문, 또는 multipart의 file 필드에 NDJSON 파일
+        (줄 형식은 posts.bulk_import 참고, author가 없는 줄은 요청한 관리자)
+
+    Returns:
+        200 OK: {"posts": int, "comments": int, "failed": int,
+                 "errors": [{"line": int, "error": ...}]}
+            잘못된 줄은 건너뛰고 errors에 보고
+        400 Bad Request: 가져올 본문이 없음
+        403 Forbidden: 관리자가 아닌 사용자
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = (NDJSONParser, MultiPartParser)
+
+    def post(self, request):
+        if request.content_type.startswith('multipart/'):
+            lines = request.FILES.get('file')
+        else:
+            lines = request.data
+        if lines is None:
+            return Response(
+                {"error": "가져올 NDJSON 본문 또는 file을 보내주세요."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = BulkImporter(default_author=request.user).run(lines)
+        return Response(result.as_dict())
+
+
+class ExportView(APIView):
+    """테이블 스트리밍 내보내기 API View (관리자 전용)
+
+    GET /api/v1/export/<table>/ - posts, comments, likes
+
+    Query Parameters:
+        output: str - ndjson 또는 csv (default: ndjson)
+        gzip: 1이면 gzip으로 압축
+        after: int - 이 id 다음 행부터 (중단된 내보내기를 이어서 받을 때)
+
+    Returns:
+        200 OK: id 순서로 정렬된 행 스트림 (첨부 파일)
+        400 Bad Request: 지원하지 않는 형식 또는 잘못된 after
+        403 Forbidden: 관리자가 아닌 사용자
+        404 Not Found: 알 수 없는 테이블
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, table):
+        if table not in EXPORT_TABLES:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        after = request.query_params.get('after')
+        if after and not after.isdigit():
+            return Response(
+                {"error": "after는 id(정수)여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            export = TableExport(
+                table,
+                fmt=request.query_params.get('output', 'ndjson'),
+                after=int(after) if after else None,
+                compress=request.query_params.get('gzip') == '1'
+            )
+        except ValueError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        response = StreamingHttpResponse(
+            streaming_content(request, iter(export)),
+            content_type=export.content_type
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{export.filename}"'
+        )
+        return response
+
+
+class ModerationView(APIView):
+    """게시글/댓글 일괄 삭제 API View (관리자 전용)
+
+    POST /api/v1/moderation/
+
+    Request Body:
+        target: str - posts 또는 comments
+        ids: list[int] (optional) - 삭제할 ID 목록
+        author: str (optional) - 작성자 이름
+        since, until: datetime (optional) - 작성 시각 범위 [since, until)
+        board_type: str (optional) - 게시판 (posts만)
+        dry_run: bool (optional) - 삭제하지 않고 대상 수만 확인
+        ids/author/since/until 중 하나 이상 필요, 조건은 모두 AND
+
+    Returns:
+        200 OK: 삭제한 수 {"matched": int, "deleted": {"posts", "comments", ...}}
+            (dry_run이면 {"matched": int})
+        202 Accepted: 대상이 MODERATION_SYNC_LIMIT개를 넘어 백그라운드로 실행
+            {"matched": int, "job": {"id", "status", ...}}
+            진행 상태는 GET /api/v1/moderation/jobs/<id>/
+        400 Bad Request: 유효하지 않은 조건
+        403 Forbidden: 관리자가 아닌 사용자
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = ModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        criteria = dict(serializer.validated_data)
+        dry_run = criteria.pop('dry_run')
+
+        matched = moderation_queryset(**criteria).count()
+        if dry_run or not matched:
+            return Response({"matched": matched})
+
+        if matched > settings.MODERATION_SYNC_LIMIT:
+            job_id = moderation_jobs.start(**criteria)
+            return Response(
+                {"matched": matched, "job": moderation_jobs.get(job_id)},
+                status=status.HTTP_202_ACCEPTED
+            )
+        deleted = run_moderation(**criteria)
+        return Response({"matched": matched, "deleted": deleted})
+
+
+class ModerationJobView(APIView):
+    """일괄 삭제 작업 상태 조회 API View (관리자 전용)
+
+    GET /api/v1/moderation/jobs/<job_id>/
+
+    Returns:
+        200 OK: {"id", "status": pending|running|done|failed, "target",
+                 "result": 삭제한 수 (running이면 지금까지 삭제한 수)}
+        404 Not Found: 없거나 보관 기간(1일)이 지난 작업
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, job_id):
+        job = moderation_jobs.get(job_id)
+        if job is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        return Response(job)
+
+
+class CommentListCreateView(CursorPaginationMixin, AsyncAPIView):
     """댓글 목록 조회 및 생성 API View
     
     GET /api/v1/posts/<int:post_id>/comments/ - 댓글 목록 조회
     POST /api/v1/posts/<int:post_id>/comments/ - 새 댓글 작성
     
+    Query Parameters (GET):
+        cursor: str - 다음 페이지 커서 (최상위 댓글 기준)
+        size: int - 페이지 크기 (default: 10)
+    
     Request Body (POST):
         content: str - 댓글 내용
         parent_id: int (optional) - 부모 댓글 ID (대댓글인 경우)
         
     Returns:
-        GET - 200 OK: 댓글 목록
+        GET - 200 OK: 댓글 목록 ({"results": [...], "next_cursor": ...})
         POST - 201 Created: 생성된 댓글
         404 Not Found: 게시글이 존재하지 않음
         400 Bad Request: 유효하지 않은 데이터
@@ -226,22 +584,26 @@ class CommentListCreateView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
     service = PostService()
     
-    def get(self, request, post_id):
-        post = self.service.get(id=post_id)
+    @conditional_response(
+        scopes=lambda request, post_id: [post_scope(post_id)]
+    )
+    async def get(self, request, post_id):
+        post = await self.service.filter(id=post_id).only('id').afirst()
         if not post:
             return Response(status=status.HTTP_404_NOT_FOUND)
             
-        # 최상위 댓글만 조회 (대댓글은 각 댓글 내에 포함)
-        comments = post.comments.filter(parent=None)
-        serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data)
+        # 최상위 댓글만 페이지 단위로 조회 (대댓글은 각 댓글 내에 포함)
+        comments = self.service.get_comment_tree(post)
+        return await self.paginated_response(
+            request, comments, CommentSerializer, descending=False
+        )
     
     def post(self, request, post_id):
         """새 댓글 작성"""
         print(f"Creating comment for post {post_id}")  # 디버그 로그
         print(f"Request data: {request.data}")  # 요청 데이터 확인
         
-        post = self.service.get(id=post_id)
+        post = self.service.get_primary_queryset().filter(id=post_id).first()
         if not post:
             print(f"Post {post_id} not found")  # 디버그 로그
             return Response(
@@ -325,14 +687,18 @@ class CommentDetailView(APIView):
             )
 
 
-class TechPostListView(APIView):
+class TechPostListView(CursorPaginationMixin, AsyncAPIView):
     """기술 블로그 목록"""
     permission_classes = [AllowAny]
+    service = PostService()
 
-    def get(self, request):
-        posts = Post.objects.filter(category='tech').order_by('-created_at')
-        serializer = PostSerializer(posts, many=True)
-        return Response(serializer.data)
+    @conditional_response()
+    @cache_response('tech-posts')
+    async def get(self, request):
+        posts = self.service.filter(category='tech')
+        return await self.paginated_response(
+            request, posts, PostFeedSerializer
+        )
 
     def post(self, request):
         if not request.user.is_authenticated:
@@ -341,28 +707,50 @@ class TechPostListView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
             
-        serializer = PostSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save(author=request.user, category='tech')
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer = PostCreateUpdateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        # 렌더링/요약/랭킹/캐시 무효화는 다른 작성 API와 같이 서비스에서 처리
+        try:
+            post = self.service.create_post(
+                author=request.user,
+                **{**serializer.validated_data, 'category': 'tech'}
+            )
+        except ValidationError as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(
+            PostSerializer(post).data,
+            status=status.HTTP_201_CREATED
+        )
 
 
-class FreeBoardView(APIView):
+class FreeBoardView(CursorPaginationMixin, AsyncAPIView):
     """자유게시판"""
     permission_classes = [IsAuthenticatedOrReadOnly]
     service = PostService()
 
-    def get(self, request):
+    @conditional_response()
+    @cache_response('free-board')
+    async def get(self, request):
         posts = self.service.get_free_posts()
-        return Response(PostSerializer(posts, many=True).data)
+        return await self.paginated_response(
+            request, posts, PostFeedSerializer
+        )
 
 
-class GuestBookView(APIView):
+class GuestBookView(CursorPaginationMixin, AsyncAPIView):
     """방명록"""
     permission_classes = [IsAuthenticatedOrReadOnly]
     service = PostService()
 
-    def get(self, request):
+    @conditional_response()
+    @cache_response('guest-book')
+    async def get(self, request):
         posts = self.service.get_guest_posts()
-        return Response(PostSerializer(posts, many=True).data)
+        return await self.paginated_response(
+            request, posts, PostFeedSerializer
+        )
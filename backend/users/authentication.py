@@ -0,0 +1,125 @@
+import copy
+import threading
+import time
+
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserCache:
+    """JWT 인증에 사용할 사용자 레코드를 프로세스 메모리에 잠시 보관하는 캐시
+
+    토큰의 user_id로 사용자를 찾을 때 AUTH_USER_CACHE_TIMEOUT(초) 동안은
+    DB를 조회하지 않습니다. 사용자 정보가 바뀌면 invalidate로 즉시 제거하며,
+    다른 프로세스의 캐시는 유지 시간이 지나면 다시 조회합니다.
+    AUTH_USER_CACHE_TIMEOUT이 0이면 캐시를 사용하지 않습니다.
+    토큰의 user_id claim은 문자열이므로 키는 str(user_id)를 사용합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._users = {}
+
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 30)
+
+    @property
+    def max_size(self) -> int:
+        return getattr(settings, 'AUTH_USER_CACHE_SIZE', 10000)
+
+    def get(self, user_id):
+        """캐시된 사용자의 복사본 (없거나 만료되었으면 None)
+
+        요청마다 request.user를 수정할 수 있으므로 캐시된 인스턴스를
+        그대로 공유하지 않고 복사해서 반환합니다.
+        """
+        key = str(user_id)
+        with self._lock:
+            entry = self._users.get(key)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._users[key]
+                return None
+        return copy.copy(user)
+
+    def set(self, user_id, user) -> None:
+        timeout = self.timeout
+        if timeout <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._users) >= self.max_size:
+                self._evict(now)
+            self._users[str(user_id)] = (now + timeout, copy.copy(user))
+
+    def invalidate(self, user_id) -> None:
+        """사용자 정보가 바뀌었을 때 캐시에서 제거"""
+        with self._lock:
+            self._users.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+    def _evict(self, now: float) -> None:
+        """만료된 항목을 지우고, 그래도 가득 차 있으면 오래된 절반을 제거"""
+        self._users = {
+            user_id: entry for user_id, entry in self._users.items()
+            if entry[0] > now
+        }
+        overflow = len(self._users) - self.max_size // 2
+        if overflow > 0:
+            for user_id in list(self._users)[:overflow]:
+                del self._users[user_id]
+
+
+user_cache = UserCache()
+
+
+def invalidate_user(user_id) -> None:
+    """사용자 프로필/비밀번호가 바뀐 뒤 인증 캐시에서 제거합니다."""
+    user_cache.invalidate(user_id)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """토큰의 user_id로 캐시된 사용자를 찾는 JWTAuthentication
+
+    기본 JWTAuthentication은 요청마다 users 테이블을 조회하지만, 토큰
+    검증(서명, 만료)은 그대로 하고 사용자 레코드만 UserCache에서 가져옵니다.
+    캐시에 없으면 기본 동작대로 DB에서 조회(활성 여부, 비밀번호 변경 확인)한 뒤
+    캐시에 저장합니다.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                'Token contained no recognizable user identification'
+            )
+
+        user = user_cache.get(user_id)
+        if user is not None and self._is_current(user, validated_token):
+            return user
+
+        user = super().get_user(validated_token)
+        user_cache.set(user_id, user)
+        return user
+
+    def _is_current(self, user, validated_token) -> bool:
+        """캐시된 사용자로 토큰을 인정할 수 있는지
+
+        비밀번호 해시가 토큰과 다르면 캐시가 오래되었을 수 있으므로
+        DB에서 다시 확인합니다.
+        """
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) == get_md5_hash_password(user.password)
+        return True
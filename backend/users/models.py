@@ -20,3 +20,18 @@ class User(AbstractUser):
     class Meta:
         db_table = "users"
         ordering = ["-created_at"]
+
+
+class RevokedToken(models.Model):
+    """폐기된 refresh token (회전 후 재사용 방지)
+
+    발급된 모든 토큰이 아니라 폐기된 토큰의 jti만 저장하며,
+    만료 시각이 지나면 RevocationStore가 삭제합니다.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = "revoked_tokens"
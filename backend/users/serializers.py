@@ -1,5 +1,8 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
 from users.models import User
+from users.tokens import RefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -10,6 +13,14 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at')
 
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """목록에 표시할 작성자 요약 정보 직렬화"""
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'profile_image')
+        read_only_fields = fields
+
+
 class UserRegisterSerializer(serializers.ModelSerializer):
     """회원가입을 위한 Serializer"""
     password = serializers.CharField(write_only=True)
@@ -35,4 +46,8 @@ class UserRegisterSerializer(serializers.ModelSerializer):
 class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(write_only=True)
     new_password = serializers.CharField(write_only=True)
-    
\ No newline at end of file
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """토큰 갱신 시 이전 refresh token을 RevocationStore에 폐기"""
+    token_class = RefreshToken
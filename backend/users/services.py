@@ -1,4 +1,5 @@
 from django.core.exceptions import ValidationError
+from users.authentication import invalidate_user
 from users.models import User
 
 class UserService:
@@ -10,5 +11,6 @@ class UserService:
         
         user.set_password(new_password)
         user.save()
+        invalidate_user(user.pk)
         return user
   
\ No newline at end of file
@@ -1,3 +1,150 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.bloom import BloomFilter
+from users.authentication import user_cache
+from users.models import RevokedToken, User
+from users.services import UserService
+from users.token_blacklist import revocation_store
+from users.tokens import RefreshToken
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='authuser',
+            email='auth@example.com',
+            password='testpass123'
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('user-profile')
+
+    def test_cached_user(self):
+        """두 번째 요청부터는 사용자 조회 쿼리 없이 인증"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['username'], 'authuser')
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['username'], 'authuser')
+
+    def test_profile_update_invalidates(self):
+        """프로필 수정 후에는 바뀐 사용자 정보로 인증"""
+        self.client.get(self.url)
+        response = self.client.put(self.url, {'username': 'renamed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['username'], 'renamed')
+
+    def test_change_password_invalidates(self):
+        """비밀번호 변경 시 캐시에서 제거"""
+        self.client.get(self.url)
+        self.assertIsNotNone(user_cache.get(self.user.pk))
+
+        UserService.change_password(self.user, 'testpass123', 'newpass456')
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_invalid_token(self):
+        """토큰 검증은 그대로 수행"""
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_inactive_user(self):
+        """캐시에 없는 비활성 사용자는 인증 실패"""
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_membership(self):
+        """추가한 값은 항상 포함, 추가하지 않은 값은 대부분 미포함"""
+        bloom = BloomFilter(capacity=1000)
+        values = [f'jti-{i}' for i in range(1000)]
+        for value in values:
+            bloom.add(value)
+
+        self.assertTrue(all(value in bloom for value in values))
+        false_positives = sum(f'other-{i}' in bloom for i in range(1000))
+        self.assertLess(false_positives, 50)
+
+
+class TokenRevocationTests(TestCase):
+    def setUp(self):
+        """테스트 데이터 설정"""
+        revocation_store.clear()
+        self.addCleanup(revocation_store.clear)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='refreshuser',
+            email='refresh@example.com',
+            password='testpass123'
+        )
+        self.url = reverse('token_refresh')
+
+    def test_rotation_revokes_refresh_token(self):
+        """회전한 refresh token은 다시 사용할 수 없음"""
+        refresh = str(RefreshToken.for_user(self.user))
+
+        response = self.client.post(self.url, {'refresh': refresh})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        rotated = response.data['refresh']
+        self.assertNotEqual(rotated, refresh)
+
+        response = self.client.post(self.url, {'refresh': refresh})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.post(self.url, {'refresh': rotated})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_check_in_memory(self):
+        """폐기되지 않은 토큰은 DB 조회 없이 확인"""
+        expires_at = timezone.now() + timedelta(days=1)
+        revocation_store.revoke('revoked', expires_at)
+        revocation_store.sync(force=True)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_store.is_revoked('valid', expires_at))
+        self.assertTrue(revocation_store.is_revoked('revoked', expires_at))
+
+    def test_revoke_once(self):
+        """같은 jti는 한 번만 폐기 (동시 갱신 방지)"""
+        expires_at = timezone.now() + timedelta(days=1)
+        self.assertTrue(revocation_store.revoke('jti', expires_at))
+        self.assertFalse(revocation_store.revoke('jti', expires_at))
+
+    def test_sync_from_other_process(self):
+        """다른 프로세스가 폐기한 jti를 동기화로 반영"""
+        expires_at = timezone.now() + timedelta(days=1)
+        revocation_store.sync(force=True)
+        RevokedToken.objects.create(jti='elsewhere', expires_at=expires_at)
+        self.assertFalse(revocation_store.is_revoked('elsewhere', expires_at))
+
+        revocation_store.sync(force=True)
+        self.assertTrue(revocation_store.is_revoked('elsewhere', expires_at))
+
+    def test_purge_expired(self):
+        """만료된 폐기 기록은 동기화할 때 삭제"""
+        past = timezone.now() - timedelta(days=2)
+        revocation_store.revoke('expired', past)
+        revocation_store.revoke('active', timezone.now() + timedelta(days=1))
+
+        revocation_store.sync(force=True)
+        self.assertEqual(
+            list(RevokedToken.objects.values_list('jti', flat=True)),
+            ['active']
+        )
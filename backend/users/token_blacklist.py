@@ -0,0 +1,124 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.bloom import BloomFilter
+from users.models import RevokedToken
+
+
+class RevocationStore:
+    """폐기된 refresh token jti를 만료 시각별로 나누어 보관하는 저장소
+
+    - 원본은 RevokedToken 테이블(폐기된 토큰만, 만료되면 삭제)입니다.
+    - 프로세스마다 만료 구간(TOKEN_BLACKLIST_PARTITION_SECONDS)별 Bloom filter를
+      두고, 필터에 없으면 DB 조회 없이 유효한 토큰으로 판단합니다.
+      필터에 있을 때(폐기되었거나 오탐)만 DB에서 확인합니다.
+    - 다른 프로세스가 폐기한 jti는 TOKEN_BLACKLIST_SYNC_INTERVAL(초)마다
+      최근 폐기분만 읽어 필터에 추가합니다.
+    - 만료 구간이 지난 필터는 통째로 버리고 DB의 만료된 행도 삭제합니다.
+      (만료된 토큰은 서명 검증에서 이미 거부됨)
+    """
+    # 동기화 사이에 커밋된 행을 놓치지 않도록 이전 동기화 시각보다 앞서 읽는 여유
+    sync_overlap = timedelta(seconds=60)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._partitions = {}
+        self._synced_at = None
+        self._next_sync = 0.0
+
+    @property
+    def partition_seconds(self) -> int:
+        return getattr(settings, 'TOKEN_BLACKLIST_PARTITION_SECONDS', 86400)
+
+    @property
+    def capacity(self) -> int:
+        return getattr(settings, 'TOKEN_BLACKLIST_BLOOM_CAPACITY', 100000)
+
+    @property
+    def sync_interval(self) -> float:
+        return getattr(settings, 'TOKEN_BLACKLIST_SYNC_INTERVAL', 2)
+
+    def revoke(self, jti: str, expires_at: datetime) -> bool:
+        """jti를 폐기합니다.
+
+        Returns:
+            bool: 새로 폐기했으면 True, 이미 폐기된 jti면 False
+        """
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            return False
+        self._add(jti, expires_at)
+        return True
+
+    def is_revoked(self, jti: str, expires_at: datetime) -> bool:
+        """jti가 폐기되었는지 확인합니다. (대부분 메모리 조회로 끝남)"""
+        self.sync()
+        with self._lock:
+            bloom = self._partitions.get(self._partition(expires_at))
+            maybe_revoked = bloom is not None and jti in bloom
+        if not maybe_revoked:
+            return False
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def sync(self, force: bool = False) -> None:
+        """다른 프로세스의 폐기분을 필터에 반영하고 만료된 구간을 정리합니다.
+
+        동기화 중인 스레드가 있으면 기다리지 않고 현재 필터를 사용합니다.
+        """
+        if not force and time.monotonic() < self._next_sync:
+            return
+        if not self._sync_lock.acquire(blocking=force):
+            return
+        try:
+            now = timezone.now()
+            rows = RevokedToken.objects.filter(expires_at__gt=now)
+            if self._synced_at is not None:
+                rows = rows.filter(
+                    revoked_at__gte=self._synced_at - self.sync_overlap
+                )
+            for jti, expires_at in rows.values_list('jti', 'expires_at'):
+                self._add(jti, expires_at)
+
+            if self._drop_expired(now) or self._synced_at is None:
+                RevokedToken.objects.filter(expires_at__lte=now).delete()
+            self._synced_at = now
+            self._next_sync = time.monotonic() + self.sync_interval
+        finally:
+            self._sync_lock.release()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+        self._synced_at = None
+        self._next_sync = 0.0
+
+    def _partition(self, expires_at: datetime) -> int:
+        return int(expires_at.timestamp()) // self.partition_seconds
+
+    def _add(self, jti: str, expires_at: datetime) -> None:
+        partition = self._partition(expires_at)
+        with self._lock:
+            bloom = self._partitions.get(partition)
+            if bloom is None:
+                bloom = self._partitions[partition] = BloomFilter(self.capacity)
+            bloom.add(jti)
+
+    def _drop_expired(self, now: datetime) -> bool:
+        """끝난 만료 구간의 필터를 버립니다. (버린 구간이 있으면 True)"""
+        current = self._partition(now)
+        with self._lock:
+            expired = [key for key in self._partitions if key < current]
+            for key in expired:
+                del self._partitions[key]
+        return bool(expired)
+
+
+revocation_store = RevocationStore()
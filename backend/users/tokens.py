@@ -0,0 +1,40 @@
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from users.token_blacklist import revocation_store
+
+
+class RefreshToken(BaseRefreshToken):
+    """RevocationStore로 폐기 여부를 확인하는 refresh token
+
+    simplejwt token_blacklist 앱은 발급한 모든 토큰을 OutstandingToken에
+    저장하고 갱신할 때마다 조인 쿼리로 확인하므로, 폐기된 jti만 보관하는
+    RevocationStore를 사용합니다.
+    """
+
+    def verify(self, *args, **kwargs) -> None:
+        self.check_blacklist()
+        super().verify(*args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        if revocation_store.is_revoked(self.jti, self.expires_at):
+            raise TokenError('Token is blacklisted')
+
+    def blacklist(self) -> None:
+        """토큰을 폐기합니다.
+
+        Raises:
+            TokenError: 이미 폐기된 토큰 (동시에 같은 토큰으로 갱신한 경우)
+        """
+        if not revocation_store.revoke(self.jti, self.expires_at):
+            raise TokenError('Token is blacklisted')
+
+    @property
+    def jti(self) -> str:
+        return self.payload[api_settings.JTI_CLAIM]
+
+    @property
+    def expires_at(self):
+        return datetime_from_epoch(self.payload['exp'])
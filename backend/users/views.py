@@ -5,11 +5,12 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.core.exceptions import ValidationError
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from users.authentication import invalidate_user
 from users.serializers import UserSerializer, UserRegisterSerializer
 from users.models import User
 from users.services import UserService
+from users.tokens import RefreshToken
 
 
 class UserRegisterView(APIView):
@@ -84,14 +85,16 @@ class UserProfileView(APIView):
         """현재 로그인한 사용자의 프로필 정보를 수정
         
         partial=True 설정으로 일부 필드만 업데이트 가능
+        request.user는 인증 캐시의 사본일 수 있으므로 DB에서 다시 읽어 저장합니다.
         """
         serializer = UserSerializer(
-            request.user,
+            User.objects.get(pk=request.user.pk),
             data=request.data,
             partial=True  # 부분 업데이트 허용
         )
         if serializer.is_valid():
             user = serializer.save()
+            invalidate_user(user.pk)
             return Response(UserSerializer(user).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -103,8 +106,9 @@ class ChangePasswordView(APIView):
 
     def post(self, request):
         try:
+            # 인증 캐시의 사본 대신 현재 비밀번호로 확인
             self.service.change_password(
-                request.user,
+                User.objects.get(pk=request.user.pk),
                 old_password=request.data.get('old_password'),
                 new_password=request.data.get('new_password')
             )
@@ -5,7 +5,7 @@ import axios from '../utils/axios';
 interface Post {
   id: number;
   title: string;
-  content: string;
+  excerpt: string;
   author: {
     username: string;
   };
@@ -21,7 +21,7 @@ const Tech = () => {
     const fetchPosts = async () => {
       try {
         const response = await axios.get('/posts/tech/');
-        setPosts(response.data);
+        setPosts(response.data.results);
       } catch (err) {
         setError('포스트를 불러오는데 실패했습니다.');
         console.error('Failed to fetch posts:', err);
@@ -54,8 +54,7 @@ const Tech = () => {
                   작성일: {new Date(post.created_at).toLocaleDateString()}
                 </Typography>
                 <Typography variant="body1">
-                  {post.content.slice(0, 200)}
-                  {post.content.length > 200 ? '...' : ''}
+                  {post.excerpt}
                 </Typography>
               </CardContent>
             </Card>
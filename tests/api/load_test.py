@@ -0,0 +1,87 @@
+"""API 응답 지연 시간(p50/p95/p99) 측정
+
+DB 연결 설정별 지연 시간을 비교할 때 사용합니다. 서버를 설정별로 띄운 뒤
+같은 조건으로 실행해 결과를 비교합니다.
+
+    # 1) 요청마다 새로 연결 (settings 기본값)
+    DB_POOL=0 uvicorn config.asgi:application
+    # 2) 연결 풀 (psycopg 3 필요, Docker 이미지 기본값)
+    DB_POOL=1 uvicorn config.asgi:application
+    # 3) 지속 연결 + health check (WSGI에서만 사용)
+    DB_CONN_MAX_AGE=60 python manage.py runserver
+
+결과 비교에는 PostgreSQL 서버가 필요합니다. (SQLite는 연결 비용이 없어
+설정별 차이가 나타나지 않음)
+
+    python tests/api/load_test.py --path /posts/free/ -n 2000 -c 20
+
+응답 캐시가 켜져 있으면 DB를 거치지 않으므로 로그인 토큰(--token)을 주거나
+RESPONSE_CACHE_TIMEOUT=0으로 서버를 띄워 측정합니다.
+"""
+import argparse
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def request_once(url, token):
+    """요청 한 번의 (지연 시간 ms, 상태 코드)"""
+    request = urllib.request.Request(url)
+    if token:
+        request.add_header('Authorization', f'Bearer {token}')
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except urllib.error.URLError:
+        status = 0
+    return (time.perf_counter() - started) * 1000, status
+
+
+def percentile(values, p):
+    """정렬된 목록의 p 백분위수 (nearest-rank)"""
+    index = max(int(round(p / 100 * len(values))) - 1, 0)
+    return values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API 지연 시간 측정')
+    parser.add_argument('--url', default='http://localhost:8000/api/v1')
+    parser.add_argument('--path', default='/posts/free/')
+    parser.add_argument('-n', '--requests', type=int, default=1000)
+    parser.add_argument('-c', '--concurrency', type=int, default=10)
+    parser.add_argument('--token', help='Bearer 토큰 (응답 캐시 우회)')
+    args = parser.parse_args()
+
+    url = args.url.rstrip('/') + args.path
+    # 서버/연결 준비 시간을 제외하기 위한 예열
+    for _ in range(args.concurrency):
+        request_once(url, args.token)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(
+            lambda _: request_once(url, args.token), range(args.requests)
+        ))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, status in results if not 200 <= status < 400)
+    print(f'{url}  n={args.requests}  c={args.concurrency}')
+    print(f'throughput: {args.requests / elapsed:.1f} req/s  errors: {errors}')
+    print(
+        f'mean: {statistics.mean(latencies):.1f} ms  '
+        f'p50: {percentile(latencies, 50):.1f} ms  '
+        f'p95: {percentile(latencies, 95):.1f} ms  '
+        f'p99: {percentile(latencies, 99):.1f} ms  '
+        f'max: {latencies[-1]:.1f} ms'
+    )
+
+
+if __name__ == '__main__':
+    main()